@@ -16,12 +16,13 @@ ANAPLAN document: https://github.com/HCB06/Anaplan/blob/main/Welcome_to_Anaplan/
 import numpy as np
 from colorama import Fore, Style
 import sys
+from scipy.special import softmax
 
 ### LIBRARY IMPORTS ###
 from .ui import loading_bars, initialize_loading_bar
 from .data_operations import normalization, decode_one_hot, batcher
 from .loss_functions import binary_crossentropy, categorical_crossentropy
-from .activation_functions import apply_activation, Softmax, all_activations
+from .activation_functions import apply_activation, all_activations
 from .metrics import metrics
 from.model_operations import get_acc, get_preds, get_preds_softmax
 from .visualizations import (
@@ -61,7 +62,8 @@ def fit(
     neurons_history=False
 ):
     """
-    Creates a model to fitting data.
+    Creates a model to fitting data. Without show_training, all samples are processed at once (vectorized);
+    the result is the same LTPW as learning them one by one.
     
     fit Args:
 
@@ -100,7 +102,7 @@ def fit(
 
     if train_bar and val:
         train_progress = initialize_loading_bar(total=len(x_train), ncols=71, desc='Fitting', bar_format=bar_format_normal)
-    elif train_bar and val == False:
+    elif train_bar:
         train_progress = initialize_loading_bar(total=len(x_train), ncols=44, desc='Fitting', bar_format=bar_format_normal)
 
     if len(x_train) != len(y_train):
@@ -117,10 +119,16 @@ def fit(
     # Initialize visualization
     vis_objects = initialize_visualization_for_fit(val, show_training, neurons_history, x_train, y_train)
 
+    y_decoded = decode_one_hot(y_train)
+
+    if not show_training:
+
+        LTPW = fit_vectorized(x_train, y_decoded, LTPW, activation_potentiation, LTD, auto_normalization, train_progress if train_bar else None)
+        return normalization(LTPW)
+
     # Training process
     for index, inp in enumerate(x_train):
         inp = np.array(inp).ravel()
-        y_decoded = decode_one_hot(y_train)
         # Weight updates
         STPW = feed_forward(inp, STPW, is_training=True, Class=y_decoded[index], activation_potentiation=activation_potentiation, LTD=LTD)
         LTPW += normalization(STPW) if auto_normalization else STPW
@@ -499,6 +507,69 @@ def learner(x_train, y_train, x_test=None, y_test=None, strategy='accuracy', bat
     return best_weights, best_model[get_preds()], best_acc, final_activations
 
 
+def fit_vectorized(x_train, y_decoded, LTPW, activation_potentiation=['linear'], LTD=0, auto_normalization=True, train_progress=None, batch_size=1024):
+    """
+    Vectorized form of the fit training loop. For every sample, STPW is a ones matrix whose row of the sample's class
+    holds the activated (and LTD depressed) input; LTPW accumulates STPW (max abs normalized if auto_normalization).
+    That sum is built here in closed form, batch_size samples at a time:
+
+        LTPW += sum(w) for every weight, LTPW[class] += sum((input - 1) * w) over the samples of the class,
+
+    where w is 1 / max|STPW| (or 1). LTD depression vectors are drawn in bulk, in the same order as one sample at a time.
+
+    Args:
+        x_train (list[num]): List or numarray of input data.
+
+        y_decoded (numpy.ndarray): Class index of each sample. (decode_one_hot(y_train))
+
+        LTPW (numpy.ndarray): Long time potentiation weight matrix to accumulate into. Shape: (classes, features)
+
+        activation_potentiation (list): Activation list. default: ['linear'] (optional)
+
+        LTD (int): Long Term Depression Hyperparameter. default: 0 (optional)
+
+        auto_normalization (bool): Normalize each STPW before accumulating. default: True (optional)
+
+        train_progress (tqdm): Loading bar to update. default: None (optional)
+
+        batch_size (int): Samples processed at once. default: 1024 (optional)
+
+    Returns:
+        numpyarray([num]): LTPW
+    """
+
+    x_train = np.asarray(x_train)
+    x_train = x_train.reshape(len(x_train), -1)
+
+    row_wise = not any(act in ('sglu', 'spiral', 'circular') for act in activation_potentiation) # these use the whole input
+
+    for start in range(0, len(x_train), batch_size):
+
+        inputs = np.array(x_train[start:start + batch_size])
+        classes = y_decoded[start:start + batch_size]
+
+        if row_wise: inputs = apply_activation(inputs, activation_potentiation)
+        else: inputs = np.array([apply_activation(inp, activation_potentiation) for inp in inputs])
+
+        if LTD > 0:
+            depression_vectors = np.random.rand(len(inputs), LTD, inputs.shape[1])
+            for i in range(LTD):
+                inputs -= depression_vectors[:, i]
+
+        if auto_normalization:
+            max_abs = np.max(np.abs(inputs), axis=1)
+            if LTPW.shape[0] > 1: max_abs = np.maximum(max_abs, 1) # other rows of STPW are ones
+            scales = 1 / max_abs
+        else:
+            scales = np.ones(len(inputs))
+
+        LTPW += np.sum(scales)
+        np.add.at(LTPW, classes, (inputs - 1) * scales[:, None])
+
+        if train_progress is not None: train_progress.update(len(inputs))
+
+    return LTPW
+
 
 def feed_forward(
     Input,               # list[num]: Input data.
@@ -555,7 +626,7 @@ def evaluate(
     show_metrics=None, # show_metrices (bool): (True or None) (optional) Default: None   
 ) -> tuple:
     """
-    Tests the neural network model with the given test data.
+    Tests the neural network model with the given test data. All rows are predicted at once (batched).
 
     Args:
     
@@ -574,68 +645,41 @@ def evaluate(
     Returns:
         tuple: A tuple containing the predicted labels and the accuracy of the model.
     """
-    predict_probabilitys = []
-    real_classes = []
-    predict_classes = []
-
     try:
 
-        Wc = [0] * len(W)  # Wc = Weight copy
-        true_predict = 0
-        y_preds = []
-        y_preds_raw = []
-        acc_list = []
-
-        Wc = np.copy(W)
-            
-        
         if loading_bar_status == True:
 
             loading_bar = initialize_loading_bar(total=len(x_test), ncols=64, desc='Testing', bar_format=bar_format_normal)
 
-        for inpIndex, Input in enumerate(x_test):
-            Input = np.array(Input)
-            Input = Input.ravel()
-            neural_layer = Input
-
-                
-            neural_layer = feed_forward(neural_layer, W, is_training=False, Class='?', activation_potentiation=activation_potentiation)
-
+        x_test = np.array(x_test)
+        x_test = x_test.reshape(len(x_test), -1)
 
-            W = np.copy(Wc)
-            
-            neural_layer = Softmax(neural_layer)
+        # All rows at once: one matmul and row-wise softmax instead of feed_forward per row.
 
-            max_value = max(neural_layer)
+        if any(act in ('sglu', 'spiral', 'circular') for act in activation_potentiation): # these use the whole input, so per row
+            neural_layer = np.array([apply_activation(Input, activation_potentiation) for Input in x_test])
+        else:
+            neural_layer = apply_activation(x_test, activation_potentiation)
 
-            predict_probabilitys.append(max_value)
-            
-            RealOutput = np.argmax(y_test[inpIndex])
-            real_classes.append(RealOutput)
-            PredictedOutput = np.argmax(neural_layer)
-            predict_classes.append(PredictedOutput)
+        neural_layer = softmax(neural_layer @ W.T, axis=1)
 
-            if RealOutput == PredictedOutput:
-                true_predict += 1
-            acc = true_predict / len(y_test)
+        predict_classes = np.argmax(neural_layer, axis=1)
+        real_classes = np.argmax(y_test, axis=1)
 
+        acc_list = (np.cumsum(predict_classes == real_classes) / len(y_test)).tolist() # running accuracy, like row by row
+        acc = acc_list[-1]
 
-            acc_list.append(acc)
-            y_preds.append(PredictedOutput)
-            y_preds_raw.append(Softmax(neural_layer))
+        y_preds = list(predict_classes)
+        y_preds_raw = list(softmax(neural_layer, axis=1))
 
-            if loading_bar_status == True:
-                loading_bar.update(1)
-                
-            if inpIndex > 0 and loading_bar_status == True:
-                loading_bar.set_postfix({"Test Accuracy": acc})
+        if loading_bar_status == True:
+            loading_bar.update(len(x_test))
+            loading_bar.set_postfix({"Test Accuracy": acc})
 
         if show_metrics == True:
             
             loading_bar.close()
             plot_evaluate(x_test, y_test, y_preds, acc_list, W=W, activation_potentiation=activation_potentiation)
-        
-            W = np.copy(Wc)
 
     except Exception as e:
 
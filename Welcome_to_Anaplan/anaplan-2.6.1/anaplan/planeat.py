@@ -378,7 +378,7 @@ def evaluate(x_population, weights, activation_potentiations, rl_mode=False):
         
         - If `rl_mode` is False:
             - Accepts x_population is a list of genomes
-            - Each genome is processed individually, and the results are stored in the `outputs` list.
+            - Genomes are grouped by activation functions and each group is processed at once, the results are stored in the `outputs` list (same order as x_population).
         
         - `feed_forward()` function is the core function that processes the input with the given weights and activation function.
     
@@ -407,15 +407,31 @@ def evaluate(x_population, weights, activation_potentiations, rl_mode=False):
       
    else:
       outputs = [0] * len(x_population)
-      for i, genome in enumerate(x_population):
 
-         Input = np.array(genome)
-         Input = Input.ravel()
+      Inputs = np.array(x_population)
+      Inputs = Inputs.reshape(len(Inputs), -1)
+      weights = np.asarray(weights)
 
-         if isinstance(activation_potentiations[i], str):
-            activation_potentiations[i] = [activation_potentiations[i]]
+      ### GENOMES WITH THE SAME ACTIVATIONS ARE EVALUATED TOGETHER: ONE ACTIVATION CALL AND ONE STACKED-WEIGHT EINSUM PER GROUP (CALLER'S LIST IS NOT MODIFIED):
 
-         outputs[i] = feed_forward(Input=Input, is_training=False, activation_potentiation=activation_potentiations[i], w=weights[i])
+      groups = {}
+      for i, activations in enumerate(activation_potentiations):
+         activations = [activations] if isinstance(activations, str) else activations
+         groups.setdefault(tuple(activations), []).append(i)
+
+      for activations, indices in groups.items():
+
+         activations = list(activations)
+
+         if any(act in ('sglu', 'spiral', 'circular') for act in activations): # these use the whole input, so per genome
+            Input = np.array([apply_activation(Inputs[i], activations) for i in indices])
+         else:
+            Input = apply_activation(Inputs[indices], activations)
+
+         group_outputs = np.einsum('gij,gj->gi', weights[indices], Input)
+
+         for i, output in zip(indices, group_outputs):
+            outputs[i] = output
 
    return outputs
 
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from anaplan import plan
+from anaplan.data_operations import decode_one_hot, normalization
+
+
+def _data(rows=40, features=6, classes=3, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(rows, features)).astype(np.float32)
+    y = np.eye(classes)[rng.integers(0, classes, rows)]
+    return x, y
+
+
+def _fit_one_by_one(x, y, activation_potentiation, LTD, auto_normalization):
+    # The training loop fit ran for every sample before it was vectorized
+    LTPW = np.zeros((y.shape[1], x.shape[1]))
+    y_decoded = decode_one_hot(y)
+
+    for index, inp in enumerate(x):
+        STPW = np.ones((y.shape[1], x.shape[1]))
+        STPW = plan.feed_forward(np.array(inp).ravel(), STPW, is_training=True, Class=y_decoded[index],
+                                 activation_potentiation=activation_potentiation, LTD=LTD)
+        LTPW += normalization(STPW) if auto_normalization else STPW
+
+    return normalization(LTPW)
+
+
+@pytest.mark.parametrize('activation_potentiation, LTD, auto_normalization', [
+    (['linear'], 0, True),
+    (['tanh', 'sigmoid'], 2, True),
+    (['sglu', 'relu'], 0, True),
+    (['circular'], 1, False),
+])
+def test_fit_matches_learning_one_sample_at_a_time(activation_potentiation, LTD, auto_normalization):
+    x, y = _data()
+
+    np.random.seed(0)
+    expected = _fit_one_by_one(x, y, activation_potentiation, LTD, auto_normalization)
+
+    np.random.seed(0)
+    W = plan.fit(x, y, activation_potentiation=activation_potentiation, LTD=LTD,
+                 auto_normalization=auto_normalization, train_bar=False)
+
+    assert np.allclose(W, expected, atol=1e-6)
+
+
+def test_fit_with_default_loading_bar():
+    x, y = _data()
+
+    assert np.allclose(plan.fit(x, y), plan.fit(x, y, train_bar=False))
@@ -0,0 +1,24 @@
+import numpy as np
+
+from anaplan import planeat
+from anaplan.plan import feed_forward
+
+
+def test_evaluate_matches_each_genome_on_its_own():
+    rng = np.random.default_rng(0)
+    size = 12
+    x_population = rng.normal(size=(size, 2, 4))
+    weights = rng.uniform(-1, 1, size=(size, 3, 8))
+    choices = ['linear', ['tanh'], ['tanh'], ['relu', 'sigmoid'], ['sglu'], 'linear']
+    activation_potentiations = [choices[i % len(choices)] for i in range(size)]
+    caller_list = list(activation_potentiations)
+
+    outputs = planeat.evaluate(x_population, weights, activation_potentiations)
+
+    assert activation_potentiations == caller_list
+    for i in range(size):
+        activations = activation_potentiations[i]
+        activations = [activations] if isinstance(activations, str) else activations
+        expected = feed_forward(x_population[i].ravel(), weights[i], is_training=False, activation_potentiation=activations)
+        assert outputs[i].shape == (3,)
+        assert np.allclose(outputs[i], expected)
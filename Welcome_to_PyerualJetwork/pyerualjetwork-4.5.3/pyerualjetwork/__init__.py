@@ -13,14 +13,13 @@ def print_update_notes(update):
 print_version(__version__)
 print_update_notes(__update__)
 
-required_modules = ["scipy", "tqdm", "pandas", "numpy", "colorama", "cupy", "psutil"]
-
-missing_modules = []
-for module in required_modules:
-    try:
-        __import__(module)
-    except ModuleNotFoundError:
-        missing_modules.append(module)
+from importlib.util import find_spec
+
+# Modules are only located here, not imported. Heavy dependencies (scipy, pandas, matplotlib, networkx)
+# are imported inside the functions that use them, and cupy is only needed by the *_cuda modules.
+required_modules = ["scipy", "tqdm", "pandas", "numpy", "colorama", "psutil"]
+
+missing_modules = [module for module in required_modules if find_spec(module) is None]
 
 if missing_modules:
     raise ImportError(
@@ -1,6 +1,10 @@
 import numpy as np
-from scipy.special import expit, softmax
 import warnings
+import functools
+
+from .backend import get_array_module
+
+_approximation = None
 
 
 # ACTIVATION FUNCTIONS -----
@@ -11,17 +15,26 @@ def all_activations():
     
     return activations_list
 
+def is_row_wise(activation_list):
+    """
+    True when every activation in the list works row by row. sglu, spiral and circular use the whole input
+    (softmax and norm over all values), so their result changes when the input is split into chunks.
+    """
+    return not any(act in ('sglu', 'spiral', 'circular') for act in activation_list)
+
 def spiral_activation(x):
 
-    r = np.sqrt(np.sum(x**2))
+    xp = get_array_module(x)
+
+    r = xp.sqrt(xp.sum(x**2))
     
-    theta = np.arctan2(x[1:], x[:-1])
+    theta = xp.arctan2(x[1:], x[:-1])
 
-    spiral_x = r * np.cos(theta + r)
-    spiral_y = r * np.sin(theta + r)
+    spiral_x = r * xp.cos(theta + r)
+    spiral_y = r * xp.sin(theta + r)
     
 
-    spiral_output = np.concatenate(([spiral_x[0]], spiral_y))
+    spiral_output = xp.concatenate((spiral_x[:1], spiral_y))
     
     return spiral_output
 
@@ -39,7 +52,14 @@ def Softmax(
        (num): Transformed data after applying softmax function.
     """
 
-    return softmax(x)
+    xp = get_array_module(x)
+
+    if xp is np:
+        from scipy.special import softmax
+        return softmax(x)
+
+    e_x = xp.exp(x - xp.max(x))
+    return e_x / xp.sum(e_x)
 
 
 def Sigmoid(
@@ -54,7 +74,13 @@ def Sigmoid(
     Returns:
         (num): Transformed data after applying sigmoid function.
     """
-    return expit(x)
+    xp = get_array_module(x)
+
+    if xp is np:
+        from scipy.special import expit
+        return expit(x)
+
+    return 1 / (1 + xp.exp(-x))
 
 
 def Relu(
@@ -110,7 +136,7 @@ def p_squared(x, alpha=1.0, beta=0.0):
     return alpha * x**2 + beta * x
 
 def sglu(x, alpha=1.0):
-    return softmax(alpha * x) * x
+    return Softmax(alpha * x) * x
 
 # 4. Double Leaky ReLU (DLReLU)
 def dlrelu(x):
@@ -151,17 +177,19 @@ def bent_identity(x):
 
 def circular_activation(x, scale=2.0, frequency=1.0, shift=0.0):    
     
+    xp = get_array_module(x)
+
     n_features = x.shape[0]
     
-    circular_output = np.zeros_like(x)
+    circular_output = xp.zeros_like(x)
     
     for i in range(n_features):
         
-        r = np.sqrt(np.sum(x**2))
+        r = xp.sqrt(xp.sum(x**2))
         theta = 2 * np.pi * (i / n_features) + shift
         
-        circular_x = r * np.cos(theta + frequency * r) * scale
-        circular_y = r * np.sin(theta + frequency * r) * scale
+        circular_x = r * xp.cos(theta + frequency * r) * scale
+        circular_y = r * xp.sin(theta + frequency * r) * scale
         
         if i % 2 == 0:
             circular_output[i] = circular_x
@@ -203,6 +231,12 @@ def square_quartic(x):
 def cubic_quadratic(x):
     return x**3 * (x**2)
 
+def exp_cubic(x):
+    # Exponent clipped at half the overflow point of the dtype, so the values and their sums and products in fit
+    # and evaluate stay finite on unnormalized inputs
+    dtype = x.dtype if np.issubdtype(x.dtype, np.floating) else np.float64
+    return np.exp(np.minimum(x**3, np.floor(np.log(np.finfo(dtype).max) / 2)))
+
 def sine_square(x):
     return np.sin(x)**2
 
@@ -216,70 +250,248 @@ def sine_offset(x, beta=0.0):
     return np.sin(x + beta)
 
 
+ACTIVATION_FUNCTIONS = {
+    'sigmoid': Sigmoid,
+    'swish': swish,
+    'mod_circular': modular_circular_activation,
+    'tanh_circular': tanh_circular_activation,
+    'leaky_relu': leaky_relu,
+    'relu': Relu,
+    'softplus': softplus,
+    'elu': elu,
+    'gelu': gelu,
+    'selu': selu,
+    'tanh': tanh,
+    'sinakt': sinakt,
+    'p_squared': p_squared,
+    'sglu': lambda x: sglu(x, alpha=1.0),
+    'dlrelu': dlrelu,
+    'exsig': exsig,
+    'sin_plus': sin_plus,
+    'acos': lambda x: acos(x, alpha=1.0, beta=0.0),
+    'gla': lambda x: gla(x, alpha=1.0, mu=0.0),
+    'srelu': srelu,
+    'qelu': qelu,
+    'isra': isra,
+    'waveakt': waveakt,
+    'arctan': arctan,
+    'bent_identity': bent_identity,
+    'sech': sech,
+    'softsign': softsign,
+    'pwl': pwl,
+    'cubic': cubic,
+    'gaussian': gaussian,
+    'sine': sine,
+    'tanh_square': tanh_square,
+    'mod_sigmoid': mod_sigmoid,
+    'linear': lambda x: x,
+    'quartic': quartic,
+    'square_quartic': square_quartic,
+    'cubic_quadratic': cubic_quadratic,
+    'exp_cubic': exp_cubic,
+    'sine_square': sine_square,
+    'logarithmic': logarithmic,
+    'scaled_cubic': lambda x: scaled_cubic(x, 1.0),
+    'sine_offset': lambda x: sine_offset(x, 1.0),
+    'spiral': spiral_activation,
+    'circular': circular_activation
+}
+
+# Element-wise and continuous, so a sum of them is one smooth enough function of x for an interpolation table.
+# exp_cubic grows too fast for one over the table range
+TABLE_ACTIVATIONS = frozenset(ACTIVATION_FUNCTIONS) - {'sglu', 'spiral', 'circular', 'mod_circular', 'exp_cubic'}
+
+# Rough exact cost of each activation in table lookups (float32, numpy 1.26, x86-64). A table is used for a list whose
+# total cost is at least 1: gelu and the powers alone, a few cheap activations together
+ACTIVATION_COSTS = {
+    'gelu': 7.7, 'cubic_quadratic': 7.5, 'cubic': 7.2, 'quartic': 7.2, 'scaled_cubic': 7.2, 'waveakt': 1.5, 'pwl': 1.2,
+    'dlrelu': 1.1, 'elu': 1.0, 'selu': 0.9, 'leaky_relu': 0.9, 'sech': 0.8, 'sigmoid': 0.8, 'srelu': 0.5, 'swish': 0.4,
+    'mod_sigmoid': 0.4, 'softplus': 0.4, 'p_squared': 0.4, 'bent_identity': 0.4, 'isra': 0.4, 'logarithmic': 0.35,
+    'softsign': 0.35, 'exsig': 0.3, 'acos': 0.3, 'gaussian': 0.3, 'gla': 0.3, 'sinakt': 0.3, 'qelu': 0.3,
+    'tanh_circular': 0.3, 'sine': 0.3, 'sine_offset': 0.3, 'sin_plus': 0.25, 'sine_square': 0.25, 'tanh_square': 0.25,
+    'tanh': 0.2, 'square_quartic': 0.2, 'relu': 0.2, 'arctan': 0.2, 'linear': 0.2
+}
+
+ACTIVATION_SUM_COST = 0.05 # the addition of each activation to the sum
+
+TABLE_SIZES = [2 ** k + 1 for k in range(10, 17)]
+
+
+def _exact_sum(x, activations):
+    return x + sum(ACTIVATION_FUNCTIONS[act](x) for act in activations)
+
+
+def _lookup(x, table):
+    """
+    Linear interpolation in a table built by _activation_table. Elements outside its range get the end segments.
+    """
+    slope, intercept, scale, offset = table['slope'], table['intercept'], table['scale'], table['offset']
+
+    t = x * scale
+    t += offset
+    i = t.astype(np.intp)
+
+    y = slope.take(i, mode='clip')
+    y *= t
+    y += intercept.take(i, mode='clip')
+
+    return y
+
+
+@functools.lru_cache(maxsize=1024)
+def _activation_table(activations, dtype, max_error, low, high):
+    """
+    Interpolation table of x + sum of the activations on [low, high]: the coarsest of TABLE_SIZES whose error, measured
+    against float64 on a grid 8 times finer than the table, is at most max_error (absolute, relative where |y| > 1).
+    None if no size reaches it.
+    """
+    dtype = np.dtype(dtype)
+
+    with np.errstate(all='ignore'):
+
+        for size in TABLE_SIZES:
+
+            values = _exact_sum(np.linspace(low, high, size), activations)
+            if not np.all(np.isfinite(values)): return None
+
+            slope = np.diff(values)
+            slope = np.append(slope, slope[-1]) # t == size - 1 (x == high) uses the last segment
+
+            scale = (size - 1) / (high - low)
+
+            table = {'slope': slope.astype(dtype), 'intercept': (values - slope * np.arange(size)).astype(dtype),
+                     'scale': dtype.type(scale), 'offset': dtype.type(-low * scale), 'size': size}
+
+            probe = np.linspace(low, high, (size - 1) * 8 + 1).astype(dtype)
+            exact = _exact_sum(probe.astype(np.float64), activations)
+
+            table['error'] = float(np.max(np.abs(_lookup(probe, table) - exact) / np.maximum(1, np.abs(exact))))
+
+            if table['error'] <= max_error: return table
+
+    return None
+
+
+class approximation:
+    """
+    Approximate activation mode. Inside `with approximation():`, apply_activation computes the activation list of a
+    float32/float64 numpy input from one interpolation table of the whole list (x + sum of its activations), so a genome
+    with many activations costs one table lookup. For ranking genomes during search, where the last digits don't matter.
+
+    Tables are built per activation list on first use and cached. The error bound is measured, not proven: a table is used
+    only if its error against float64 on a grid 8 times finer than the table is at most max_error. Lists with sglu, spiral,
+    circular or mod_circular (not element-wise or not continuous), lists that are cheaper exactly than a lookup
+    (ACTIVATION_COSTS: tanh or relu alone, but not gelu or a few of them together), lists that can't reach max_error with
+    65537 points and non numpy inputs (cupy, backend.emulated) are computed exactly.
+
+    Args:
+        max_error (float, optional): Bound of |approximate - exact|, relative where |exact| > 1. Default: 1e-3
+
+        input_range (tuple, optional): Interval covered by the tables. Elements outside it are computed exactly, so keep
+            inputs inside (normalized inputs, auto_normalization=True) for the speed up. Default: (-8.0, 8.0)
+
+    Example:
+        ```python
+        from pyerualjetwork.activation_functions import approximation
+
+        with approximation(max_error=1e-4):
+            model = plan.evaluate(x_test, y_test, W=W, activation_potentiation=activations)
+
+        approximation().error(['gelu', 'waveakt']) # measured max error of this list's table, None if computed exactly
+        ```
+    """
+
+    def __init__(self, max_error=1e-3, input_range=(-8.0, 8.0)):
+
+        if max_error <= 0: raise ValueError('max_error must be positive')
+        if input_range[0] >= input_range[1]: raise ValueError('input_range must be (low, high) with low < high')
+
+        self.max_error = float(max_error)
+        self.input_range = (float(input_range[0]), float(input_range[1]))
+        self._previous = []
+
+    def __enter__(self):
+        global _approximation
+
+        self._previous.append(_approximation)
+        _approximation = self
+        return self
+
+    def __exit__(self, *args):
+        global _approximation
+
+        _approximation = self._previous.pop()
+
+    def table(self, activation_list, dtype=np.float32):
+        """
+        The table used for activation_list and dtype (dict with 'size' and measured 'error'), or None if it's computed exactly.
+        """
+        if isinstance(activation_list, str): activation_list = [activation_list]
+
+        activations = tuple(act for act in activation_list if act in ACTIVATION_FUNCTIONS)
+
+        if not activations or not TABLE_ACTIVATIONS.issuperset(activations): return None
+        if sum(ACTIVATION_COSTS[act] + ACTIVATION_SUM_COST for act in activations) < 1: return None
+
+        return _activation_table(activations, np.dtype(dtype).str, self.max_error, *self.input_range)
+
+    def error(self, activation_list, dtype=np.float32):
+        """
+        Measured max error of the table of activation_list, None if it's computed exactly.
+        """
+        table = self.table(activation_list, dtype)
+        return None if table is None else table['error']
+
+    def apply(self, x, activation_list):
+        """
+        Approximate apply_activation, None where it falls back to the exact computation.
+        """
+        if type(x) is not np.ndarray or x.dtype not in (np.float32, np.float64) or x.size == 0: return None
+
+        table = self.table(activation_list, x.dtype)
+        if table is None: return None
+
+        y = _lookup(x, table)
+
+        low, high = self.input_range
+
+        if not (x.min() >= low and x.max() <= high):
+            outside = ~((x >= low) & (x <= high))
+            activations = tuple(act for act in activation_list if act in ACTIVATION_FUNCTIONS)
+            y[outside] = _exact_sum(x[outside], activations)
+
+        return y
+
+
 def apply_activation(Input, activation_list):
     """
     Applies activation functions for inputs
     
     Args:
-        Input (numpy.ndarray):
-        activation_list (list):
+        Input (numpy.ndarray or cupy.ndarray):
+        activation_list (list): Activation names, or one name as str.
+
+    Raises:
+        ValueError: For an activation name that isn't in ACTIVATION_FUNCTIONS.
+
+    Inside `with approximation():` numpy inputs may be computed from an interpolation table, see approximation.
     """
-    origin_input = np.copy(Input)
-    
-    activation_functions = {
-        'sigmoid': Sigmoid,
-        'swish': swish,
-        'mod_circular': modular_circular_activation,
-        'tanh_circular': tanh_circular_activation,
-        'leaky_relu': leaky_relu,
-        'relu': Relu,
-        'softplus': softplus,
-        'elu': elu,
-        'gelu': gelu,
-        'selu': selu,
-        'tanh': tanh,
-        'sinakt': sinakt,
-        'p_squared': p_squared,
-        'sglu': lambda x: sglu(x, alpha=1.0),
-        'dlrelu': dlrelu,
-        'exsig': exsig,
-        'sin_plus': sin_plus,
-        'acos': lambda x: acos(x, alpha=1.0, beta=0.0),
-        'gla': lambda x: gla(x, alpha=1.0, mu=0.0),
-        'srelu': srelu,
-        'qelu': qelu,
-        'isra': isra,
-        'waveakt': waveakt,
-        'arctan': arctan,
-        'bent_identity': bent_identity,
-        'sech': sech,
-        'softsign': softsign,
-        'pwl': pwl,
-        'cubic': cubic,
-        'gaussian': gaussian,
-        'sine': sine,
-        'tanh_square': tanh_square,
-        'mod_sigmoid': mod_sigmoid,
-        'linear': lambda x: x,
-        'quartic': quartic,
-        'square_quartic': square_quartic,
-        'cubic_quadratic': cubic_quadratic,
-        'sine_square': sine_square,
-        'logarithmic': logarithmic,
-        'scaled_cubic': lambda x: scaled_cubic(x, 1.0),
-        'sine_offset': lambda x: sine_offset(x, 1.0),
-        'spiral': spiral_activation,
-        'circular': circular_activation
-    }
-    
-    try:
+    if isinstance(activation_list, str): activation_list = [activation_list]
 
-        valid_mask = np.array([act in activation_functions for act in activation_list])
-        valid_activations = np.array(activation_list)[valid_mask]
+    unknown = [act for act in activation_list if not isinstance(act, str) or act not in ACTIVATION_FUNCTIONS]
+    if unknown: raise ValueError(f"unknown activation functions: {unknown}")
 
-        activation_outputs = np.array([activation_functions[act](origin_input) for act in valid_activations])
+    if _approximation is not None:
+        output = _approximation.apply(Input, activation_list)
+        if output is not None: return output
+
+    xp = get_array_module(Input)
+
+    origin_input = xp.copy(Input)
+    
+    try:
 
-        return Input + np.sum(activation_outputs, axis=0)
+        return Input + sum(ACTIVATION_FUNCTIONS[act](origin_input) for act in activation_list)
         
     except Exception as e:
         warnings.warn(f"Error in activation processing: {str(e)}", RuntimeWarning)
@@ -0,0 +1,165 @@
+"""
+
+BACKEND MODULE FOR PYERUALJETWORK
+
+Array namespace dispatch shared by CPU and CUDA modules. Core algorithms (plan.fit, plan.evaluate,
+planeat.evolver ...) ask for the namespace of their inputs with get_array_module and use it in place of
+numpy or cupy, so a single implementation serves every backend. The *_cuda modules call these shared
+implementations with cupy arrays.
+
+backend.emulated also carries a synchronous stand-in for cupy.cuda (streams, events, pinned memory), so the
+memory_operations transfer pipeline runs on CPU.
+
+Example:
+    ```python
+    from pyerualjetwork import backend, plan
+
+    x = backend.emulated.asarray(x_train)   # numpy backed stand-in of a device array
+    y = backend.emulated.asarray(y_train)
+
+    W = plan.fit(x, y)                      # runs the same code path as cupy input
+    backend.get_array_module(W)             # -> backend.emulated
+    ```
+
+@author: Hasan Can Beydili
+@YouTube: https://www.youtube.com/@HasanCanBeydili
+@Linkedin: https://www.linkedin.com/in/hasan-can-beydili-77a1b9270/
+@Instagram: https://www.instagram.com/canbeydilj/
+@contact: tchasancan@gmail.com
+"""
+
+import types
+import functools
+import numpy as np
+
+_backends = {}
+
+
+def register_backend(array_type, xp):
+    """
+    Registers an array namespace for an array type. get_array_module returns xp for arrays of this type.
+
+    Args:
+        array_type (type): Array class. For example: cupy.ndarray
+
+        xp (module): numpy compatible namespace (module or object) that creates and operates on array_type.
+    """
+
+    _backends[array_type] = xp
+
+
+def get_array_module(*arrays):
+    """
+    Returns the array namespace (numpy, cupy or a registered backend) of the given arrays.
+    The first array with a known backend decides. Lists, scalars and numpy arrays fall back to numpy.
+
+    Args:
+        *arrays: Arrays (or anything else) to inspect.
+
+    Returns:
+        module: numpy compatible namespace.
+    """
+
+    for x in arrays:
+
+        xp = _backends.get(type(x))
+        if xp is not None: return xp
+
+        if type(x).__module__.split('.')[0] == 'cupy':
+            import cupy as cp
+            register_backend(type(x), cp)
+            return cp
+
+    return np
+
+
+class EmulatedArray(np.ndarray):
+    """
+    numpy.ndarray subclass standing in for a device array. Created through `emulated`, it keeps its type
+    through arithmetic and ufuncs, so code dispatching with get_array_module can be exercised on CPU.
+    Like cupy.ndarray it has set() and get() for host transfers.
+    """
+
+    def set(self, arr, stream=None):
+        self[...] = arr
+
+    def get(self, stream=None, out=None):
+
+        if out is None: return np.array(self, copy=True).view(np.ndarray)
+
+        out[...] = self
+        return out
+
+
+class _EmulatedStream:
+
+    def __init__(self, non_blocking=False):
+        self.non_blocking = non_blocking
+
+    def synchronize(self):
+        pass
+
+    def wait_event(self, event):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+class _EmulatedEvent:
+
+    def record(self, stream=None):
+        pass
+
+    def synchronize(self):
+        pass
+
+
+class _EmulatedCuda:
+    """
+    Stand-in for cupy.cuda: streams and events run synchronously and pinned memory is plain host memory.
+    """
+
+    Stream = _EmulatedStream
+    Event = _EmulatedEvent
+
+    @staticmethod
+    def alloc_pinned_memory(nbytes):
+        return bytearray(nbytes)
+
+
+class _EmulatedNamespace:
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+
+        attr = getattr(self._module, name)
+
+        if isinstance(attr, types.ModuleType):
+            return _EmulatedNamespace(attr)
+
+        if callable(attr) and not isinstance(attr, type):
+
+            @functools.wraps(attr)
+            def wrapper(*args, **kwargs):
+                out = attr(*args, **kwargs)
+                return out.view(EmulatedArray) if type(out) is np.ndarray else out
+
+            return wrapper
+
+        return attr
+
+    def __repr__(self):
+        return f"<emulated backend of '{self._module.__name__}'>"
+
+
+emulated = _EmulatedNamespace(np)
+emulated.__name__ = 'emulated'
+emulated.cuda = _EmulatedCuda()
+
+register_backend(EmulatedArray, emulated)
@@ -0,0 +1,603 @@
+"""
+
+BENCHMARK MODULE FOR PYERUALJETWORK
+
+Times and memory-profiles the main code paths on synthetic data at parameterised scales, writes the results to JSON
+and compares them against a stored baseline. Also measures cold import time.
+
+Example:
+    python -m pyerualjetwork.benchmark --output results.json
+    python -m pyerualjetwork.benchmark --rows 1000 100000 --only fit evaluate --baseline results.json
+    python -m pyerualjetwork.benchmark --import-time
+    python -m pyerualjetwork.benchmark --approximation
+
+@author: Hasan Can Beydili
+@YouTube: https://www.youtube.com/@HasanCanBeydili
+@Linkedin: https://www.linkedin.com/in/hasan-can-beydili-77a1b9270/
+@Instagram: https://www.instagram.com/canbeydilj/
+@contact: tchasancan@gmail.com
+"""
+
+import os
+import sys
+import json
+import subprocess
+import itertools
+import tempfile
+import platform
+import time
+import tracemalloc
+import contextlib
+import io
+import numpy as np
+
+HEAVY_MODULES = ['cupy', 'scipy', 'pandas', 'matplotlib', 'networkx', 'seaborn', 'tqdm']
+
+IMPORT_TARGETS = ['pyerualjetwork.plan', 'pyerualjetwork.planeat', 'pyerualjetwork.model_operations',
+                  'pyerualjetwork.data_operations', 'pyerualjetwork.activation_functions']
+
+
+def import_time(targets=IMPORT_TARGETS, repeat=5, heavy_modules=HEAVY_MODULES):
+    """
+    Measures cold import time of library modules. Every measurement runs in a fresh interpreter,
+    so results reflect container cold start rather than cached imports.
+
+    Args:
+        targets (list): Module names to import. Default: plan, planeat, model_operations, data_operations, activation_functions
+
+        repeat (int): How many fresh interpreters per target. Best time is reported. Default: 5
+
+        heavy_modules (list): Optional dependencies to watch. Default: cupy, scipy, pandas, matplotlib, networkx, seaborn, tqdm
+
+    Returns:
+        dict: {target: {'seconds': best import time, 'loaded': heavy modules found in sys.modules after the import}}
+    """
+
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = package_root + os.pathsep + env.get('PYTHONPATH', '')
+
+    results = {}
+
+    for target in targets:
+
+        code = (
+            "import sys, time, json, io, contextlib\n"
+            "t = time.perf_counter()\n"
+            "with contextlib.redirect_stdout(io.StringIO()):\n"
+            f"    import {target}\n"
+            "t = time.perf_counter() - t\n"
+            f"print(json.dumps([t, [m for m in {heavy_modules!r} if m in sys.modules]]))\n"
+        )
+
+        best = float('inf')
+        loaded = []
+
+        for _ in range(repeat):
+            output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True).stdout
+            seconds, loaded = json.loads(output.strip().splitlines()[-1])
+            best = min(best, seconds)
+
+        results[target] = {'seconds': best, 'loaded': loaded}
+
+    return results
+
+
+# Activations used by the suite, row-wise so results do not depend on chunking
+BENCHMARK_ACTIVATIONS = ['tanh', 'relu', 'sigmoid', 'sin_plus', 'gelu', 'softplus', 'swish', 'elu']
+
+DEFAULT_SCALES = {'rows': [1000, 10000], 'features': [32], 'classes': [4], 'pop_size': [50], 'activations': [1, 4]}
+
+
+def make_classification(rows, features, classes, imbalance=0.0, seed=0, dtype=np.float32):
+    """
+    Synthetic classification data: one gaussian blob per class.
+
+    Args:
+        rows (int): Sample count.
+
+        features (int): Feature count.
+
+        classes (int): Class count.
+
+        imbalance (float, optional): 0 gives balanced classes, towards 1 each class gets fewer samples than the previous one. Default: 0
+
+        seed (int, optional): Seed of the generator. Default: 0
+
+        dtype (numpy.dtype, optional): Data type of x. Default: np.float32
+
+    Returns:
+        tuple: x (rows, features) and integer labels y (rows,).
+    """
+
+    rng = np.random.default_rng(seed)
+
+    weights = (1 - imbalance) ** np.arange(classes)
+    y = rng.choice(classes, size=rows, p=weights / weights.sum())
+
+    centers = rng.normal(0, 1, (classes, features))
+    x = (centers[y] + rng.normal(0, 1, (rows, features))).astype(dtype)
+
+    return x, y
+
+
+def _setup_fit(rows, features, classes, activations, **_):
+    from .plan import fit
+    from .data_operations import encode_one_hot
+
+    x, y = make_classification(rows, features, classes)
+    y = encode_one_hot(y)
+    return lambda: fit(x, y, activation_potentiation=activations)
+
+
+def _setup_evaluate(rows, features, classes, activations, **_):
+    from .plan import fit, evaluate
+    from .data_operations import encode_one_hot
+
+    x, y = make_classification(rows, features, classes)
+    y = encode_one_hot(y)
+    W = fit(x, y, activation_potentiation=activations)
+    return lambda: evaluate(x, y, W=W, activation_potentiation=activations)
+
+
+def _setup_apply_activation(rows, features, activations, **_):
+    from .activation_functions import apply_activation
+
+    x, _ = make_classification(rows, features, 2)
+    return lambda: apply_activation(x, activations)
+
+
+def _approximated(function):
+
+    from .activation_functions import approximation
+
+    def run():
+        with approximation():
+            return function()
+
+    return run
+
+
+def _setup_apply_activation_approximate(rows, features, activations, **_):
+    return _approximated(_setup_apply_activation(rows, features, activations))
+
+
+def _setup_evaluate_approximate(rows, features, classes, activations, **_):
+    return _approximated(_setup_evaluate(rows, features, classes, activations))
+
+
+def _setup_learner_generation(rows, features, classes, pop_size, headless=False, **_):
+    from .plan import learner
+    from .planeat import evolver
+    from .data_operations import encode_one_hot
+
+    x, y = make_classification(rows, features, classes)
+    y = encode_one_hot(y)
+    return lambda: learner(x, y, evolver, gen=1, pop_size=pop_size, headless=headless)
+
+
+def _setup_learner_generation_headless(rows, features, classes, pop_size, **_):
+    return _setup_learner_generation(rows, features, classes, pop_size, headless=True)
+
+
+def _setup_define_genomes(features, classes, pop_size, **_):
+    from .planeat import define_genomes
+
+    return lambda: define_genomes(features, classes, pop_size)
+
+
+def _setup_evolver(features, classes, pop_size, **_):
+    from .planeat import define_genomes, evolver
+
+    rng = np.random.default_rng(0)
+    weights, activations = define_genomes(features, classes, pop_size)
+    fitness = rng.random(pop_size).astype(np.float32)
+    return lambda: evolver(weights, activations, 0, fitness, bar_status=False)
+
+
+def _setup_evolver_double_buffer(features, classes, pop_size, **_):
+    from .planeat import define_genomes, evolver
+
+    rng = np.random.default_rng(0)
+    weights, activations = define_genomes(features, classes, pop_size)
+    fitness = rng.random(pop_size).astype(np.float32)
+    buffers = [np.array(weights), np.empty_like(weights)]
+
+    def run():
+        buffers.reverse()
+        return evolver(buffers[1], activations, 0, fitness, bar_status=False, out=buffers[0])
+
+    return run
+
+
+def _setup_synthetic_augmentation(rows, features, classes, **_):
+    from .data_operations import synthetic_augmentation, encode_one_hot
+
+    x, y = make_classification(rows, features, classes, imbalance=0.5)
+    y = encode_one_hot(y)
+    return lambda: synthetic_augmentation(x, y)
+
+
+def _setup_auto_balancer(rows, features, classes, **_):
+    from .data_operations import auto_balancer, encode_one_hot
+
+    x, y = make_classification(rows, features, classes, imbalance=0.5)
+    y = encode_one_hot(y)
+    return lambda: auto_balancer(x, y)
+
+
+def _setup_encode_one_hot(rows, classes, **_):
+    from .data_operations import encode_one_hot
+
+    _, y = make_classification(rows, 1, classes)
+    return lambda: encode_one_hot(y)
+
+
+def _setup_metrics(rows, classes, **_):
+    from .metrics import metrics
+    from .data_operations import encode_one_hot
+
+    _, y = make_classification(rows, 1, classes)
+    preds = np.random.default_rng(1).integers(0, classes, rows)
+    y = encode_one_hot(y)
+    return lambda: metrics(y, preds)
+
+
+def _setup_roc_auc(rows, classes, **_):
+    from .metrics import roc_auc
+    from .data_operations import encode_one_hot
+
+    _, y = make_classification(rows, 1, classes)
+    scores = np.random.default_rng(1).random((rows, classes))
+    y = encode_one_hot(y)
+    return lambda: roc_auc(y, scores)
+
+
+def _setup_save_load(features, classes, activations, **_):
+    from .model_operations import save_model, load_model
+
+    W = np.random.default_rng(0).normal(size=(classes, features)).astype(np.float32)
+    directory = tempfile.TemporaryDirectory(prefix='pyerualjetwork_benchmark_') # removed with the closure
+
+    def run():
+        save_model('benchmark', W, model_path=directory.name + os.sep, activation_potentiation=list(activations), show_info=False)
+        return load_model('benchmark', directory.name + os.sep)
+
+    return run
+
+
+# name: (setup function, scale parameters it uses)
+BENCHMARKS = {
+    'fit': (_setup_fit, ('rows', 'features', 'classes', 'activations')),
+    'evaluate': (_setup_evaluate, ('rows', 'features', 'classes', 'activations')),
+    'evaluate_approximate': (_setup_evaluate_approximate, ('rows', 'features', 'classes', 'activations')),
+    'apply_activation': (_setup_apply_activation, ('rows', 'features', 'activations')),
+    'apply_activation_approximate': (_setup_apply_activation_approximate, ('rows', 'features', 'activations')),
+    'learner_generation': (_setup_learner_generation, ('rows', 'features', 'classes', 'pop_size')),
+    'learner_generation_headless': (_setup_learner_generation_headless, ('rows', 'features', 'classes', 'pop_size')),
+    'define_genomes': (_setup_define_genomes, ('features', 'classes', 'pop_size')),
+    'evolver': (_setup_evolver, ('features', 'classes', 'pop_size')),
+    'evolver_double_buffer': (_setup_evolver_double_buffer, ('features', 'classes', 'pop_size')),
+    'synthetic_augmentation': (_setup_synthetic_augmentation, ('rows', 'features', 'classes')),
+    'auto_balancer': (_setup_auto_balancer, ('rows', 'features', 'classes')),
+    'encode_one_hot': (_setup_encode_one_hot, ('rows', 'classes')),
+    'metrics': (_setup_metrics, ('rows', 'classes')),
+    'roc_auc': (_setup_roc_auc, ('rows', 'classes')),
+    'save_load': (_setup_save_load, ('features', 'classes', 'activations')),
+}
+
+
+def _min_learner_pop_size():
+    """
+    Smallest population learner runs with: one genome per activation it starts from.
+    """
+    from .activation_functions import all_activations
+
+    return len([act for act in all_activations() if act not in ('spiral', 'circular')])
+
+
+def _scale_problems(names, scales):
+    """
+    Scale values the given benchmarks can't run with, as messages. Checked before anything runs, so a bad value
+    doesn't abort the suite halfway.
+    """
+    problems = []
+
+    for name in names:
+
+        if 'pop_size' not in BENCHMARKS[name][1]: continue
+
+        if name.startswith('learner'):
+            minimum = _min_learner_pop_size()
+            invalid = [size for size in scales['pop_size'] if size < minimum or size % 2]
+            if invalid: problems.append(f"{name}: pop_size must be even and at least {minimum}, got {invalid}")
+
+        elif name.startswith('evolver'):
+            invalid = [size for size in scales['pop_size'] if size < 2 or size % 2]
+            if invalid: problems.append(f"{name}: pop_size must be even and at least 2, got {invalid}")
+
+        else:
+            invalid = [size for size in scales['pop_size'] if size < 1]
+            if invalid: problems.append(f"{name}: pop_size must be positive, got {invalid}")
+
+    return problems
+
+
+def measure(function, repeat=3, memory=True):
+    """
+    Times a function (best of `repeat` runs, after one warm-up run) and measures its peak python/numpy allocation with tracemalloc.
+    Console output of the function (loading bars, info prints) is discarded.
+
+    Returns:
+        dict: {'seconds': best time, 'peak_mb': peak allocation in MB or None}
+    """
+
+    def call():
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            function()
+
+    call()
+
+    best = float('inf')
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+
+    peak_mb = None
+
+    if memory:
+        tracemalloc.start()
+        try:
+            call()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    return {'seconds': best, 'peak_mb': peak_mb}
+
+
+def run_benchmarks(names=None, scales=None, repeat=3, memory=True, seed=0):
+    """
+    Runs the benchmark suite over every combination of the scale parameters each benchmark uses.
+
+    Args:
+        names (list, optional): Benchmarks to run (keys of BENCHMARKS). Default: all
+
+        scales (dict, optional): Values of 'rows', 'features', 'classes', 'pop_size' and 'activations' (activation list length).
+            Missing keys use DEFAULT_SCALES. Default: DEFAULT_SCALES
+
+        repeat (int, optional): Timed runs per case, best is reported. Default: 3
+
+        memory (bool, optional): Also measure peak allocation. Default: True
+
+        seed (int, optional): Seed of numpy.random and random for the runs. Default: 0
+
+    Returns:
+        dict: {'environment': {...}, 'results': [{'benchmark', 'params', 'seconds', 'peak_mb'}, ...]}
+
+    Raises:
+        ValueError: If a scale value can't be run by a selected benchmark (for example an odd pop_size for evolver).
+    """
+
+    import random
+    from . import __version__
+
+    scales = {**DEFAULT_SCALES, **(scales or {})}
+    names = list(BENCHMARKS) if names is None else names
+
+    problems = _scale_problems(names, scales)
+    if problems: raise ValueError('; '.join(problems))
+
+    results = []
+
+    for name in names:
+
+        setup, used = BENCHMARKS[name]
+
+        for values in itertools.product(*(scales[key] for key in used)):
+
+            params = dict(zip(used, values))
+
+            kwargs = dict(params)
+            if 'activations' in kwargs: kwargs['activations'] = BENCHMARK_ACTIVATIONS[:kwargs['activations']]
+
+            np.random.seed(seed)
+            random.seed(seed)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                function = setup(**kwargs)
+
+            results.append({'benchmark': name, 'params': params, **measure(function, repeat=repeat, memory=memory)})
+
+    environment = {'pyerualjetwork': __version__, 'numpy': np.__version__, 'python': platform.python_version(),
+                   'machine': platform.machine(), 'processor': platform.processor(), 'cpu_count': os.cpu_count()}
+
+    return {'environment': environment, 'results': results}
+
+
+def approximation_impact(rows=10000, features=32, classes=4, pop_size=50, gen=5, max_activations=8, max_error=1e-3, seed=0):
+    """
+    Speed and accuracy impact of activation_functions.approximation on synthetic data.
+
+    Ranking: a random population (activation lists of 1 to max_activations table activations) is scored with wals exactly and
+    approximately, on normalized inputs. Learner: the same seeded learner run with and without approximate_activations.
+
+    Returns:
+        dict: {'ranking': {'seconds', 'approximate_seconds', 'max_accuracy_difference', 'max_fitness_difference', 'rank_correlation',
+        'same_half', 'max_table_error'}, 'learner': {'seconds', 'approximate_seconds', 'accuracy', 'approximate_accuracy'}}
+        same_half is the fraction of genomes put in the same half (good or bad genomes of evolver) by both scorings.
+    """
+
+    from .plan import evaluate, learner
+    from .planeat import evolver
+    from .data_operations import encode_one_hot, normalization
+    from .fitness_functions import wals
+    from .loss_functions import categorical_crossentropy
+    from .model_operations import get_acc, get_preds_softmax
+    from .activation_functions import approximation, TABLE_ACTIVATIONS
+
+    rng = np.random.default_rng(seed)
+
+    x, y = make_classification(rows, features, classes, seed=seed)
+    y = encode_one_hot(y)
+    x_normalized = normalization(x, dtype=x.dtype)
+
+    names = sorted(TABLE_ACTIVATIONS)
+    population = [(rng.uniform(-1, 1, (classes, features)).astype(np.float32), list(rng.choice(names, rng.integers(1, max_activations + 1))))
+                  for _ in range(pop_size)]
+
+    approximate = approximation(max_error=max_error)
+
+    def score():
+        start = time.perf_counter()
+        accs, fitness = [], []
+
+        for W, activations in population:
+            model = evaluate(x_normalized, y, W=W, activation_potentiation=activations)
+            loss = categorical_crossentropy(y_true_batch=y, y_pred_batch=model[get_preds_softmax()])
+            accs.append(model[get_acc()])
+            fitness.append(wals(model[get_acc()], loss, 0.9, 0.1))
+
+        return np.array(accs), np.array(fitness, dtype=np.float64), time.perf_counter() - start
+
+    accs, fitness, seconds = score()
+    with approximate: approximate_accs, approximate_fitness, approximate_seconds = score()
+
+    ranks, approximate_ranks = np.argsort(np.argsort(fitness)), np.argsort(np.argsort(approximate_fitness))
+    half = pop_size // 2
+    errors = [approximate.error(activations) for _, activations in population]
+
+    ranking = {'seconds': seconds, 'approximate_seconds': approximate_seconds,
+               'max_accuracy_difference': float(np.max(np.abs(accs - approximate_accs))),
+               'max_fitness_difference': float(np.max(np.abs(fitness - approximate_fitness))),
+               'rank_correlation': float(np.corrcoef(ranks, approximate_ranks)[0, 1]),
+               'same_half': float(np.mean((ranks >= half) == (approximate_ranks >= half))),
+               'max_table_error': max((error for error in errors if error is not None), default=None)}
+
+    def run_learner(approximate_activations):
+        start = time.perf_counter()
+        result = learner(x, y, evolver, gen=gen, pop_size=max(pop_size, _min_learner_pop_size()), auto_normalization=True, headless=True,
+                         rng=np.random.default_rng(seed), approximate_activations=approximate_activations)
+        return result, time.perf_counter() - start
+
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        exact_run, learner_seconds = run_learner(False)
+        approximate_run, approximate_learner_seconds = run_learner(approximate)
+
+    return {'ranking': ranking, 'learner': {'seconds': learner_seconds, 'approximate_seconds': approximate_learner_seconds,
+                                            'accuracy': exact_run['accuracy'], 'approximate_accuracy': approximate_run['accuracy']}}
+
+
+def save_results(results, path):
+    """Writes run_benchmarks results to a JSON file."""
+
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    """Reads results written by save_results."""
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compares results against a baseline (both from run_benchmarks). Cases are matched by benchmark name and params.
+
+    Args:
+        results (dict): Current results.
+
+        baseline (dict): Baseline results.
+
+        threshold (float, optional): Relative time change reported as 'faster' or 'slower'. Smaller changes are 'same'. Default: 0.1
+
+    Returns:
+        list: [{'benchmark', 'params', 'seconds', 'baseline_seconds', 'ratio', 'status'}, ...] with ratio = seconds / baseline_seconds.
+    """
+
+    key = lambda result: (result['benchmark'], json.dumps(result['params'], sort_keys=True))
+    baseline_results = {key(result): result for result in baseline['results']}
+
+    comparison = []
+
+    for result in results['results']:
+
+        base = baseline_results.get(key(result))
+
+        if base is None:
+            comparison.append({'benchmark': result['benchmark'], 'params': result['params'], 'seconds': result['seconds'],
+                               'baseline_seconds': None, 'ratio': None, 'status': 'new'})
+            continue
+
+        ratio = result['seconds'] / max(base['seconds'], 1e-12)
+
+        if ratio > 1 + threshold: status = 'slower'
+        elif ratio < 1 - threshold: status = 'faster'
+        else: status = 'same'
+
+        comparison.append({'benchmark': result['benchmark'], 'params': result['params'], 'seconds': result['seconds'],
+                           'baseline_seconds': base['seconds'], 'ratio': ratio, 'status': status})
+
+    return comparison
+
+
+def main(argv=None):
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m pyerualjetwork.benchmark', description='PyerualJetwork benchmark suite')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), help='benchmarks to run (default: all)')
+    parser.add_argument('--rows', nargs='+', type=int)
+    parser.add_argument('--features', nargs='+', type=int)
+    parser.add_argument('--classes', nargs='+', type=int)
+    parser.add_argument('--pop-size', nargs='+', type=int)
+    parser.add_argument('--activations', nargs='+', type=int, help='activation list lengths')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc peak measurement')
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare against results in this JSON file')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    parser.add_argument('--import-time', action='store_true', help='only measure cold import time')
+    parser.add_argument('--approximation', action='store_true', help='only measure speed and accuracy impact of approximate activations')
+
+    args = parser.parse_args(argv)
+
+    if args.import_time:
+        for target, result in import_time().items():
+            print(f"{target:<40} {result['seconds'] * 1000:8.1f} ms  loaded: {', '.join(result['loaded']) or '-'}")
+        return
+
+    if args.approximation:
+        for part, result in approximation_impact().items():
+            print(part, json.dumps(result, indent=2))
+        return
+
+    scales = {key: value for key, value in (('rows', args.rows), ('features', args.features), ('classes', args.classes),
+                                            ('pop_size', args.pop_size), ('activations', args.activations)) if value}
+
+    problems = _scale_problems(args.only or list(BENCHMARKS), {**DEFAULT_SCALES, **scales})
+    if problems: parser.error('; '.join(problems))
+
+    results = run_benchmarks(args.only, scales, repeat=args.repeat, memory=not args.no_memory)
+
+    if args.output: save_results(results, args.output)
+
+    if args.baseline:
+        for row in compare(results, load_results(args.baseline), threshold=args.threshold):
+            ratio = '-' if row['ratio'] is None else f"{row['ratio']:.2f}x"
+            print(f"{row['benchmark']:<28} {json.dumps(row['params']):<70} {row['seconds'] * 1000:10.2f} ms  {ratio:>7}  {row['status']}")
+
+    else:
+        for result in results['results']:
+            peak = '-' if result['peak_mb'] is None else f"{result['peak_mb']:.1f} MB"
+            print(f"{result['benchmark']:<28} {json.dumps(result['params']):<70} {result['seconds'] * 1000:10.2f} ms  {peak:>10}")
+
+
+if __name__ == '__main__':
+
+    main()
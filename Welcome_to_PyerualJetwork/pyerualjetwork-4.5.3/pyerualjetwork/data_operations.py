@@ -1,8 +1,11 @@
-from tqdm import tqdm
 import numpy as np
 from colorama import Fore, Style
 import sys
 import math
+import functools
+
+from .backend import get_array_module
+from .memory_operations import budget, track_stage
 
 def encode_one_hot(y_train, y_test=None, summary=False):
     """
@@ -59,7 +62,7 @@ def decode_one_hot(encoded_data):
     else: return np.argmax(encoded_data, axis=1)
 
 
-def split(X, y, test_size, random_state=42, dtype=np.float32):
+def split(X, y, test_size, random_state=42, dtype=np.float32, rng=None):
     """
     Splits the given X (features) and y (labels) data into training and testing subsets.
 
@@ -74,6 +77,8 @@ def split(X, y, test_size, random_state=42, dtype=np.float32):
         
         dtype (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16. [fp32 for balanced devices, fp64 for strong devices, fp16 for weak devices: not reccomended!]
 
+        rng (numpy.random.Generator, optional): Shuffles with this stream instead of reseeding the global numpy random state with random_state. Default: None
+
     Returns:
         tuple: x_train, x_test, y_train, y_test as ordered training and testing data subsets.
     """
@@ -89,11 +94,14 @@ def split(X, y, test_size, random_state=42, dtype=np.float32):
     else:
         raise ValueError("test_size should be float or int.")
 
-    if random_state is not None:
-        np.random.seed(random_state)
+    if rng is None:
+        if random_state is not None:
+            np.random.seed(random_state)
+
+        rng = np.random
 
     indices = np.arange(num_samples)
-    np.random.shuffle(indices)
+    rng.shuffle(indices)
 
     test_indices = indices[:test_size]
     train_indices = indices[test_size:]
@@ -106,7 +114,7 @@ def split(X, y, test_size, random_state=42, dtype=np.float32):
     return x_train, x_test, y_train, y_test
 
 
-def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32):
+def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32, rng=None):
     """
     Generates synthetic examples to balance classes to the specified number of examples per class.
 
@@ -122,14 +130,18 @@ def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32
 
         shuffle_in_cpu (bool): If True, output will be same cpu's manuel_balancer function. Default: False. (Use this for direct comparison of cpu training.)
 
+        rng (numpy.random.Generator, optional): Random stream of the sampling. Default: None (global numpy random state)
+
     Returns:
         x_balanced -- Balanced input dataset (numpy array format)
         y_balanced -- Balanced class labels (one-hot encoded, numpy array format)
     """
+    from tqdm import tqdm
     from .ui import loading_bars, get_loading_bar_style
     from .memory_operations import transfer_to_cpu
     
     x_train = transfer_to_cpu(x_train, dtype=dtype)
+    rng = np.random if rng is None else rng
 
     bar_format = loading_bars()[0]
     classes = np.arange(y_train.shape[1])
@@ -145,7 +157,7 @@ def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32
         
         if num_samples > target_samples_per_class:
       
-            selected_indices = np.random.choice(class_indices, target_samples_per_class, replace=False)
+            selected_indices = rng.choice(class_indices, target_samples_per_class, replace=False)
             x_balanced.append(x_train[selected_indices])
             y_balanced.append(y_train[selected_indices])
             
@@ -162,12 +174,12 @@ def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32
                 
                 for i in range(samples_to_add):
 
-                    random_indices = np.random.choice(class_indices, 2, replace=False)
+                    random_indices = rng.choice(class_indices, 2, replace=False)
                     sample1 = x_train[random_indices[0]]
                     sample2 = x_train[random_indices[1]]
 
                     
-                    synthetic_sample = sample1 + (sample2 - sample1) * np.random.rand()
+                    synthetic_sample = sample1 + (sample2 - sample1) * rng.random()
 
                     additional_samples[i] = synthetic_sample
                     additional_labels[i] = y_train[class_indices[0]]
@@ -184,7 +196,7 @@ def manuel_balancer(x_train, y_train, target_samples_per_class, dtype=np.float32
     return x_balanced, y_balanced
 
 
-def auto_balancer(x_train, y_train, dtype=np.float32):
+def auto_balancer(x_train, y_train, dtype=np.float32, rng=None):
 
     """
     Function to balance (to min) the training data across different classes.
@@ -198,13 +210,17 @@ def auto_balancer(x_train, y_train, dtype=np.float32):
 
         shuffle_in_cpu (bool): If True, output will be same cpu's auto_balancer function. Default: False. (Use this for direct comparison of cpu training.)
 
+        rng (numpy.random.Generator, optional): Random stream of the sampling. Default: None (global numpy random state)
+
     Returns:
         tuple: A tuple containing balanced input data and labels.
     """
+    from tqdm import tqdm
     from .ui import loading_bars, get_loading_bar_style
     from .memory_operations import transfer_to_cpu
     
     x_train = transfer_to_cpu(x_train, dtype=dtype)
+    rng = np.random if rng is None else rng
 
     bar_format = loading_bars()[0]
     classes = np.arange(y_train.shape[1])
@@ -225,7 +241,7 @@ def auto_balancer(x_train, y_train, dtype=np.float32):
         for i in tqdm(range(class_count),leave=False, ascii=get_loading_bar_style(),
             bar_format= bar_format, desc='Balancing Data',ncols=70):
             if len(ClassIndices[i]) > MinCount:
-                SelectedIndices = np.random.choice(
+                SelectedIndices = rng.choice(
                     ClassIndices[i], MinCount, replace=False)
             else:
                 SelectedIndices = ClassIndices[i]
@@ -234,7 +250,7 @@ def auto_balancer(x_train, y_train, dtype=np.float32):
         BalancedInputs = [x_train[idx] for idx in BalancedIndices]
         BalancedLabels = [y_train[idx] for idx in BalancedIndices]
 
-        permutation = np.random.permutation(len(BalancedInputs))
+        permutation = rng.permutation(len(BalancedInputs))
         BalancedInputs = np.array(BalancedInputs)[permutation]
         BalancedLabels = np.array(BalancedLabels)[permutation]
 
@@ -252,9 +268,11 @@ def auto_balancer(x_train, y_train, dtype=np.float32):
     return BalancedInputs, BalancedLabels
 
 
-def synthetic_augmentation(x, y, dtype=np.float32):
+@track_stage('synthetic_augmentation')
+def synthetic_augmentation(x, y, dtype=np.float32, rng=None):
     """
     Generates synthetic examples to balance classes with fewer examples using numpy.
+    Synthetic samples are computed in row chunks sized by memory_operations.budget.
     Args:
         x_train: numpy array format
 
@@ -264,13 +282,17 @@ def synthetic_augmentation(x, y, dtype=np.float32):
         
         shuffle_in_cpu (bool): If True, output will be same cpu's synthetic_augmentation function. Default: False. (Use this for direct comparison of cpu training.)
 
+        rng (numpy.random.Generator, optional): Random stream of the sampling. Default: None (global numpy random state)
+
     Returns:
         x_train_balanced, y_train_balanced (numpy array format)
     """
+    from tqdm import tqdm
     from .ui import loading_bars, get_loading_bar_style
     from .memory_operations import transfer_to_cpu
     
     x = transfer_to_cpu(x, dtype=dtype)
+    rng = np.random if rng is None else rng
 
     bar_format = loading_bars()[0]
     classes = np.arange(y.shape[1])
@@ -282,43 +304,71 @@ def synthetic_augmentation(x, y, dtype=np.float32):
 
     max_class_count = max(class_distribution.values())
 
-    x_balanced = list(x)
-    y_balanced = list(y)
+    labels = np.argmax(y, axis=1)
+    total_samples = len(x) + sum(max_class_count - count for count in class_distribution.values())
+
+    x_balanced = np.empty((total_samples,) + x.shape[1:], dtype=dtype)
+    y_balanced = np.empty((total_samples,) + y.shape[1:], dtype=y.dtype)
+
+    x_balanced[:len(x)] = x
+    y_balanced[:len(y)] = y
 
+    position = len(x)
+    rows = budget.chunk_rows(x[0].nbytes, copies=3) # sample1, sample2 - sample1, synthetic sample
 
     for class_label in tqdm(range(class_count), leave=False, ascii=get_loading_bar_style(),
             bar_format=bar_format,desc='Augmenting Data',ncols= 52):
-        class_indices = [i for i, label in enumerate(
-            y) if np.argmax(label) == class_label]
-        num_samples = len(class_indices)
+        class_indices = np.flatnonzero(labels == class_label)
+        missing = max_class_count - len(class_indices)
 
-        if num_samples < max_class_count:
-            while num_samples < max_class_count:
+        for start in range(0, missing, rows):
 
-                random_indices = np.random.choice(
-                    class_indices, 2, replace=False)
-                sample1 = x[random_indices[0]]
-                sample2 = x[random_indices[1]]
+            count = min(rows, missing - start)
+            random_indices = np.empty((count, 2), dtype=np.intp)
+            ratios = np.empty(count)
 
-                synthetic_sample = sample1 + \
-                    (np.array(sample2) - np.array(sample1)) * np.random.rand()
+            # Same random draws, in the same order, as one sample at a time
+            for i in range(count):
+                random_indices[i] = rng.choice(class_indices, 2, replace=False)
+                ratios[i] = rng.random()
 
-                x_balanced.append(synthetic_sample.tolist())
-                y_balanced.append(y[class_indices[0]])
+            sample1 = x[random_indices[:, 0]]
+            sample2 = x[random_indices[:, 1]]
 
-                num_samples += 1
+            x_balanced[position:position + count] = sample1 + (sample2 - sample1) * ratios.astype(x.dtype)[:, None]
+            y_balanced[position:position + count] = y[class_indices[0]]
 
-    x_balanced = np.array(x_balanced).astype(dtype, copy=False)
-    y_balanced = np.array(y_balanced).astype(dtype=y.dtype, copy=False)
+            position += count
     
     del x, y
 
     return x_balanced, y_balanced
 
 
+def _standardize(x, mean, std):
+    """
+    (x - mean) / std with NaN set to 0, computed in row chunks sized by memory_operations.budget.
+    """
+    if x.ndim < 2:
+        return np.nan_to_num((x - mean) / std, nan=0)
+
+    scaled = np.empty(x.shape, dtype=np.result_type(x, mean, std))
+    rows = budget.chunk_rows(x[0].nbytes, copies=2, n_rows=len(x))
+
+    for start in range(0, len(x), rows):
+        chunk = scaled[start:start + rows]
+        np.subtract(x[start:start + rows], mean, out=chunk)
+        np.divide(chunk, std, out=chunk)
+        np.nan_to_num(chunk, nan=0, copy=False)
+
+    return scaled
+
+
+@track_stage('standard_scaler')
 def standard_scaler(x_train=None, x_test=None, scaler_params=None, dtype=np.float32):
     """
     Standardizes training and test datasets. x_test may be None.
+    Scaling runs in row chunks sized by memory_operations.budget.
 
     Args:
         x_train (numpy.ndarray): 
@@ -339,11 +389,8 @@ def standard_scaler(x_train=None, x_test=None, scaler_params=None, dtype=np.floa
         mean = np.mean(x_train, axis=0)
         std = np.std(x_train, axis=0)
         
-        train_data_scaled = (x_train - mean) / std
-        test_data_scaled = (x_test - mean) / std
-
-        train_data_scaled = np.nan_to_num(train_data_scaled, nan=0)
-        test_data_scaled = np.nan_to_num(test_data_scaled, nan=0)
+        train_data_scaled = _standardize(x_train, mean, std)
+        test_data_scaled = _standardize(x_test, mean, std)
 
         scaler_params = [mean, std]
 
@@ -354,10 +401,144 @@ def standard_scaler(x_train=None, x_test=None, scaler_params=None, dtype=np.floa
             
     if scaler_params is not None:
         x_test = x_test.astype(dtype, copy=False)
-        scaled_data = (x_test - scaler_params[0]) / scaler_params[1]
-        scaled_data = np.nan_to_num(scaled_data, nan=0)
+        scaled_data = _standardize(x_test, scaler_params[0], scaler_params[1])
 
         return scaled_data  # sample data scaled
+
+
+@track_stage('pca_reduction')
+def pca_reduction(x_train=None, x_test=None, pca_params=None, n_components=None, method='auto', dtype=np.float32):
+    """
+    Reduces the input width with PCA before plan.fit, like standard_scaler: the axes are found on x_train and
+    applied to x_test (and later to prediction samples) with the returned pca_params.
+    Large (or scipy.sparse) inputs use randomized PCA streamed over row chunks, see metrics.pca_fit.
+
+    Args:
+        x_train (numpy.ndarray): (optional when pca_params given)
+
+        x_test (numpy.ndarray): (optional)
+
+        pca_params (list): [mean, components] (optional for using model)
+
+        n_components (int): Output width. Required when fitting.
+
+        method (str): 'auto', 'full' or 'randomized'. See metrics.pca_fit. Default: 'auto'
+
+        dtype (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16.
+
+    Returns:
+        PCA parameters, reduced training (and if test given) datasets. (tuple)
+        Only the reduced x_test when pca_params is given.
+    """
+    from .metrics import pca_fit, pca_transform
+
+    if pca_params is not None:
+        return pca_transform(x_test, pca_params).astype(dtype, copy=False)
+
+    if x_train is None or n_components is None:
+        raise ValueError('x_train and n_components are required when pca_params is not given')
+
+    pca_params = pca_fit(x_train, n_components, method=method)
+    x_train_reduced = pca_transform(x_train, pca_params).astype(dtype, copy=False)
+
+    if x_test is None:
+        return pca_params, x_train_reduced
+
+    return pca_params, x_train_reduced, pca_transform(x_test, pca_params).astype(dtype, copy=False)
+
+
+@functools.lru_cache(maxsize=8)
+def _projection_matrix(method, n_features, n_components, random_state):
+    """
+    Transposed (n_components, n_features) scipy.sparse projection matrix, rebuilt from its parameters.
+    """
+    from scipy import sparse
+
+    rng = np.random.default_rng(random_state)
+
+    if method == 'hashing': # every feature goes to one signed bucket
+        buckets = rng.integers(0, n_components, n_features)
+        signs = rng.choice(np.array([-1.0, 1.0]), n_features)
+        return sparse.csr_matrix((signs, (buckets, np.arange(n_features))), shape=(n_components, n_features))
+
+    if method == 'sparse': # very sparse random projection, density 1 / sqrt(n_features)
+        density = 1 / math.sqrt(n_features)
+        nnz = rng.binomial(n_features, density, n_components)
+        cols = np.concatenate([rng.choice(n_features, k, replace=False) for k in nnz])
+        rows = np.repeat(np.arange(n_components), nnz)
+        values = rng.choice(np.array([-1.0, 1.0]), len(cols)) * math.sqrt(1 / density) / math.sqrt(n_components)
+        return sparse.csr_matrix((values, (rows, cols)), shape=(n_components, n_features))
+
+    raise ValueError("method must be 'sparse' or 'hashing'")
+
+
+def random_projection(x_train=None, x_test=None, projection_params=None, n_components=None, method='sparse', random_state=0, dtype=np.float32):
+    """
+    Shrinks the input width (and so the PLAN weight width) with a sparse random projection or feature hashing.
+    Works like standard_scaler: the returned projection_params are given to save_model and
+    predict_model_ssd / predict_model_ram apply the same projection (after standard scaling) at predict time.
+    projection_params only hold the method, widths and seed, the matrix itself is never stored.
+
+    Args:
+        x_train (numpy.ndarray): (optional when projection_params given). numpy, cupy or scipy.sparse
+
+        x_test (numpy.ndarray): (optional)
+
+        projection_params (dict): (optional for using model)
+
+        n_components (int): Output width. Required without projection_params.
+
+        method (str): 'sparse' (very sparse random projection, keeps distances) or 'hashing' (feature hashing, every input feature is added to one signed output column). Default: 'sparse'
+
+        random_state (int): Seed of the projection. Default: 0
+
+        dtype (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16.
+
+    Returns:
+        Projection parameters, projected training (and if test given) datasets. (tuple)
+        Only the projected x_test when projection_params is given.
+    """
+    if projection_params is None:
+
+        if x_train is None or n_components is None:
+            raise ValueError('x_train and n_components are required when projection_params is not given')
+
+        projection_params = {'method': method, 'n_features': int(x_train.shape[1]),
+                             'n_components': int(n_components), 'random_state': int(random_state)}
+
+        x_train = _project(x_train, projection_params, dtype)
+
+        if x_test is None:
+            return projection_params, x_train
+
+        return projection_params, x_train, _project(x_test, projection_params, dtype)
+
+    return _project(x_test, projection_params, dtype)
+
+
+def _project(x, projection_params, dtype):
+
+    xp = get_array_module(x)
+    single = x.ndim == 1
+    if single: x = x.reshape(1, -1)
+
+    if x.shape[1] != projection_params['n_features']:
+        raise ValueError(f"input has {x.shape[1]} features, the projection expects {projection_params['n_features']}")
+
+    R_T = _projection_matrix(projection_params['method'], projection_params['n_features'],
+                             projection_params['n_components'], projection_params['random_state']).astype(dtype)
+
+    if xp.__name__ == 'cupy':
+        from cupyx.scipy import sparse as cusparse
+        projected = (cusparse.csr_matrix(R_T) @ x.astype(dtype, copy=False).T).T
+
+    else:
+        projected = R_T @ (x.T if hasattr(x, 'tocsr') else np.asarray(x, dtype=dtype).T)
+        if hasattr(projected, 'toarray'): projected = projected.toarray()
+        projected = xp.asarray(projected.T)
+
+    projected = xp.ascontiguousarray(projected, dtype=dtype)
+    return projected.ravel() if single else projected
     
     
 def normalization(
@@ -374,7 +555,9 @@ dtype=np.float32):
         (num) Scaled input data after normalization.
     """
 
-    MaxAbs = np.max(np.abs(Input.astype(dtype, copy=False)))
+    xp = get_array_module(Input)
+
+    MaxAbs = xp.max(xp.abs(Input.astype(dtype, copy=False)))
     return (Input / MaxAbs)
 
 
@@ -394,7 +577,9 @@ def non_neg_normalization(
         (numpy) Scaled input data after normalization.
     """
 
-    MaxAbs = np.max(np.abs(Input.astype(dtype, copy=False)))
+    xp = get_array_module(Input)
+
+    MaxAbs = xp.max(xp.abs(Input.astype(dtype, copy=False)))
     return (Input + MaxAbs) / (2 * MaxAbs)
 
 
@@ -408,12 +593,13 @@ def find_closest_factors(a):
             return i, j
         
 
-def batcher(x_test, y_test, batch_size=1):
+def batcher(x_test, y_test, batch_size=1, rng=None):
 
     if batch_size == 1:
         return x_test, y_test
     
     y_labels = np.argmax(y_test, axis=1)
+    rng = np.random if rng is None else rng
 
     sampled_x, sampled_y = [], []
     
@@ -423,7 +609,7 @@ def batcher(x_test, y_test, batch_size=1):
         
         num_samples = int(len(class_indices) * batch_size)
         
-        sampled_indices = np.random.choice(class_indices, num_samples, replace=False)
+        sampled_indices = rng.choice(class_indices, num_samples, replace=False)
         
         sampled_x.append(x_test[sampled_indices])
         sampled_y.append(y_test[sampled_indices])
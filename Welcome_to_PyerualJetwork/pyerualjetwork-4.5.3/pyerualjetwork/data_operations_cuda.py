@@ -4,6 +4,8 @@ from colorama import Fore, Style
 import math
 import numpy as np
 
+from .data_operations import random_projection # shared, runs on the backend of its input
+
 def encode_one_hot(y_train, y_test=None, summary=False):
     """
     Performs one-hot encoding on y_train and y_test data.
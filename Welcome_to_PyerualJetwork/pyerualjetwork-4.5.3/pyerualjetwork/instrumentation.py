@@ -0,0 +1,274 @@
+"""
+
+INSTRUMENTATION MODULE FOR PYERUALJETWORK
+
+Low overhead stage timers and counters for the hot paths of plan.learner, plan.evaluate and planeat.evolver
+(batch sampling, activation application, matmul, softmax, loss, fitness, crossover, mutation ...).
+Nothing is recorded unless a Tracer is active, then every stage is one perf_counter pair.
+
+Example:
+    ```python
+    from pyerualjetwork import plan, planeat, instrumentation
+
+    tracer = instrumentation.Tracer(track_memory=True)
+    model = plan.learner(x_train, y_train, planeat.evolver, gen=10, tracer=tracer)
+
+    tracer.summary()                         # dict: totals per stage, per generation timings and counters
+    tracer.to_jsonl('run.jsonl')             # one JSON event per line
+    tracer.to_chrome_trace('run.trace.json') # open in chrome://tracing or https://ui.perfetto.dev
+
+    with instrumentation.tracing(tracer):    # any other code
+        planeat.evolver(weights, activations, 0, fitness)
+    ```
+
+@author: Hasan Can Beydili
+@YouTube: https://www.youtube.com/@HasanCanBeydili
+@Linkedin: https://www.linkedin.com/in/hasan-can-beydili-77a1b9270/
+@Instagram: https://www.instagram.com/canbeydilj/
+@contact: tchasancan@gmail.com
+"""
+
+import os
+import json
+import time
+import threading
+import contextlib
+
+_active = None
+_null_stage = contextlib.nullcontext()
+
+
+class _Stage:
+
+    __slots__ = ('tracer', 'name', 'start')
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.tracer._record(self.name, self.start, time.perf_counter() - self.start)
+
+
+class Tracer:
+    """
+    Collects stage timings, counters and (optionally) allocated bytes per generation.
+
+    Args:
+        callbacks (list, optional): Functions called with every event dict (stage end and generation end). Default: None
+
+        keep_events (bool, optional): Keeps every stage event for to_jsonl and to_chrome_trace. Totals are kept either way. Default: True
+
+        track_memory (bool, optional): Records the peak traced (python and numpy) allocation of each generation with tracemalloc. This slows allocation heavy code. Default: False
+    """
+
+    def __init__(self, callbacks=None, keep_events=True, track_memory=False):
+        self.callbacks = list(callbacks or [])
+        self.keep_events = keep_events
+        self.track_memory = track_memory
+        self.reset()
+
+    def reset(self):
+        self.events = []
+        self.stages = {}
+        self.counters = {}
+        self.generations = []
+        self.generation = None
+        self._generation_start = None
+        self._generation_stages = {}
+        self._generation_counters = {}
+        self._origin = time.perf_counter()
+
+    def stage(self, name):
+        """
+        Context manager timing a block as stage `name`.
+        """
+        return _Stage(self, name)
+
+    def count(self, name, n=1):
+        """
+        Adds n to counter `name` (for example 'evaluations', 'cache_hits').
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+        self._generation_counters[name] = self._generation_counters.get(name, 0) + n
+
+    def start_generation(self, generation):
+
+        self.generation = generation
+        self._generation_stages = {}
+        self._generation_counters = {}
+        self._generation_start = time.perf_counter()
+
+        if self.track_memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing(): tracemalloc.start()
+            tracemalloc.reset_peak()
+
+    def end_generation(self):
+
+        if self._generation_start is None: return
+
+        end = time.perf_counter()
+
+        event = {'type': 'generation', 'generation': self.generation, 'start': self._generation_start - self._origin,
+                 'seconds': end - self._generation_start, 'stages': self._generation_stages, 'counters': self._generation_counters}
+
+        if self.track_memory:
+            import tracemalloc
+            event['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+
+        self.generations.append(event)
+        self._generation_start = None
+
+        for callback in self.callbacks: callback(event)
+
+    def stop(self):
+        """
+        Ends the open generation and stops tracemalloc if track_memory started it.
+        """
+        self.end_generation()
+
+        if self.track_memory:
+            import tracemalloc
+            tracemalloc.stop()
+
+    def _record(self, name, start, seconds):
+
+        total = self.stages.get(name)
+        if total is None: self.stages[name] = total = [0, 0.0, 0.0]
+
+        total[0] += 1
+        total[1] += seconds
+        if seconds > total[2]: total[2] = seconds
+
+        self._generation_stages[name] = self._generation_stages.get(name, 0.0) + seconds
+
+        if self.keep_events or self.callbacks:
+            event = {'type': 'stage', 'name': name, 'start': start - self._origin, 'seconds': seconds,
+                     'generation': self.generation, 'thread': threading.get_ident()}
+
+            if self.keep_events: self.events.append(event)
+            for callback in self.callbacks: callback(event)
+
+    def summary(self):
+        """
+        Returns:
+            dict: {'stages': {name: {'count', 'total', 'mean', 'max'}}, 'counters': {...}, 'generations': [...]}
+        """
+        stages = {name: {'count': count, 'total': total, 'mean': total / count, 'max': longest}
+                  for name, (count, total, longest) in self.stages.items()}
+
+        return {'stages': stages, 'counters': dict(self.counters), 'generations': list(self.generations)}
+
+    def to_dict(self):
+        return self.summary()
+
+    def to_jsonl(self, path):
+        """
+        Writes stage and generation events as JSON lines.
+        """
+        with open(path, 'w') as f:
+            for event in sorted(self.events + self.generations, key=lambda event: event['start']):
+                f.write(json.dumps(event) + '\n')
+
+    def to_chrome_trace(self, path):
+        """
+        Writes a Chrome trace event file (chrome://tracing, Perfetto). Stages are complete events,
+        generations are events on their own track and counters are counter events at generation ends.
+        """
+        pid = os.getpid()
+        trace = []
+
+        for event in self.events:
+            trace.append({'name': event['name'], 'ph': 'X', 'pid': pid, 'tid': event['thread'],
+                          'ts': event['start'] * 1e6, 'dur': event['seconds'] * 1e6, 'args': {'generation': event['generation']}})
+
+        for event in self.generations:
+            trace.append({'name': f"generation {event['generation']}", 'ph': 'X', 'pid': pid, 'tid': 0,
+                          'ts': event['start'] * 1e6, 'dur': event['seconds'] * 1e6, 'args': event['counters']})
+
+            counters = dict(event['counters'])
+            if 'peak_bytes' in event: counters['peak_bytes'] = event['peak_bytes']
+
+            if counters:
+                trace.append({'name': 'counters', 'ph': 'C', 'pid': pid, 'ts': (event['start'] + event['seconds']) * 1e6, 'args': counters})
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+
+
+def get_tracer():
+    """
+    Returns the active Tracer or None.
+    """
+    return _active
+
+
+@contextlib.contextmanager
+def tracing(tracer):
+    """
+    Makes tracer the active Tracer inside the block. tracing(None) runs the block untraced.
+    """
+    global _active
+
+    previous = _active
+    _active = tracer
+
+    try:
+        yield tracer
+    finally:
+        _active = previous
+
+
+def stage(name):
+    """
+    Times a block as stage `name` on the active Tracer. Without an active Tracer it returns a shared no-op context.
+    """
+    return _null_stage if _active is None else _Stage(_active, name)
+
+
+def count(name, n=1):
+    """
+    Adds n to counter `name` of the active Tracer, if any.
+    """
+    if _active is not None: _active.count(name, n)
+
+
+def start_generation(generation):
+    """
+    Starts generation `generation` on the active Tracer, if any.
+    """
+    if _active is not None: _active.start_generation(generation)
+
+
+def end_generation():
+    """
+    Ends the open generation of the active Tracer, if any.
+    """
+    if _active is not None: _active.end_generation()
+
+
+def traced(func):
+    """
+    Decorator for functions with a `tracer` argument: the given Tracer is active while the function runs and
+    is stopped when it returns. Without a tracer argument an outer active Tracer (tracing block) is kept.
+    """
+    import functools
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+
+        tracer = kwargs.get('tracer')
+        if tracer is None: return func(*args, **kwargs)
+
+        with tracing(tracer):
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.stop()
+
+    return wrapper
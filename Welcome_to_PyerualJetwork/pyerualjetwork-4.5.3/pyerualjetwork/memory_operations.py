@@ -1,16 +1,73 @@
 import psutil
 import numpy as np
-import cupy as cp
 import logging
+import time
+import threading
+import functools
+import contextlib
+
+from . import instrumentation
+
+def get_cgroup_memory_limit():
+    """
+    The function `get_cgroup_memory_limit` reads the memory limit of the container (cgroup v2 or v1).
+    :return: The limit in bytes, or None when the process is not limited (or not in a container).
+    """
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except (OSError, ValueError):
+            continue
+
+        if value == 'max': return None
+
+        value = int(value)
+        return value if value < psutil.virtual_memory().total else None # cgroup v1 reports "unlimited" as a huge number
+
+    return None
+
+def get_cgroup_memory_usage():
+    """
+    The function `get_cgroup_memory_usage` reads the working set of the container: used memory minus inactive
+    page cache, which is what the OOM killer compares against the limit.
+    :return: Working set in bytes, or None when it can't be read.
+    """
+    for usage_path, stat_path, key in (('/sys/fs/cgroup/memory.current', '/sys/fs/cgroup/memory.stat', 'inactive_file'),
+                                       ('/sys/fs/cgroup/memory/memory.usage_in_bytes', '/sys/fs/cgroup/memory/memory.stat', 'total_inactive_file')):
+        try:
+            with open(usage_path) as f:
+                usage = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+
+        try:
+            with open(stat_path) as f:
+                stats = dict(line.split() for line in f if len(line.split()) == 2)
+            usage -= int(stats.get(key, 0))
+        except (OSError, ValueError):
+            pass
+
+        return max(usage, 0)
+
+    return None
 
 def get_available_cpu_memory():
     """
-    The function `get_available_memory` returns the amount of available memory in the system using the
-    `psutil` library.
+    The function `get_available_memory` returns the amount of available memory using the `psutil` library.
+    Inside a container with a memory limit, the room left under the cgroup limit is returned when it is smaller.
     :return: The function `get_available_memory()` returns the amount of available memory in bytes on
     the system.
     """
-    return psutil.virtual_memory().available
+    available = psutil.virtual_memory().available
+
+    limit = get_cgroup_memory_limit()
+    if limit is not None:
+        usage = get_cgroup_memory_usage()
+        if usage is None: usage = psutil.Process().memory_info().rss
+        available = min(available, max(limit - usage, 0))
+
+    return available
 
 def get_optimal_batch_size_for_cpu(x, data_size_bytes, available_memory):
     """
@@ -32,7 +89,7 @@ def get_optimal_batch_size_for_cpu(x, data_size_bytes, available_memory):
 def transfer_to_cpu(x, dtype=np.float32):
     """
     The `transfer_to_cpu` function converts data to a specified data type on the CPU, handling memory constraints
-    by batching the conversion process and ensuring complete GPU memory cleanup.
+    by batching the conversion process. Large arrays are copied through the double buffered pinned pipeline (iter_to_host).
    
     :param x: Input data to transfer to CPU (CuPy array)
     
@@ -40,29 +97,19 @@ def transfer_to_cpu(x, dtype=np.float32):
     
     :return: NumPy array with the specified dtype
     """
-    from .ui import loading_bars, initialize_loading_bar
     try:
         if isinstance(x, np.ndarray):
             return x.astype(dtype) if x.dtype != dtype else x
 
-        x = x.astype(dtype=dtype, copy=False)
+        import cupy as cp
+        from .ui import loading_bars, initialize_loading_bar
         
-        data_size = x.nbytes
+        data_size = x.size * np.dtype(dtype).itemsize
         available_memory = get_available_cpu_memory()
         logging.debug(f"Data size: {data_size/1e6:.2f}MB, Available memory: {available_memory/1e6:.2f}MB")
         
-        pool = cp.get_default_memory_pool()
-        pinned_mempool = cp.cuda.PinnedMemoryPool()
-        
         if data_size <= available_memory * 0.25:
-            try:
-                final_result = np.array(x.get(), dtype=dtype, copy=False)
-            finally:
-                del x
-                pool.free_all_blocks()
-                pinned_mempool.free_all_blocks()
-                cp.cuda.runtime.deviceSynchronize()
-            return final_result
+            return np.array(x.astype(dtype=dtype, copy=False).get(), dtype=dtype, copy=False)
         
         batch_size = max(get_optimal_batch_size_for_cpu(x, data_size, available_memory), 1)
         total_batches = (len(x) + batch_size - 1) // batch_size
@@ -75,49 +122,16 @@ def transfer_to_cpu(x, dtype=np.float32):
         )
         logging.debug(f"Using batch size: {batch_size}")
         
-        try:
-            sample_chunk = x[0:1]
-            sample_array = np.array(sample_chunk.get(), dtype=dtype)
-            chunk_shape = sample_array.shape[1:] if len(sample_array.shape) > 1 else ()
-            total_shape = (len(x),) + chunk_shape
-        finally:
-            del sample_array
-            del sample_chunk
-            pool.free_all_blocks()
-            pinned_mempool.free_all_blocks()
+        chunks = np.empty(x.shape, dtype=dtype)
         
-        chunks = np.empty(total_shape, dtype=dtype)
-        
-        try:
-            for i in range(0, len(x), batch_size):
-                try:
-                    end_idx = min(i + batch_size, len(x))
-                    chunk = x[i:end_idx]
-                    chunks[i:end_idx] = chunk.get().astype(dtype=dtype)
-                finally:
-                    del chunk
-                    pool.free_all_blocks()
-                    pinned_mempool.free_all_blocks()
-                    cp.cuda.runtime.deviceSynchronize()
-                
-                loading_bar.update(1)
-        finally:
-            del x
-            pool.free_all_blocks()
-            pinned_mempool.free_all_blocks()
-            cp.cuda.runtime.deviceSynchronize()
+        for start, chunk in iter_to_host(x, batch_size=batch_size, dtype=dtype, xp=cp):
+            chunks[start:start + len(chunk)] = chunk
+            loading_bar.update(1)
         
         return chunks
         
     except Exception as e:
         logging.error(f"Error in transfer_to_cpu: {str(e)}")
-        if 'x' in locals():
-            del x
-        if 'pool' in locals():
-            pool.free_all_blocks()
-        if 'pinned_mempool' in locals():
-            pinned_mempool.free_all_blocks()
-        cp.cuda.runtime.deviceSynchronize()
         raise
 
 def get_optimal_batch_size_for_gpu(x, data_size_bytes):
@@ -128,6 +142,8 @@ def get_optimal_batch_size_for_gpu(x, data_size_bytes):
     :param data_size_bytes: The `data_size_bytes` parameter represents the total size of the data in bytes that you want to process on the GPU. This could be the size of a single batch of data or the total size of the dataset, depending on how you are structuring your computations
     :return: the optimal batch size that can be used for processing the given data on the GPU, based on the available free memory on the GPU and the size of the data elements.
     """
+    import cupy as cp
+
     free_memory = cp.get_default_memory_pool().free_bytes()
     device_memory = cp.cuda.runtime.memGetInfo()[0]
     safe_memory = min(free_memory, device_memory) * 0.25
@@ -136,10 +152,10 @@ def get_optimal_batch_size_for_gpu(x, data_size_bytes):
     return int(safe_memory / (element_size * 2))
 
 
-def transfer_to_gpu(x, dtype=cp.float32):
+def transfer_to_gpu(x, dtype=np.float32):
     """
     The `transfer_to_gpu` function in Python converts input data to GPU arrays, optimizing memory usage by
-    batching and handling out-of-memory errors.
+    batching. Large arrays are copied through the double buffered pinned pipeline (iter_to_device).
     
     :param x: The `x` parameter in the `transfer_to_gpu` function is the input data that you want to transfer to the GPU for processing. It can be either a NumPy array or a CuPy array. If it's a NumPy array, the function will convert it to a CuPy array and
     
@@ -147,14 +163,14 @@ def transfer_to_gpu(x, dtype=cp.float32):
     
     :return: The `transfer_to_gpu` function returns the input data `x` converted to a GPU array of type `dtype` (default is `cp.float32`). If the input `x` is already a GPU array with the same dtype, it returns `x` as is. If the data size of `x` exceeds 25% of the free GPU memory, it processes the data in batches to
     """
+    import cupy as cp
     from .ui import loading_bars, initialize_loading_bar
     try:
         if isinstance(x, cp.ndarray):
             return x.astype(dtype) if x.dtype != dtype else x
             
-        x = x.astype(dtype=dtype, copy=False)
-        data_size = x.nbytes
-        pinned_mempool = cp.cuda.PinnedMemoryPool()
+        x = np.asarray(x)
+        data_size = x.size * np.dtype(dtype).itemsize
         free_gpu_memory = cp.cuda.runtime.memGetInfo()[0]
         logging.debug(f"Data size: {data_size/1e6:.2f}MB, Free GPU memory: {free_gpu_memory/1e6:.2f}MB")
 
@@ -162,70 +178,257 @@ def transfer_to_gpu(x, dtype=cp.float32):
             new_x = cp.array(x, dtype=dtype, copy=False)
             return new_x
             
-        batch_size = get_optimal_batch_size_for_gpu(x, data_size)
-        if batch_size == 0: batch_size = 1
+        batch_size = max(get_optimal_batch_size_for_gpu(x, data_size), 1)
+        total_batches = (len(x) + batch_size - 1) // batch_size
 
-        loading_bar = initialize_loading_bar(total=len(x)/batch_size, desc='Transfering to GPU mem', ncols=70, bar_format=loading_bars()[0], leave=False)
+        loading_bar = initialize_loading_bar(total=total_batches, desc='Transfering to GPU mem', ncols=70, bar_format=loading_bars()[0], leave=False)
         
         logging.debug(f"Using batch size: {batch_size}")
-        current_threshold = 0.75
-        total_batches = (len(x) + batch_size - 1) // batch_size
 
-        sample_chunk = x[0:1]
-        sample_array = cp.array(sample_chunk, dtype=dtype)
-        chunk_shape = sample_array.shape[1:] if len(sample_array.shape) > 1 else ()
-        del sample_array
-        del sample_chunk
-        if chunk_shape:
-            total_shape = (len(x),) + chunk_shape
-        else:
-            total_shape = (len(x),)
-        
-        del chunk_shape
-        chunks = cp.empty(total_shape, dtype=dtype)
-        del total_shape
-
-        for i in range(0, len(x), batch_size):
-            try:
-                chunk = x[i:i + batch_size]
-                chunk = cp.array(chunk, dtype=dtype)
-                chunks[i // batch_size] = chunk
-                del chunk
-                pinned_mempool.free_all_blocks()
-
-                if i > 0 and i % (batch_size * 5) == 0:
-                    pool = cp.get_default_memory_pool()
-                    current_threshold = adjust_gpu_memory_threshold(pool, free_gpu_memory, current_threshold)
-                    if pool.used_bytes() > cp.cuda.runtime.memGetInfo()[0] * current_threshold:
-                        pool.free_all_blocks()
-                    
-                    
-                loading_bar.update(1)
-                    
-            except cp.cuda.memory.OutOfMemoryError:
-                logging.error(f"GPU out of memory at batch {i//batch_size + 1}/{total_batches}")
-                cp.get_default_memory_pool().free_all_blocks()
-                batch_size = max(batch_size // 2, 1)
-                continue
-                
-            except Exception as e:
-                logging.error(f"Error processing batch {i//batch_size + 1}/{total_batches}: {str(e)}")
-                raise
-                
-        try:
-            del x
-            cp.get_default_memory_pool().free_all_blocks()
-            pinned_mempool.free_all_blocks()
-            return chunks
-            
-        except Exception as e:
-            logging.error(f"Error concatenating results: {str(e)}")
-            raise
+        chunks = cp.empty(x.shape, dtype=dtype)
+
+        start = 0
+        for chunk in iter_to_device(x, batch_size=batch_size, dtype=dtype, xp=cp):
+            chunks[start:start + len(chunk)] = chunk
+            start += len(chunk)
+            loading_bar.update(1)
+
+        return chunks
             
     except Exception as e:
         logging.error(f"Error in transfer_to_gpu: {str(e)}")
         raise
 
+
+# TRANSFER PIPELINE -----
+
+PIPELINE_CHUNK_BYTES = 64 * 1024 * 1024 # default chunk size of the transfer pipeline (64 MB per array)
+
+_pinned_buffers = {} # device module name -> free (pinned memory, nbytes) buffers
+_pinned_lock = threading.Lock()
+
+class PinnedStaging:
+    """
+    Page-locked host buffers of one transfer. They are taken from the persistent pinned pool and given back by
+    release(), so transfers running at the same time never share a buffer, and later transfers reuse the
+    buffers without allocating pinned memory again.
+
+    Args:
+        xp: Device module (cupy or backend.emulated). Default: cupy
+    """
+
+    def __init__(self, xp=None):
+        if xp is None: import cupy as xp
+
+        self.xp = xp
+        self._pool_key = getattr(xp, '__name__', id(xp))
+        self._held = {}
+
+    def get(self, key, shape, dtype):
+        """
+        :param key: Buffer identifier inside this transfer. The transfer pipeline uses (direction, slot, array index).
+        :param shape: Shape of the returned array.
+        :param dtype: dtype of the returned array.
+        :return: numpy array viewing a pinned buffer held by this transfer. Contents are undefined.
+        """
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        nbytes = max(count * dtype.itemsize, 1)
+
+        buffer = self._held.get(key)
+
+        if buffer is None or buffer[1] < nbytes:
+            if buffer is not None: self._give_back([buffer])
+            buffer = self._held[key] = self._take(nbytes)
+        else:
+            instrumentation.count('cache_hits')
+
+        return np.frombuffer(buffer[0], dtype, count).reshape(shape)
+
+    def release(self):
+        """
+        Gives the buffers back to the pool. Arrays returned by get must not be used after it.
+        """
+        self._give_back(self._held.values())
+        self._held = {}
+
+    def _take(self, nbytes):
+
+        with _pinned_lock:
+            free = _pinned_buffers.setdefault(self._pool_key, [])
+            fitting = [buffer for buffer in free if buffer[1] >= nbytes]
+
+            if fitting:
+                buffer = min(fitting, key=lambda buffer: buffer[1])
+                free.remove(buffer)
+                instrumentation.count('cache_hits')
+                return buffer
+
+        instrumentation.count('cache_misses')
+        instrumentation.count('bytes_allocated', nbytes)
+
+        return (self.xp.cuda.alloc_pinned_memory(nbytes), nbytes)
+
+    def _give_back(self, buffers):
+
+        with _pinned_lock:
+            _pinned_buffers.setdefault(self._pool_key, []).extend(buffers)
+
+def release_pinned_buffers():
+    """
+    Frees the pinned buffers of the pool that no running transfer holds.
+    """
+    with _pinned_lock:
+        _pinned_buffers.clear()
+
+def _pipeline_batch_size(arrays, dtypes):
+
+    row_bytes = max(sum(int(np.prod(a.shape[1:])) * np.dtype(dt).itemsize for a, dt in zip(arrays, dtypes)), 1)
+    return max(PIPELINE_CHUNK_BYTES * len(arrays) // row_bytes, 1)
+
+def iter_to_device(*arrays, batch_size=None, dtype=None, xp=None):
+    """
+    Streams host arrays to the device chunk by chunk. Two pinned staging buffers and two copy streams are
+    used in turn (double buffering): while a chunk is consumed, the next one is already being copied.
+
+    Chunks live in reused device buffers and are valid until the next iteration, copy them to keep them.
+    The pinned buffers are held by this iterator until it's exhausted or closed.
+    They can be passed directly to plan.fit and plan.evaluate.
+
+    :param arrays: Host arrays with the same number of rows. For example: x_train, y_train
+    :param batch_size: Rows per chunk. Default: as many rows as fit in 64 MB per array.
+    :param dtype: dtype of the device chunks. None keeps the dtype of each array, a list sets them per array. Default: None
+    :param xp: Device module (cupy or backend.emulated). Default: cupy
+    :return: Generator of device chunks. A tuple of chunks (one per array) when more than one array is given.
+
+    Example:
+        ```python
+        chunks = memory_operations.iter_to_device(x_train, y_train, batch_size=4096, dtype=[cp.float32, None])
+        W = plan.fit(chunks)
+        ```
+    """
+    if xp is None: import cupy as xp
+
+    arrays = [np.asarray(a) for a in arrays]
+
+    if len({len(a) for a in arrays}) > 1: raise ValueError("arrays must have the same length.")
+
+    dtypes = dtype if isinstance(dtype, (list, tuple)) else [dtype] * len(arrays)
+    dtypes = [a.dtype if dt is None else np.dtype(dt) for a, dt in zip(arrays, dtypes)]
+
+    if batch_size is None: batch_size = _pipeline_batch_size(arrays, dtypes)
+
+    n = len(arrays[0])
+    total_batches = (n + batch_size - 1) // batch_size
+
+    streams = [xp.cuda.Stream(non_blocking=True) for _ in range(2)]
+    staging = PinnedStaging(xp)
+    consumed = [None, None]
+    buffers = [[xp.empty((min(batch_size, n),) + a.shape[1:], dtype=dt) for a, dt in zip(arrays, dtypes)] for _ in range(2)]
+
+    def stage(k):
+        
+        slot = k % 2
+        start, end = k * batch_size, min((k + 1) * batch_size, n)
+        stream = streams[slot]
+
+        stream.synchronize() # previous copy out of this slot's pinned buffers is finished
+        if consumed[slot] is not None: stream.wait_event(consumed[slot]) # compute on this slot's device buffers is finished
+
+        chunk = []
+
+        for j, (a, dt) in enumerate(zip(arrays, dtypes)):
+
+            host = staging.get(('h2d', slot, j), (end - start,) + a.shape[1:], dt)
+            host[...] = a[start:end]
+
+            device = buffers[slot][j][:end - start]
+            device.set(host, stream=stream)
+            chunk.append(device)
+
+        return tuple(chunk)
+
+    try:
+
+        pending = stage(0) if total_batches else None
+
+        for k in range(total_batches):
+
+            chunk = pending
+            if k + 1 < total_batches: pending = stage(k + 1)
+
+            streams[k % 2].synchronize()
+
+            yield chunk if len(chunk) > 1 else chunk[0]
+
+            consumed[k % 2] = xp.cuda.Event()
+            consumed[k % 2].record()
+
+    finally:
+        for stream in streams: stream.synchronize() # a copy out of the pinned buffers may be in flight when closed early
+        staging.release()
+
+def iter_to_host(x, batch_size=None, dtype=None, xp=None):
+    """
+    Streams a device array to the host chunk by chunk, with the same double buffering as iter_to_device.
+
+    Chunks are pinned host arrays reused by the pipeline and are valid until the next iteration, copy them to keep them.
+
+    :param x: Device array.
+    :param batch_size: Rows per chunk. Default: as many rows as fit in 64 MB.
+    :param dtype: dtype of the host chunks. Default: dtype of x
+    :param xp: Device module (cupy or backend.emulated). Default: cupy
+    :return: Generator of (start row, host chunk) tuples.
+    """
+    if xp is None: import cupy as xp
+
+    dtype = x.dtype if dtype is None else np.dtype(dtype)
+
+    if batch_size is None: batch_size = _pipeline_batch_size([x], [dtype])
+
+    n = len(x)
+    total_batches = (n + batch_size - 1) // batch_size
+
+    streams = [xp.cuda.Stream(non_blocking=True) for _ in range(2)]
+    staging = PinnedStaging(xp)
+
+    def request(k):
+
+        slot = k % 2
+        start, end = k * batch_size, min((k + 1) * batch_size, n)
+        stream = streams[slot]
+
+        ready = xp.cuda.Event()
+        ready.record() # x is written by work queued on the current stream
+
+        stream.synchronize() # previous chunk of this slot is consumed
+        stream.wait_event(ready)
+
+        host = staging.get(('d2h', slot, 0), (end - start,) + x.shape[1:], dtype)
+
+        with stream:
+            x[start:end].astype(dtype, copy=False).get(stream=stream, out=host)
+
+        return start, host
+
+    try:
+
+        pending = request(0) if total_batches else None
+
+        for k in range(total_batches):
+
+            chunk = pending
+            if k + 1 < total_batches: pending = request(k + 1)
+
+            streams[k % 2].synchronize()
+
+            yield chunk
+
+    finally:
+        for stream in streams: stream.synchronize() # a copy into the pinned buffers may be in flight when closed early
+        staging.release()
+
+
 def adjust_gpu_memory_threshold(pool, free_gpu_memory, current_threshold=0.75, min_threshold=0.5, max_threshold=0.9):
     used_memory = pool.used_bytes()
     usage_ratio = used_memory / free_gpu_memory
@@ -249,7 +452,9 @@ def optimize_labels(y, one_hot_encoded=True, cuda=False):
     :return: The function `optimize_labels` returns the input array `y` after optimizing its data type based on the specified conditions. If `one_hot_encoded` is True, it checks the length of the elements in `y` and converts the data type to uint8, uint16, or uint32 accordingly. If `one_hot_encoded` is False, it checks the length of `y` itself and
     """
 
-    if cuda: array_type = cp
+    if cuda:
+        import cupy as cp
+        array_type = cp
     else: array_type = np
 
     dtype_uint8 = array_type.uint8
@@ -281,4 +486,159 @@ def optimize_labels(y, one_hot_encoded=True, cuda=False):
             if y.dtype != dtype_uint32:
                 y = array_type.array(y, copy=False).astype(dtype_uint32, copy=False)
 
-        return y
\ No newline at end of file
+        return y
+
+
+# MEMORY BUDGET -----
+
+class MemoryBudget:
+    """
+    Central memory budget of the library. fit, evaluate, synthetic_augmentation and standard_scaler ask it for
+    chunk sizes instead of assuming the whole machine, so they stay under container (cgroup) limits.
+
+    Args:
+        fraction (float): Fraction of the available memory a single operation may use. Default: 0.25
+
+        limit (int): Optional hard cap in bytes for one operation, on top of psutil and cgroup limits. Default: None
+
+        interval (float): Sampling interval of peak RSS tracking in seconds. Default: 0.005
+
+        ttl (float): Seconds the measured available memory is reused before psutil and cgroup files are read again. Default: 1.0
+
+    Example:
+        ```python
+        from pyerualjetwork.memory_operations import budget
+
+        budget.fraction = 0.1
+        budget.start_tracking()
+        W = plan.fit(x_train, y_train)
+        budget.stop_tracking()
+
+        print(budget.peaks)  # {'fit': peak RSS in bytes}
+        ```
+    """
+
+    def __init__(self, fraction=0.25, limit=None, interval=0.005, ttl=1.0):
+        self.fraction = fraction
+        self.limit = limit
+        self.interval = interval
+        self.ttl = ttl
+        self._memory = None
+        self._memory_time = 0.0
+        self.tracking = False
+        self.peaks = {}
+        self._active = {}
+        self._lock = threading.Lock()
+        self._sampler = None
+
+    def available(self):
+        """
+        :return: Bytes a single operation may use.
+        """
+        now = time.monotonic()
+
+        if self._memory is None or now - self._memory_time > self.ttl:
+            self._memory = get_available_cpu_memory()
+            self._memory_time = now
+
+        available = self._memory * self.fraction
+        if self.limit is not None: available = min(available, self.limit)
+        return int(available)
+
+    def chunk_rows(self, row_bytes, copies=2, n_rows=None):
+        """
+        Number of rows an operation may process at once.
+
+        :param row_bytes: Bytes of one row.
+        :param copies: How many row sized arrays the operation holds at the same time (inputs, temporaries, outputs). Default: 2
+        :param n_rows: Total rows. The result is not larger than this. Default: None
+        :return: Rows per chunk, at least 1.
+        """
+        rows = max(int(self.available() // max(row_bytes * copies, 1)), 1)
+        return rows if n_rows is None else min(rows, max(n_rows, 1))
+
+    def start_tracking(self):
+        """
+        Starts recording peak RSS of each stage into `peaks`.
+        """
+        self.tracking = True
+
+    def stop_tracking(self):
+        self.tracking = False
+
+    def reset(self):
+        self.peaks = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Records the peak RSS of the process while the block runs, under peaks[name]. A sampling thread runs
+        only while at least one stage is active. Does nothing when tracking is off.
+        """
+        if not self.tracking:
+            yield
+            return
+
+        process = psutil.Process()
+
+        with self._lock:
+            self._active[name] = self._active.get(name, 0) + 1
+            self._sample(process)
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(target=self._sample_loop, args=(process,), daemon=True)
+                self._sampler.start()
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._sample(process)
+                self._active[name] -= 1
+                if self._active[name] == 0: del self._active[name]
+
+    def _sample(self, process):
+
+        rss = process.memory_info().rss
+        for name in self._active:
+            self.peaks[name] = max(self.peaks.get(name, 0), rss)
+
+    def _sample_loop(self, process):
+
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._sampler = None
+                    return
+                self._sample(process)
+
+            time.sleep(self.interval)
+
+
+budget = MemoryBudget()
+
+def track_stage(name):
+    """
+    Decorator recording the peak RSS of a function under budget.peaks[name] while tracking is on.
+    """
+    def decorator(func):
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not budget.tracking: return func(*args, **kwargs)
+
+            with budget.stage(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+def iter_chunks(*arrays, batch_size):
+    """
+    Yields row slices (views) of arrays, batch_size rows at a time. A tuple of slices when more than one array is given.
+    """
+    n = len(arrays[0])
+
+    for start in range(0, n, batch_size):
+        chunk = tuple(a[start:start + batch_size] for a in arrays)
+        yield chunk if len(chunk) > 1 else chunk[0]
@@ -76,7 +76,34 @@ def metrics(y_ts, test_preds, average='weighted'):
     return precision_val, recall_val, f1_val
 
 
-def roc_curve(y_true, y_score):
+def _roc_points(y_sorted, score_sorted, xp, max_thresholds=None):
+    """
+    ROC points of one score column sorted in descending order. tp/fp counts are cumulative sums read at the
+    last row of every group of equal scores, so ties form a single point.
+    """
+    n = len(score_sorted)
+    tps = xp.cumsum(y_sorted)
+
+    ends = xp.concatenate((xp.flatnonzero(score_sorted[1:] != score_sorted[:-1]), xp.asarray([n - 1])))
+
+    if max_thresholds is not None and len(ends) > max_thresholds:
+        keep = xp.unique(xp.round(xp.linspace(0, len(ends) - 1, max(int(max_thresholds), 2))).astype(int))
+        ends = ends[keep]
+
+    tp = tps[ends]
+    fp = ends + 1 - tp
+    n_pos = tps[-1]
+    n_neg = n - n_pos
+
+    zero = xp.zeros(1, dtype=tp.dtype)
+    fpr = xp.concatenate((zero, fp)) / n_neg
+    tpr = xp.concatenate((zero, tp)) / n_pos
+    thresholds = xp.concatenate((score_sorted[:1], score_sorted[xp.minimum(ends + 1, n - 1)]))
+
+    return fpr, tpr, thresholds
+
+
+def roc_curve(y_true, y_score, max_thresholds=None):
     """
     Compute Receiver Operating Characteristic (ROC) curve.
 
@@ -87,6 +114,9 @@ def roc_curve(y_true, y_score):
         Target scores, can either be probability estimates of the positive class,
         confidence values, or non-thresholded measure of decisions (as returned
         by decision_function on some classifiers).
+    max_thresholds : int, optional
+        Keeps at most this many (evenly spaced) thresholds for very large inputs. The kept points
+        are exact, the curve is only coarser. Default: None (all unique scores)
 
     Returns:
     fpr : array, shape = [n]
@@ -99,46 +129,101 @@ def roc_curve(y_true, y_score):
         Decreasing thresholds on the decision function used to compute fpr and tpr.
     """
     
-    y_true = np.asarray(y_true)
-    y_score = np.asarray(y_score)
+    from .backend import get_array_module
+
+    xp = get_array_module(y_score, y_true)
 
-    if len(np.unique(y_true)) != 2:
+    y_true = xp.asarray(y_true)
+    y_score = xp.asarray(y_score)
+
+    if len(xp.unique(y_true)) != 2:
         raise ValueError("Only binary classification is supported.")
 
-    
-    desc_score_indices = np.argsort(y_score, kind="mergesort")[::-1]
-    y_score = y_score[desc_score_indices]
-    y_true = y_true[desc_score_indices]
+    desc_score_indices = xp.argsort(y_score, kind="stable")[::-1]
 
+    return _roc_points((y_true[desc_score_indices] == 1).astype(xp.int64), y_score[desc_score_indices], xp, max_thresholds)
 
-    fpr = []
-    tpr = []
-    thresholds = []
-    n_pos = np.sum(y_true)
-    n_neg = len(y_true) - n_pos
 
-    tp = 0
-    fp = 0
-    prev_score = None
+def roc_curve_ovr(y_true, y_score, max_thresholds=None):
+    """
+    One-vs-rest ROC curves of a multi-class classifier. All class columns are sorted and accumulated at once.
 
-    
-    for i, score in enumerate(y_score):
-        if score != prev_score:
-            fpr.append(fp / n_neg)
-            tpr.append(tp / n_pos)
-            thresholds.append(score)
-            prev_score = score
+    Args:
+        y_true (numpy.ndarray): One-hot encoded labels (n_samples, n_classes) or class labels (n_samples,).
 
-        if y_true[i] == 1:
-            tp += 1
-        else:
-            fp += 1
+        y_score (numpy.ndarray): Class scores (n_samples, n_classes). For example the softmax output of plan.evaluate: model[model_operations.get_preds_softmax()]
 
-    fpr.append(fp / n_neg)
-    tpr.append(tp / n_pos)
-    thresholds.append(score)
+        max_thresholds (int, optional): Keeps at most this many thresholds per class. Default: None (all unique scores)
 
-    return np.array(fpr), np.array(tpr), np.array(thresholds)
+    Returns:
+        list: (fpr, tpr, thresholds) of every class. None for classes with no positive or no negative sample.
+    """
+
+    from .backend import get_array_module
+
+    xp = get_array_module(y_score, y_true)
+
+    y_score = xp.asarray(y_score)
+    y_true = xp.asarray(y_true)
+
+    if y_score.ndim != 2: raise ValueError("y_score must have shape (n_samples, n_classes).")
+
+    if y_true.ndim == 1: y_true = y_true[:, None] == xp.arange(y_score.shape[1])
+    y_true = (y_true == 1).astype(xp.int64)
+
+    order = xp.argsort(y_score, axis=0, kind="stable")[::-1]
+    y_sorted = xp.take_along_axis(y_true, order, axis=0)
+    score_sorted = xp.take_along_axis(y_score, order, axis=0)
+
+    n_pos = xp.sum(y_true, axis=0).tolist()
+    n = len(y_true)
+
+    return [_roc_points(y_sorted[:, c], score_sorted[:, c], xp, max_thresholds) if 0 < n_pos[c] < n else None
+            for c in range(y_score.shape[1])]
+
+
+def roc_auc(y_true, y_score, average='macro', max_thresholds=None):
+    """
+    Area under the ROC curve. Binary for 1D y_score, one-vs-rest for (n_samples, n_classes) scores such as the
+    softmax output of plan.evaluate.
+
+    Args:
+        y_true (numpy.ndarray): Binary labels for 1D y_score. One-hot encoded or class labels for 2D y_score.
+
+        y_score (numpy.ndarray): Scores, 1D or (n_samples, n_classes).
+
+        average (str, optional): Multi-class averaging: 'macro', 'weighted' (by class support) or None (per class AUCs, nan for classes with no positive or no negative sample). Default: 'macro'
+
+        max_thresholds (int, optional): Threshold subsampling, see roc_curve. Default: None
+
+    Returns:
+        float or numpy.ndarray: AUC.
+    """
+
+    if np.ndim(y_score) == 1:
+        fpr, tpr, _ = roc_curve(y_true, y_score, max_thresholds)
+        return float(np.trapz(_to_host(tpr), _to_host(fpr)))
+
+    curves = roc_curve_ovr(y_true, y_score, max_thresholds)
+    aucs = np.array([np.nan if curve is None else np.trapz(_to_host(curve[1]), _to_host(curve[0])) for curve in curves])
+
+    if average is None: return aucs
+
+    valid = ~np.isnan(aucs)
+
+    if average == 'macro': return float(np.mean(aucs[valid]))
+
+    elif average == 'weighted':
+        y_true = _to_host(y_true)
+        support = np.sum(y_true, axis=0) if y_true.ndim == 2 else np.bincount(y_true.astype(int), minlength=len(aucs))
+        return float(np.average(aucs[valid], weights=support[valid]))
+
+    else:
+        raise ValueError("Invalid value for 'average'. Choose from 'macro', 'weighted' or None.")
+
+
+def _to_host(x):
+    return x.get() if hasattr(x, 'get') else np.asarray(x)
 
 
 def confusion_matrix(y_true, y_pred, class_count):
@@ -163,28 +248,159 @@ def confusion_matrix(y_true, y_pred, class_count):
     return confusion
 
 
-def pca(X, n_components):
+PCA_RANDOMIZED_MIN_FEATURES = 1000 # pca(method='auto') switches to randomized PCA above this feature count
+
+
+def _is_sparse(X):
+    return hasattr(X, 'tocsr')
+
+
+def _pca_chunk_rows(X, chunk_rows):
+
+    if chunk_rows is not None: return chunk_rows
+
+    from .memory_operations import budget
+
+    row_bytes = X.data.nbytes / max(X.shape[0], 1) if _is_sparse(X) else X.shape[1] * 8
+    return budget.chunk_rows(row_bytes, copies=3, n_rows=X.shape[0])
+
+
+def _centered_matmul(X, mean, M, chunk_rows, xp):
+    """
+    (X - mean) @ M, one row chunk at a time without a centered copy of X.
+    """
+    shift = mean @ M
+    out = xp.empty((X.shape[0], M.shape[1]), dtype=M.dtype)
+
+    for start in range(0, X.shape[0], chunk_rows):
+        out[start:start + chunk_rows] = X[start:start + chunk_rows] @ M - shift
+
+    return out
+
+
+def _centered_rmatmul(X, mean, M, chunk_rows, xp):
+    """
+    (X - mean).T @ M accumulated over row chunks.
+    """
+    out = xp.zeros((X.shape[1], M.shape[1]), dtype=M.dtype)
+
+    for start in range(0, X.shape[0], chunk_rows):
+        out += X[start:start + chunk_rows].T @ M[start:start + chunk_rows]
+
+    return out - xp.outer(mean, M.sum(axis=0))
+
+
+def pca_fit(X, n_components, method='auto', chunk_rows=None, n_iter=4, n_oversamples=10, random_state=0):
+    """
+    Finds the principal axes of X.
+
+    Args:
+        X (numpy.ndarray): (n_samples, n_features). A memmap or a scipy.sparse matrix also works with method='randomized'.
+
+        n_components (int): Number of components.
+
+        method (str, optional): 'full' (eigendecomposition of the features x features covariance matrix),
+            'randomized' (randomized SVD, computes only the requested components and streams X in row chunks,
+            never building a centered copy or a covariance matrix) or 'auto' (randomized for sparse X or more than
+            PCA_RANDOMIZED_MIN_FEATURES features). Default: 'auto'
+
+        chunk_rows (int, optional): Rows per chunk of the randomized method. Default: sized by memory_operations.budget
+
+        n_iter (int, optional): Power iterations of the randomized method. More is more accurate for slowly decaying spectra. Default: 4
+
+        n_oversamples (int, optional): Extra random directions of the randomized method. Default: 10
+
+        random_state (int, optional): Seed of the randomized method. Default: 0
+
+    Returns:
+        list: pca_params [mean (n_features,), components (n_features, n_components)]
+    """
+
+    from .backend import get_array_module
+
+    xp = get_array_module(X)
+    n_samples, n_features = X.shape
+
+    if method == 'auto': method = 'randomized' if _is_sparse(X) or n_features > PCA_RANDOMIZED_MIN_FEATURES else 'full'
+
+    if method == 'full':
+        X_meaned = X - xp.mean(X, axis=0)
+        covariance_matrix = xp.cov(X_meaned, rowvar=False)
+        eigenvalues, eigenvectors = xp.linalg.eigh(covariance_matrix)
+        sorted_index = xp.argsort(eigenvalues)[::-1]
+
+        return [xp.mean(X, axis=0), eigenvectors[:, sorted_index][:, :n_components]]
+
+    if method != 'randomized': raise ValueError("method must be 'auto', 'full' or 'randomized'")
+
+    chunk_rows = _pca_chunk_rows(X, chunk_rows)
+    mean = np.asarray(X.mean(axis=0), dtype=np.float64).ravel() if _is_sparse(X) else xp.mean(X, axis=0, dtype=np.float64)
+    k = min(n_components + n_oversamples, n_samples, n_features)
+
+    omega = xp.asarray(np.random.default_rng(random_state).standard_normal((n_features, k)))
+
+    Q, _ = xp.linalg.qr(_centered_matmul(X, mean, omega, chunk_rows, xp))
+
+    for _ in range(n_iter):
+        Z, _ = xp.linalg.qr(_centered_rmatmul(X, mean, Q, chunk_rows, xp))
+        Q, _ = xp.linalg.qr(_centered_matmul(X, mean, Z, chunk_rows, xp))
+
+    B = _centered_rmatmul(X, mean, Q, chunk_rows, xp).T
+
+    _, _, Vt = xp.linalg.svd(B, full_matrices=False)
+    components = Vt[:n_components].T
+
+    signs = xp.sign(components[xp.argmax(xp.abs(components), axis=0), xp.arange(components.shape[1])])
+    signs[signs == 0] = 1
+
+    return [mean, components * signs]
+
+
+def pca_transform(X, pca_params, chunk_rows=None):
+    """
+    Projects X onto the components of pca_fit, one row chunk at a time.
+
+    Args:
+        X (numpy.ndarray): (n_samples, n_features). A memmap or a scipy.sparse matrix also works.
+
+        pca_params (list): [mean, components] from pca_fit.
+
+        chunk_rows (int, optional): Rows per chunk. Default: sized by memory_operations.budget
+
+    Returns:
+        X_reduced (numpy.ndarray): (n_samples, n_components)
+    """
+
+    from .backend import get_array_module
+
+    mean, components = pca_params
+    xp = get_array_module(components)
+    chunk_rows = _pca_chunk_rows(X, chunk_rows)
+
+    if _is_sparse(X): return _centered_matmul(X, mean, components, chunk_rows, xp)
+
+    X_reduced = xp.empty((X.shape[0], components.shape[1]), dtype=xp.result_type(X.dtype, components.dtype))
+
+    for start in range(0, X.shape[0], chunk_rows):
+        X_reduced[start:start + chunk_rows] = xp.dot(X[start:start + chunk_rows] - mean, components)
+
+    return X_reduced
+
+
+def pca(X, n_components, method='auto', chunk_rows=None, random_state=0):
     """
     
     Parameters:
     X (numpy array): (n_samples, n_features)
     n_components (int):
+    method (str): 'auto', 'full' or 'randomized'. See pca_fit. Default: 'auto'
+    chunk_rows (int): Rows per chunk. Default: sized by memory_operations.budget
+    random_state (int): Seed of the randomized method. Default: 0
     
     Returns:
     X_reduced (numpy array): (n_samples, n_components)
     """
     
-    X_meaned = X - np.mean(X, axis=0)
-    
-    covariance_matrix = np.cov(X_meaned, rowvar=False)
-    
-    eigenvalues, eigenvectors = np.linalg.eigh(covariance_matrix)
-    
-    sorted_index = np.argsort(eigenvalues)[::-1]
-    sorted_eigenvectors = eigenvectors[:, sorted_index]
-    
-    eigenvectors_subset = sorted_eigenvectors[:, :n_components]
-    
-    X_reduced = np.dot(X_meaned, eigenvectors_subset)
+    pca_params = pca_fit(X, n_components, method=method, chunk_rows=chunk_rows, random_state=random_state)
     
-    return X_reduced
\ No newline at end of file
+    return pca_transform(X, pca_params, chunk_rows=chunk_rows)
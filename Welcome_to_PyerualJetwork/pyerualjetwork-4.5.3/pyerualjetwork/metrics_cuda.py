@@ -1,5 +1,7 @@
 import cupy as cp
 
+from .metrics import roc_curve as _roc_curve, roc_curve_ovr as _roc_curve_ovr, roc_auc as _roc_auc, pca as _pca
+
 def metrics(y_ts, test_preds, average='weighted'):
     from .data_operations import decode_one_hot
     y_test_d = cp.array(decode_one_hot(y_ts))
@@ -50,68 +52,25 @@ def metrics(y_ts, test_preds, average='weighted'):
     return precision_val.item(), recall_val.item(), f1_val.item()
 
 
-def roc_curve(y_true, y_score):
+def roc_curve(y_true, y_score, max_thresholds=None):
     """
-    Compute Receiver Operating Characteristic (ROC) curve.
-
-    Parameters:
-    y_true : array, shape = [n_samples]
-        True binary labels in range {0, 1} or {-1, 1}.
-    y_score : array, shape = [n_samples]
-        Target scores, can either be probability estimates of the positive class,
-        confidence values, or non-thresholded measure of decisions (as returned
-        by decision_function on some classifiers).
-
-    Returns:
-    fpr : array, shape = [n]
-        Increasing false positive rates such that element i is the false positive rate
-        of predictions with score >= thresholds[i].
-    tpr : array, shape = [n]
-        Increasing true positive rates such that element i is the true positive rate
-        of predictions with score >= thresholds[i].
-    thresholds : array, shape = [n]
-        Decreasing thresholds on the decision function used to compute fpr and tpr.
+    Compute Receiver Operating Characteristic (ROC) curve on the GPU. See metrics.roc_curve.
     """
-    
-    y_true = cp.asarray(y_true)
-    y_score = cp.asarray(y_score)
-
-    if len(cp.unique(y_true)) != 2:
-        raise ValueError("Only binary classification is supported.")
-
-    
-    desc_score_indices = cp.argsort(y_score, kind="stable")[::-1]
-    y_score = y_score[desc_score_indices]
-    y_true = y_true[desc_score_indices]
-
+    return _roc_curve(cp.asarray(y_true), cp.asarray(y_score), max_thresholds)
 
-    fpr = []
-    tpr = []
-    thresholds = []
-    n_pos = cp.sum(y_true)
-    n_neg = len(y_true) - n_pos
 
-    tp = 0
-    fp = 0
-    prev_score = 0
-
-    for i, score in enumerate(y_score):
-        if score is not prev_score:
-            fpr.append(fp / n_neg)
-            tpr.append(tp / n_pos)
-            thresholds.append(score)
-            prev_score = score
-
-        if y_true[i] == 1:
-            tp += 1
-        else:
-            fp += 1
+def roc_curve_ovr(y_true, y_score, max_thresholds=None):
+    """
+    One-vs-rest ROC curves on the GPU. See metrics.roc_curve_ovr.
+    """
+    return _roc_curve_ovr(cp.asarray(y_true), cp.asarray(y_score), max_thresholds)
 
-    fpr.append(fp / n_neg)
-    tpr.append(tp / n_pos)
-    thresholds.append(score)
 
-    return cp.array(fpr), cp.array(tpr), cp.array(thresholds)
+def roc_auc(y_true, y_score, average='macro', max_thresholds=None):
+    """
+    Area under the ROC curve on the GPU. See metrics.roc_auc.
+    """
+    return _roc_auc(cp.asarray(y_true), cp.asarray(y_score), average, max_thresholds)
 
 
 def confusion_matrix(y_true, y_pred, class_count):
@@ -136,28 +95,8 @@ def confusion_matrix(y_true, y_pred, class_count):
     return confusion
 
 
-def pca(X, n_components):
+def pca(X, n_components, method='auto', chunk_rows=None, random_state=0):
     """
-    
-    Parameters:
-    X (numpy array): (n_samples, n_features)
-    n_components (int):
-    
-    Returns:
-    X_reduced (numpy array): (n_samples, n_components)
+    PCA on the GPU. See metrics.pca.
     """
-    
-    X_meaned = X - cp.mean(X, axis=0)
-    
-    covariance_matrix = cp.cov(X_meaned, rowvar=False)
-    
-    eigenvalues, eigenvectors = cp.linalg.eigh(covariance_matrix)
-    
-    sorted_index = cp.argsort(eigenvalues)[::-1]
-    sorted_eigenvectors = eigenvectors[:, sorted_index]
-    
-    eigenvectors_subset = sorted_eigenvectors[:, :n_components]
-    
-    X_reduced = cp.dot(X_meaned, eigenvectors_subset)
-    
-    return X_reduced
\ No newline at end of file
+    return _pca(cp.asarray(X), n_components, method=method, chunk_rows=chunk_rows, random_state=random_state)
@@ -3,9 +3,8 @@ from colorama import Fore, Style
 import sys
 from datetime import datetime
 import pickle
-from scipy import io
-import scipy.io as sio
-import pandas as pd
+import json
+import weakref
 
 
 def save_model(model_name,
@@ -18,7 +17,8 @@ def save_model(model_name,
                weights_type='npy',
                weights_format='raw',
                show_architecture=False,
-               show_info=True
+               show_info=True,
+               projection_params=None
                ):
 
     """
@@ -32,14 +32,16 @@ def save_model(model_name,
         model_path: (str): Path where the model will be saved. For example: C:/Users/beydili/Desktop/denemePLAN/ default: ''
         activation_potentiation: (list): For deeper PLAN networks, activation function parameters. For more information please run this code: plan.activations_list() default: ['linear']
         weights_type: (str): Type of weights to save (options: 'txt', 'pkl', 'npy', 'mat'). default: 'npy'
-        weights_format: (str): Format of the weights (options: 'f', 'raw'). default: 'raw'
+        weights_format: (str): Format of the weights (options: 'f', 'raw', 'f16', 'int8'). 'f16' stores half precision weights, 'int8' stores symmetric int8 weights with per-row scales (saved next to weights as model_name + '_weights_scale.npy'). default: 'raw'
         show_architecture: (bool): It draws model architecture. True or False. Default: False
         show_info: (bool): Prints model details into console. default: True
+        projection_params: (dict): data_operations.random_projection params. Stored in the model log, so predict_model_ssd applies the same projection. Read back with load_projection. default: None
 
     Returns:
         No return.
     """
     
+    import pandas as pd
     from .visualizations import draw_model_architecture
 
     class_count = W.shape[0]
@@ -51,8 +53,8 @@ def save_model(model_name,
         print(Fore.RED + "ERROR110: Save Weight type (File Extension) Type must be 'txt' or 'npy' or 'mat' or 'pkl' from: save_model" + Style.RESET_ALL)
         sys.exit()
 
-    if weights_format != 'd' and weights_format != 'f' and weights_format != 'raw':
-        print(Fore.RED + "ERROR111: Weight Format Type must be 'd' or 'f' or 'raw' from: save_model" + Style.RESET_ALL)
+    if weights_format not in ('d', 'f', 'raw', 'f16', 'int8'):
+        print(Fore.RED + "ERROR111: Weight Format Type must be 'd' or 'f' or 'raw' or 'f16' or 'int8' from: save_model" + Style.RESET_ALL)
         sys.exit()
 
     NeuronCount = 0
@@ -90,7 +92,8 @@ def save_model(model_name,
             'WEIGHTS FORMAT': weights_format,
             'MODEL PATH': model_path,
             'STANDARD SCALER': scaler_params,
-            'ACTIVATION POTENTIATION': activation_potentiation
+            'ACTIVATION POTENTIATION': activation_potentiation,
+            'PROJECTION': None if projection_params is None else json.dumps(projection_params)
             }
 
     df = pd.DataFrame(data)
@@ -99,6 +102,17 @@ def save_model(model_name,
 
     try:
 
+        if weights_format == 'f16':
+
+            W = W.astype(np.float16)
+            weights_format = 'raw'
+
+        elif weights_format == 'int8':
+
+            W, W_scale = quantize_weights(W)
+            np.save(model_path + model_name + '_weights_scale.npy', W_scale)
+            weights_format = 'raw'
+
         if weights_type == 'txt' and weights_format == 'f':
 
                 np.savetxt(model_path + model_name + '_weights.txt',  W, fmt='%f')
@@ -134,13 +148,15 @@ def save_model(model_name,
 
         if weights_type == 'mat' and weights_format == 'f':
 
+                import scipy.io as sio
                 w = {'w': W.astype(float)}
-                io.savemat(model_path + model_name + '_weights.mat', w)
+                sio.savemat(model_path + model_name + '_weights.mat', w)
 
         if weights_type == 'mat' and weights_format == 'raw':
                 
+                import scipy.io as sio
                 w = {'w': W}
-                io.savemat(model_path + model_name + '_weights.mat', w)
+                sio.savemat(model_path + model_name + '_weights.mat', w)
 
     except:
 
@@ -179,6 +195,8 @@ def load_model(model_name,
     lists: W(list[num]), activation_potentiation, DataFrame of the model
     """
 
+    import pandas as pd
+
     try:
 
          df = pd.read_pickle(model_path + model_name + '.pkl')
@@ -205,12 +223,14 @@ def load_model(model_name,
      
     model_name = str(df['MODEL NAME'].iloc[0])
     WeightType = str(df['WEIGHTS TYPE'].iloc[0])
+    WeightFormat = str(df['WEIGHTS FORMAT'].iloc[0])
 
     if WeightType == 'txt':
             W = np.loadtxt(model_path + model_name + '_weights.txt')
     elif WeightType == 'npy':
             W = np.load(model_path + model_name + '_weights.npy')
     elif WeightType == 'mat':
+            import scipy.io as sio
             W = sio.loadmat(model_path + model_name + '_weights.mat')
     elif WeightType == 'pkl':
         with open(model_path + model_name + '_weights.pkl', 'rb') as f:
@@ -223,9 +243,166 @@ def load_model(model_name,
     if WeightType == 'mat':
         W = W['w']
 
+    if WeightFormat == 'int8':
+        W_scale = np.load(model_path + model_name + '_weights_scale.npy')
+        W = dequantize_weights(W.astype(np.int8, copy=False), W_scale)
+
+    elif WeightFormat == 'f16':
+        W = W.astype(np.float32, copy=False)
+
     return W, None, None, activation_potentiation, scaler_params
 
 
+def load_projection(model_name, model_path):
+    """
+    Loads the data_operations.random_projection params saved with a model (save_model(projection_params=...)).
+    They are not part of load_model's output, so its tuple and index helpers stay the same.
+
+    Args:
+
+        model_name (str): Name of the model.
+
+        model_path (str): Path where the model is saved.
+
+    Returns:
+        dict or None: projection_params, None if the model was saved without them.
+    """
+    import pandas as pd
+
+    df = pd.read_pickle(model_path + model_name + '.pkl')
+
+    if 'PROJECTION' in df.columns and isinstance(df['PROJECTION'].iloc[0], str):
+        return json.loads(df['PROJECTION'].iloc[0])
+
+    return None
+
+
+def _atomic_write(file_path, write):
+    """
+    Writes a file through write(f) into a temporary file next to file_path, then renames it over file_path.
+    A reader (or a resumed run) sees either the old file or the complete new one, never a partial write.
+    """
+
+    import os
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(file_path) + '.', suffix='.tmp')
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, file_path)
+
+    except BaseException:
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+        raise
+
+
+def save_checkpoint(checkpoint_path,
+                    weights,
+                    activation_potentiations,
+                    generation,
+                    fitness=None,
+                    history=None,
+                    state=None
+                    ):
+    """
+    Saves the full evolutionary state of a PLANEAT run (plan.learner or a custom planeat.evolver loop) so it can be resumed.
+
+    The checkpoint is a directory: the weight population is stored as one .npy file (population_<generation>.npy, it can be
+    memory mapped on load) and everything else (activations, fitness, generation, history, python and numpy RNG states and
+    the optional state dict) in checkpoint.pkl. Both files are written atomically and checkpoint.pkl, which names the
+    population file, is replaced last. So a run killed while saving resumes from the previous checkpoint.
+
+    Args:
+        checkpoint_path (str): Checkpoint directory. Created if missing.
+
+        weights (numpy.ndarray): Weight population. (numpy or cupy)
+
+        activation_potentiations (list): Activations of each genome.
+
+        generation (int): Count of completed generations.
+
+        fitness (numpy.ndarray, optional): Fitness of the last evaluated population. Default: None
+
+        history (dict, optional): Any picklable history (for example best accuracy per generation). Default: None
+
+        state (dict, optional): Any other picklable state to restore. Default: None
+
+    Returns:
+        No return.
+    """
+
+    import os
+    import random
+
+    os.makedirs(checkpoint_path, exist_ok=True)
+
+    if hasattr(weights, 'get') and not isinstance(weights, np.ndarray): weights = weights.get() # cupy to host
+    if fitness is not None: fitness = np.array([float(f) for f in fitness]) # list of numpy or cupy scalars
+
+    population_file = f'population_{generation}.npy'
+
+    _atomic_write(os.path.join(checkpoint_path, population_file), lambda f: np.save(f, np.asarray(weights)))
+
+    checkpoint = {
+        'generation': generation,
+        'population_file': population_file,
+        'activation_potentiations': [act.copy() if isinstance(act, list) else act for act in activation_potentiations],
+        'fitness': fitness,
+        'history': history,
+        'state': state,
+        'random_state': random.getstate(),
+        'numpy_random_state': np.random.get_state(),
+        'time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+    _atomic_write(os.path.join(checkpoint_path, 'checkpoint.pkl'), lambda f: pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    # Older populations are no longer referenced
+    for file_name in os.listdir(checkpoint_path):
+        if file_name.startswith('population_') and file_name.endswith('.npy') and file_name != population_file:
+            os.remove(os.path.join(checkpoint_path, file_name))
+
+
+def load_checkpoint(checkpoint_path, mmap_mode=None, restore_rng=True):
+    """
+    Loads a checkpoint saved by save_checkpoint.
+
+    Args:
+        checkpoint_path (str): Checkpoint directory.
+
+        mmap_mode (str, optional): numpy.load mmap_mode for the weight population. 'r' (read only) or 'c' (copy on write) keeps large populations on disk until they are used. Default: None (loads into memory)
+
+        restore_rng (bool, optional): Restores python random and numpy.random states, so a resumed run draws the same random numbers as an uninterrupted one. Default: True
+
+    Returns:
+        dict: 'weights', 'activation_potentiations', 'generation', 'fitness', 'history', 'state' (and the saved RNG states).
+    """
+
+    import os
+    import random
+
+    checkpoint_file = os.path.join(checkpoint_path, 'checkpoint.pkl')
+
+    if not os.path.exists(checkpoint_file): raise FileNotFoundError(f"No checkpoint found in: {checkpoint_path}")
+
+    with open(checkpoint_file, 'rb') as f:
+        checkpoint = pickle.load(f)
+
+    checkpoint['weights'] = np.load(os.path.join(checkpoint_path, checkpoint['population_file']), mmap_mode=mmap_mode)
+
+    if restore_rng:
+        random.setstate(checkpoint['random_state'])
+        np.random.set_state(checkpoint['numpy_random_state'])
+
+    return checkpoint
+
+
 def predict_model_ssd(Input, model_name, model_path='', dtype=np.float32):
 
     """
@@ -247,15 +424,17 @@ def predict_model_ssd(Input, model_name, model_path='', dtype=np.float32):
     """
     
     from .activation_functions import apply_activation
-    from .data_operations import standard_scaler
+    from .data_operations import standard_scaler, random_projection
     
     model = load_model(model_name, model_path)
     
     activation_potentiation = model[get_act_pot()]
     scaler_params = model[get_scaler()]
+    projection_params = load_projection(model_name, model_path)
     W = model[get_weights()]
 
     Input = standard_scaler(None, Input, scaler_params, dtype=dtype)
+    if projection_params is not None: Input = random_projection(x_test=np.asarray(Input), projection_params=projection_params, dtype=dtype)
 
     Input = np.array(Input, dtype=dtype, copy=False)
     Input = Input.ravel()
@@ -300,7 +479,7 @@ def reverse_predict_model_ssd(output, model_name, model_path='', dtype=np.float3
     
 
 
-def predict_model_ram(Input, W, scaler_params=None, activation_potentiation=['linear'], dtype=np.float32):
+def predict_model_ram(Input, W, scaler_params=None, activation_potentiation=['linear'], dtype=np.float32, projection_params=None):
 
     """
     Function to make a prediction using a potentiation learning artificial neural network (PLAN).
@@ -318,14 +497,17 @@ def predict_model_ram(Input, W, scaler_params=None, activation_potentiation=['li
 
         dtype (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16. [fp32 for balanced devices, fp64 for strong devices, fp16 for weak devices: not reccomended!]
 
+        projection_params (dict): data_operations.random_projection params. (optional) Default: None.
+
     Returns:
         ndarray: Output from the model.
     """
 
-    from .data_operations import standard_scaler
+    from .data_operations import standard_scaler, random_projection
     from .activation_functions import apply_activation
 
     Input = standard_scaler(None, Input, scaler_params, dtype=dtype)
+    if projection_params is not None: Input = random_projection(x_test=np.asarray(Input), projection_params=projection_params, dtype=dtype)
     
     Input = np.array(Input, dtype=dtype, copy=False)
     Input = Input.ravel()
@@ -367,6 +549,161 @@ def reverse_predict_model_ram(output, W, dtype=np.float32):
         sys.exit()
 
 
+def quantize_weights(W, dtype=np.float32):
+
+    """
+    Symmetric int8 quantization of a PLAN weight matrix with one scale per output row.
+    PLAN weights are max abs normalized into [-1, 1], so every row maps onto [-127, 127] with almost no clipping.
+
+    Args:
+
+        W (numpy.ndarray): Weight matrix of the model. shape: (output_shape, input_shape)
+
+        dtype (numpy.dtype): Data type of the returned scales. np.float32 by default.
+
+    Returns:
+        tuple: W_q (int8 weight matrix), W_scale (per-row scales, shape: (output_shape,)).
+    """
+
+    W = np.asarray(W)
+
+    W_scale = (np.max(np.abs(W), axis=1) / 127).astype(dtype)
+    W_scale[W_scale == 0] = 1
+
+    W_q = np.clip(np.rint(W / W_scale[:, None]), -127, 127).astype(np.int8)
+
+    return W_q, W_scale
+
+
+def dequantize_weights(W_q, W_scale, dtype=np.float32):
+
+    """
+    Reverses quantize_weights.
+
+    Args:
+
+        W_q (numpy.ndarray): int8 weight matrix.
+
+        W_scale (numpy.ndarray): Per-row scales returned by quantize_weights.
+
+        dtype (numpy.dtype): Data type for the arrays. np.float32 by default.
+
+    Returns:
+        ndarray: Approximated float weight matrix.
+    """
+
+    return W_q.astype(dtype) * W_scale.astype(dtype, copy=False)[:, None]
+
+
+# (weakref to the last W_q, its transposed int32 copy): repeated calls with the same weights reuse the copy
+_quantized_cache = (None, None)
+
+
+def _quantized_matmul_weights(W_q):
+
+    global _quantized_cache
+
+    ref, W_qT = _quantized_cache
+
+    if ref is None or ref() is not W_q:
+        W_qT = np.ascontiguousarray(W_q.T, dtype=np.int32)
+        _quantized_cache = (weakref.ref(W_q), W_qT)
+
+    return W_qT
+
+
+def predict_model_quantized(Input, W_q, W_scale, scaler_params=None, activation_potentiation=['linear'], dtype=np.float32):
+
+    """
+    Function to make a prediction with int8 weights. from memory.
+    Inputs are quantized to int8 per row as well, the dot products are accumulated in int32
+    and rescaled with the input and weight scales at the end.
+
+    Args:
+
+        Input (list or ndarray): Input data for the model (single vector or matrix of samples).
+
+        W_q (numpy.ndarray): int8 weight matrix. (first returned value of quantize_weights function)
+
+        W_scale (numpy.ndarray): Per-row weight scales. (second returned value of quantize_weights function)
+
+        scaler_params (list): standard scaler params list: mean,std. (optional) Default: None.
+
+        activation_potentiation (list): ac list for deep PLAN. default: [None] ('linear') (optional)
+
+        dtype (numpy.dtype): Data type for the arrays. np.float32 by default.
+
+    Returns:
+        ndarray: Output from the model. (same layout as predict_model_ram for a single vector, (n_samples, output_shape) for a matrix)
+
+    Notes:
+        int32 accumulation is exact up to ~133k input features (127 * 127 * input_shape < 2**31).
+        The transposed int32 copy of W_q is made once and reused while the same W_q array is passed,
+        so modify W_q by creating a new array rather than in place.
+    """
+
+    from .data_operations import standard_scaler
+    from .activation_functions import apply_activation
+
+    Input = standard_scaler(None, Input, scaler_params, dtype=dtype)
+    Input = np.asarray(Input, dtype=dtype)
+
+    single = Input.ndim == 1 or Input.shape[0] == 1
+    Input = Input.reshape(-1, W_q.shape[1])
+
+    Input = apply_activation(Input, activation_potentiation)
+
+    x_scale = np.max(np.abs(Input), axis=1) / 127
+    x_scale[x_scale == 0] = 1
+
+    x_q = np.clip(np.rint(Input / x_scale[:, None]), -127, 127).astype(np.int32)
+
+    neural_layer = (x_q @ _quantized_matmul_weights(W_q)).astype(dtype)
+    neural_layer *= x_scale.astype(dtype)[:, None] * W_scale.astype(dtype, copy=False)[None, :]
+
+    return neural_layer[0] if single else neural_layer
+
+
+def evaluate_quantized(x_test, y_test, W, activation_potentiation=['linear'], auto_normalization=False, dtype=np.float32):
+
+    """
+    Measures the accuracy impact of int8 quantization by evaluating the float model and its int8 copy on the same data.
+
+    Args:
+
+        x_test (numpy.ndarray): Test data.
+
+        y_test (numpy.ndarray): Test labels (one-hot encoded).
+
+        W (numpy.ndarray): Float weight matrix of the model.
+
+        activation_potentiation (list, optional): Activation list. Default = ['linear'].
+
+        auto_normalization (bool, optional): Normalization for x_test ? Default = False.
+
+        dtype (numpy.dtype): Data type for the arrays. np.float32 by default.
+
+    Returns:
+        tuple: float accuracy, int8 accuracy, int8 predictions (labels).
+    """
+
+    from .plan import evaluate
+    from .data_operations import normalization
+
+    if auto_normalization: x_test = normalization(x_test, dtype=dtype)
+
+    float_acc = evaluate(x_test, y_test, W=W, activation_potentiation=activation_potentiation)[get_acc()]
+
+    W_q, W_scale = quantize_weights(W, dtype=dtype)
+    quantized_preds = np.argmax(predict_model_quantized(x_test, W_q, W_scale,
+                                                        activation_potentiation=activation_potentiation,
+                                                        dtype=dtype).reshape(len(x_test), -1), axis=1)
+
+    quantized_acc = (quantized_preds == np.argmax(y_test, axis=1)).mean()
+
+    return float_acc, quantized_acc, quantized_preds
+
+
 def get_weights():
 
     return 0
@@ -4,6 +4,7 @@ from colorama import Fore, Style
 import sys
 from datetime import datetime
 import pickle
+import json
 from scipy import io
 import scipy.io as sio
 import pandas as pd
@@ -19,7 +20,8 @@ def save_model(model_name,
                weights_type='npy',
                weights_format='raw',
                show_architecture=None,
-               show_info=True
+               show_info=True,
+               projection_params=None
                ):
 
     """
@@ -37,6 +39,7 @@ def save_model(model_name,
         weights_format: (str): Format of the weights (options: 'f', 'raw'). default: 'raw'
         show_architecture: (bool): It draws model architecture. True or False. Default: False
         show_info: (bool): Prints model details into console. default: True
+        projection_params: (dict): data_operations.random_projection params. Stored in the model log, so predict_model_ssd applies the same projection. Read back with load_projection. default: None
 
 
     Returns:
@@ -96,7 +99,8 @@ def save_model(model_name,
             'WEIGHTS FORMAT': weights_format,
             'MODEL PATH': model_path,
             'STANDARD SCALER': scaler_params,
-            'ACTIVATION POTENTIATION': activation_potentiation
+            'ACTIVATION POTENTIATION': activation_potentiation,
+            'PROJECTION': None if projection_params is None else json.dumps(projection_params)
             }
 
     df = pd.DataFrame(data)
@@ -213,6 +217,7 @@ def load_model(model_name,
      
     model_name = str(df['MODEL NAME'].iloc[0])
     WeightType = str(df['WEIGHTS TYPE'].iloc[0])
+    WeightFormat = str(df['WEIGHTS FORMAT'].iloc[0])
 
     if WeightType == 'txt':
             W = cp.loadtxt(model_path + model_name + '_weights.txt')
@@ -231,9 +236,38 @@ def load_model(model_name,
     if WeightType == 'mat':
         W = W['w']
 
+    if WeightFormat == 'int8': # saved by the CPU save_model, see model_operations.quantize_weights
+        W_scale = cp.load(model_path + model_name + '_weights_scale.npy')
+        W = cp.asarray(W).astype(cp.float32) * W_scale.astype(cp.float32, copy=False)[:, None]
+
+    elif WeightFormat == 'f16':
+        W = cp.asarray(W).astype(cp.float32, copy=False)
+
     return W, None, None, activation_potentiation, scaler_params
 
 
+def load_projection(model_name, model_path):
+    """
+    Loads the data_operations.random_projection params saved with a model (save_model(projection_params=...)).
+    They are not part of load_model's output, so its tuple and index helpers stay the same.
+
+    Args:
+
+        model_name (str): Name of the model.
+
+        model_path (str): Path where the model is saved.
+
+    Returns:
+        dict or None: projection_params, None if the model was saved without them.
+    """
+    df = pd.read_pickle(model_path + model_name + '.pkl')
+
+    if 'PROJECTION' in df.columns and isinstance(df['PROJECTION'].iloc[0], str):
+        return json.loads(df['PROJECTION'].iloc[0])
+
+    return None
+
+
 def predict_model_ssd(Input, model_name, model_path='', dtype=cp.float32):
 
     """
@@ -257,15 +291,17 @@ def predict_model_ssd(Input, model_name, model_path='', dtype=cp.float32):
     Input = cp.array(Input, dtype=dtype, copy=False)
     
     from .activation_functions_cuda import apply_activation
-    from .data_operations_cuda import standard_scaler
+    from .data_operations_cuda import standard_scaler, random_projection
     
     model = load_model(model_name, model_path)
     
     activation_potentiation = model[get_act_pot()]
     scaler_params = model[get_scaler()]
+    projection_params = load_projection(model_name, model_path)
     W = model[get_weights()]
 
     Input = standard_scaler(None, Input, scaler_params)
+    if projection_params is not None: Input = random_projection(x_test=cp.asarray(Input), projection_params=projection_params, dtype=dtype)
 
     Input = cp.array(Input, dtype=dtype, copy=False)
     Input = Input.ravel()
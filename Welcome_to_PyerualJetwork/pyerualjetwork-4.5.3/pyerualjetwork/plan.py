@@ -16,17 +16,20 @@ PyerualJetwork document: https://github.com/HCB06/PyerualJetwork/blob/main/Welco
 """
 
 import numpy as np
+import contextlib
 
 ### LIBRARY IMPORTS ###
+from .backend import get_array_module
 from .ui import loading_bars, initialize_loading_bar
 from .data_operations import normalization, batcher
-from .activation_functions import apply_activation, all_activations
+from .activation_functions import apply_activation, all_activations, is_row_wise, approximation
 from .model_operations import get_acc, get_preds_softmax
-from .memory_operations import optimize_labels
+from .memory_operations import optimize_labels, budget, iter_chunks, track_stage
 from .loss_functions import categorical_crossentropy, binary_crossentropy
 from .fitness_functions import wals
+from .instrumentation import stage, count, start_generation, end_generation, traced
 from .visualizations import (
-    draw_neural_web,
+    update_neural_web_for_learner,
     display_visualizations_for_learner,
     update_history_plots_for_learner,
     initialize_visualization_for_learner,
@@ -39,19 +42,46 @@ bar_format_learner = loading_bars()[1]
 
 # BUILD -----
 
+def _budget_chunks(x, y, activation_potentiation):
+    """
+    Splits host arrays into row chunks that fit memory_operations.budget. Returns [(x, y)] when one chunk is enough.
+    """
+    if not isinstance(x, np.ndarray) or not is_row_wise(activation_potentiation): return [(x, y)]
+
+    rows = budget.chunk_rows(x[0].nbytes, copies=len(activation_potentiation) + 3, n_rows=len(x))
+
+    if rows >= len(x): return [(x, y)]
+
+    return list(iter_chunks(x, y, batch_size=rows))
+
+
+def _stream_chunks(chunks, auto_normalization, x_name, y_name):
+    """
+    Checks an iterable of (x, y) chunks given without labels. Arrays need their labels, and auto_normalization needs the
+    max abs of the whole input, which a stream only knows at its end.
+    """
+    if hasattr(chunks, 'ndim'): raise ValueError(f"{y_name} is required when {x_name} is an array.")
+
+    if auto_normalization: raise ValueError(f"auto_normalization is not supported for an iterable of chunks. Normalize the chunks beforehand or give {x_name} and {y_name} as arrays.")
+
+    return chunks
+
+
+@track_stage('fit')
 def fit(
     x_train,
-    y_train,
+    y_train=None,
     activation_potentiation=['linear'],
     W=None,
     auto_normalization=False,
     dtype=np.float32
 ):
     """
-    Creates a model to fitting data.
+    Creates a model to fitting data. numpy input larger than memory_operations.budget allows is processed in row chunks.
     
     Args:
-        x_train (aray-like[num]): List or numarray of input data.
+        x_train (aray-like[num]): List or numarray of input data. (numpy or cupy arrays, computation runs on the backend of x_train)
+            Or an iterable of (x, y) chunks, for example memory_operations.iter_to_device(x_train, y_train). Then y_train is None and auto_normalization must be False.
 
         y_train (aray-like[num]): List or numarray of target labels. (one hot encoded)
 
@@ -68,25 +98,195 @@ def fit(
     """
 
     # Pre-check
-    
-    if len(x_train) != len(y_train): raise ValueError("x_train and y_train must have the same length.")
 
-    weight = np.zeros((len(y_train[0]), len(x_train[0].ravel()))).astype(dtype, copy=False) if W is None else W
+    if auto_normalization not in (True, False): raise ValueError('normalization parameter only be True or False')
 
-    if auto_normalization is True: x_train = normalization(apply_activation(x_train, activation_potentiation))
-    elif auto_normalization is False: x_train = apply_activation(x_train, activation_potentiation)
-    else: raise ValueError('normalization parameter only be True or False')
-    
-    weight += y_train.T @ x_train
+    # Chunks are summed, so chunked input gives the same weights as one array.
+
+    if y_train is None: chunks = _stream_chunks(x_train, auto_normalization, 'x_train', 'y_train')
+    else:
+        if len(x_train) != len(y_train): raise ValueError("x_train and y_train must have the same length.")
+        chunks = _budget_chunks(x_train, y_train, activation_potentiation)
+
+    scale = None
+
+    if auto_normalization is True and y_train is not None and len(chunks) > 1:
+        # Max abs of the whole activated input, so chunks are scaled like one array.
+        scale = max(np.max(np.abs(apply_activation(x_chunk, activation_potentiation).astype(np.float32, copy=False))) for x_chunk, _ in chunks)
+
+    weight = W
+
+    for x_chunk, y_chunk in chunks:
+
+        if len(x_chunk) != len(y_chunk): raise ValueError("x_train and y_train must have the same length.")
+
+        xp = get_array_module(x_chunk)
+
+        if weight is None: weight = xp.zeros((len(y_chunk[0]), len(x_chunk[0].ravel()))).astype(dtype, copy=False)
+
+        x_chunk = apply_activation(x_chunk, activation_potentiation)
+
+        if scale is not None: x_chunk = x_chunk / scale
+        elif auto_normalization is True: x_chunk = normalization(x_chunk)
+        
+        weight += y_chunk.T @ x_chunk
 
     return normalization(weight, dtype=dtype)
 
 
+def race_population(x, y, weight_pop, act_pop, acc_impact=0.9, loss_impact=0.1, loss='categorical_crossentropy', confidence=3.0, start=0.05, min_rows=32, rng=None):
+    """
+    Racing evaluation of a population. Genomes are scored on growing row prefixes (of a random row order) and a genome
+    is dropped once the upper confidence bound of its WALS fitness falls below the top half cutoff of evolver (the
+    ceil(pop/2)-th best lower confidence bound). Dropped genomes are certainly (up to the confidence) in the bad half, so
+    the rest of the rows are not computed for them.
+
+    Bounds are normal approximations with a finite population correction, limited by the exact bounds of the remaining
+    rows (all correct or all wrong, row losses between 0 and -log(1e-7) as clipped by the loss functions).
+    Genomes whose activations are not row-wise (sglu, spiral, circular) are evaluated on all rows at once.
+
+    Args:
+        x (array-like): Input rows (already normalized if auto_normalization is wanted).
+
+        y (array-like): One-hot labels.
+
+        weight_pop (array-like): Weights of the genomes.
+
+        act_pop (list): Activations of the genomes.
+
+        acc_impact (float, optional): Impact of accuracy in wals. Default: 0.9
+
+        loss_impact (float, optional): Impact of loss in wals. Default: 0.1
+
+        loss (str, optional): 'categorical_crossentropy' or 'binary_crossentropy'. Default: 'categorical_crossentropy'
+
+        confidence (float, optional): Width of the confidence bounds in standard errors. Higher drops fewer genomes. Default: 3.0
+
+        start (float, optional): First prefix as a fraction of rows. Prefixes double after it. Default: 0.05
+
+        min_rows (int, optional): Minimum rows of the first prefix. Default: 32
+
+        rng (numpy.random.Generator, optional): Random stream of the row order. Default: None (global numpy random state)
+
+    Returns:
+        tuple: (fitness, accuracies, losses, models). Survivors get their exact values on all rows and the same model tuple as
+        evaluate. Dropped genomes get their prefix estimates, capped below the lowest survivor fitness so any sorting of the
+        fitness keeps them in the bad half, and None as model.
+    """
+
+    xp = get_array_module(x)
+
+    n_rows = len(x)
+    pop_size = len(weight_pop)
+    top_count = pop_size - pop_size // 2 # size of the good half in evolver
+
+    epsilon = 1e-7
+    max_row_loss = -np.log(epsilon)
+
+    order = xp.asarray((np.random if rng is None else rng).permutation(n_rows))
+    x = x[order]
+    y = y[order]
+    y_labels = xp.argmax(y, axis=1)
+
+    correct = np.zeros(pop_size)
+    loss_sum = np.zeros(pop_size)
+    loss_sq_sum = np.zeros(pop_size)
+    seen = np.zeros(pop_size, dtype=int)
+    alive = np.ones(pop_size, dtype=bool)
+
+    results = [None] * pop_size
+    softmax_results = [None] * pop_size
+
+    stages = []
+    n = min(n_rows, max(min_rows, int(n_rows * start)))
+
+    while n < n_rows:
+        stages.append(n)
+        n *= 2
+
+    stages.append(n_rows)
+
+    for n in stages:
+
+        for j in np.flatnonzero(alive):
+
+            a = seen[j]
+            b = n if is_row_wise(act_pop[j]) else n_rows
+
+            if a == b: continue
+
+            if results[j] is None:
+                results[j] = xp.empty((n_rows, len(weight_pop[j])), dtype=weight_pop[j].dtype)
+                softmax_results[j] = xp.empty((n_rows, len(weight_pop[j])), dtype=weight_pop[j].dtype)
+
+            result = apply_activation(x[a:b], act_pop[j]) @ weight_pop[j].T
+
+            max_vals = xp.max(result, axis=1, keepdims=True)
+            softmax_preds = xp.exp(result - max_vals) / xp.sum(xp.exp(result - max_vals), axis=1, keepdims=True)
+
+            clipped = xp.clip(softmax_preds, epsilon, 1. - epsilon)
+
+            if loss == 'categorical_crossentropy':
+                row_losses = -xp.sum(y[a:b] * xp.log(clipped), axis=1)
+            else:
+                row_losses = -xp.mean(y[a:b] * xp.log(clipped) + (1 - y[a:b]) * xp.log(1 - clipped), axis=1)
+
+            correct[j] += float((xp.argmax(softmax_preds, axis=1) == y_labels[a:b]).sum())
+            loss_sum[j] += float(xp.sum(row_losses))
+            loss_sq_sum[j] += float(xp.sum(row_losses ** 2))
+
+            results[j][a:b] = result
+            softmax_results[j][a:b] = softmax_preds
+            seen[j] = b
+
+        if n == n_rows or alive.sum() <= top_count: continue
+
+        rows = seen[alive]
+        remaining = n_rows - rows
+        fpc = np.sqrt(remaining / max(n_rows - 1, 1))
+
+        acc = correct[alive] / rows
+        acc_width = confidence * 0.5 / np.sqrt(rows) * fpc
+        acc_lower = np.maximum(correct[alive] / n_rows, acc - acc_width)
+        acc_upper = np.minimum((correct[alive] + remaining) / n_rows, acc + acc_width)
+
+        mean_loss = loss_sum[alive] / rows
+        loss_std = np.sqrt(np.maximum(loss_sq_sum[alive] / rows - mean_loss ** 2, 0))
+        loss_width = confidence * loss_std / np.sqrt(rows) * fpc
+        loss_lower = np.maximum(loss_sum[alive] / n_rows, mean_loss - loss_width)
+        loss_upper = np.minimum((loss_sum[alive] + remaining * max_row_loss) / n_rows, mean_loss + loss_width)
+
+        lower = wals(acc_lower, loss_upper, acc_impact, loss_impact)
+        upper = wals(acc_upper, loss_lower, acc_impact, loss_impact)
+
+        cutoff = np.sort(lower)[::-1][top_count - 1]
+
+        alive[np.flatnonzero(alive)[upper < cutoff]] = False
+
+    accuracies = correct / seen
+    losses = loss_sum / seen
+    fitness = wals(accuracies, losses, acc_impact, loss_impact)
+
+    if not alive.all():
+        fitness[~alive] = np.minimum(fitness[~alive], np.nextafter(fitness[alive].min(), -np.inf))
+
+    inverse = xp.argsort(order)
+    models = [None] * pop_size
+
+    for j in np.flatnonzero(alive):
+        models[j] = (weight_pop[j], results[j][inverse], accuracies[j], None, None, softmax_results[j][inverse])
+
+    return fitness, accuracies, losses, models
+
+
+@traced
 def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1, pop_size=None,
            weight_evolve=True, neural_web_history=False, show_current_activations=False, auto_normalization=False,
            neurons_history=False, early_stop=False, show_history=False, target_loss=None,
            interval=33.33, target_acc=None, loss='categorical_crossentropy', acc_impact=0.9, loss_impact=0.1,
-           start_this_act=None, start_this_W=None, dtype=np.float32):
+           start_this_act=None, start_this_W=None, dtype=np.float32, checkpoint_path=None, checkpoint_interval=1, resume_from=None,
+           racing=False, racing_confidence=3.0, tracer=None, headless=False, rng=None, double_buffer=False,
+           approximate_activations=False):
     """
     Optimizes the activation functions for a neural network by leveraging train data to find 
     the most accurate combination of activation potentiation for the given dataset using genetic algorithm NEAT (Neuroevolution of Augmenting Topologies). But modifided for PLAN version. Created by me: PLANEAT. 
@@ -135,12 +335,24 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
     :param start_this_act: (list, optional): To resume a previously canceled or interrupted training from where it left off, or to continue from that point with a different strategy, provide the list of activation functions selected up to the learned portion to this parameter. Default is None
     :param start_this_W: (numpy.array, optional): To resume a previously canceled or interrupted training from where it left off, or to continue from that point with a different strategy, provide the weight matrix of this genome. Default is None
     :param dtype: (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16.
+    :param checkpoint_path: (str, optional): Directory to save the full evolutionary state to (weight population, activations, fitness, RNG states, best genome and history). Files are written atomically, so an interrupted save leaves the previous checkpoint intact. Default is None (no checkpoints)
+    :param checkpoint_interval: (int, optional): Saves a checkpoint every checkpoint_interval generations (and after the last one). Default is 1
+    :param resume_from: (str, optional): Checkpoint directory to resume from. The run continues with the saved population, generation counter, history and RNG states; gen is the total generation count including the already completed ones. Default is None
+    :param racing: (bool, optional): Evaluates each generation with race_population: all genomes share one train batch per generation and genomes that can no longer reach the top half (the good genomes of evolver) are dropped after a prefix of its rows. Saves most of the evaluation work on large datasets. Default is False
+    :param racing_confidence: (float, optional): Confidence bound width of racing in standard errors. Higher is safer but drops later. Default is 3.0
+    :param tracer: (instrumentation.Tracer, optional): Records per-stage timers (batch, fit, activation, matmul, softmax, loss, fitness, evolver, crossover, mutation ...), evaluation counts and per generation summaries. Default is None
+    :param headless: (bool, optional): For batch jobs: no progress bar, no prints and no visualization (tqdm, matplotlib and networkx are not imported). The results are returned as a dict instead of printed. Can't be combined with show_history, neurons_history, neural_web_history or show_current_activations. Default is False
+    :param rng: (numpy.random.Generator, optional): Seeded random stream of the run (initial population, batches, racing order and the optimizer's rng argument, so the optimizer must accept rng, as planeat.evolver does). Every generation draws from its own child stream, so results are bit-reproducible for a seed and a resumed run (given a Generator with the same seed) continues exactly like an uninterrupted one. Example: np.random.default_rng(42). Default is None (python random and the global numpy random state)
+    :param double_buffer: (bool, optional): Keeps the population in two preallocated (pop_size, output, input) arrays that are swapped every generation: the optimizer writes the new population into the spare one (its out argument, so the optimizer must accept out, as planeat.evolver does) and the old one becomes the spare of the next generation. Removes the full population allocations of every generation. Default is False
+    :param approximate_activations: (bool or activation_functions.approximation, optional): Ranks the genomes of each generation with activations computed from interpolation tables (see activation_functions.approximation), True for its defaults (max error 1e-3 on [-8, 8], use auto_normalization or normalized inputs) or an approximation(max_error=..., input_range=...). Fitting and the returned model are computed exactly. Default is False
 
     Returns:
         tuple: A list for model parameters: [Weight matrix, Test loss, Test Accuracy, [Activations functions]].
+        headless=True returns a dict: {'weights', 'predictions', 'accuracy', 'activations', 'train_accuracy', 'train_loss', 'generations', 'stopped_by', 'history': {'best_acc_per_gen', 'loss'}}. stopped_by is 'target_acc', 'target_loss', 'early_stop' or None.
     """
 
-    from .planeat import define_genomes
+    from .planeat import define_genomes, spawn_rngs
+    from .model_operations import save_checkpoint, load_checkpoint
 
     data = 'Train'
 
@@ -161,6 +373,10 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
 
     if target_acc is not None and (target_acc < 0 or target_acc > 1): raise ValueError('target_acc must be in range 0 and 1')
     if fit_start is not True and fit_start is not False: raise ValueError('fit_start parameter only be True or False. Please read doc-string')
+    if headless and (show_history or neurons_history or neural_web_history or show_current_activations):
+        raise ValueError('headless mode can not be combined with show_history, neurons_history, neural_web_history or show_current_activations')
+
+    approximate = approximation() if approximate_activations is True else approximate_activations or contextlib.nullcontext()
 
     # Initialize visualization components
     viz_objects = initialize_visualization_for_learner(show_history, neurons_history, neural_web_history, x_train, y_train)
@@ -174,10 +390,29 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
     loss_list = []
     target_pop = []
 
-    progress = initialize_loading_bar(total=activation_potentiation_len, desc="", ncols=77, bar_format=bar_format_learner)
+    progress = initialize_loading_bar(total=activation_potentiation_len, desc="", ncols=77, bar_format=bar_format_learner, disable=headless)
+
+    def finish(train_model, train_loss, display_loss, stopped_by):
+
+        if headless:
+            return {'weights': best_weight, 'predictions': best_model[get_preds_softmax()], 'accuracy': best_acc,
+                    'activations': final_activations, 'train_accuracy': train_model[get_acc()], 'train_loss': train_loss,
+                    'generations': len(best_acc_per_gen_list), 'stopped_by': stopped_by,
+                    'history': {'best_acc_per_gen': best_acc_per_gen_list, 'loss': loss_list}}
+
+        print('\nActivations: ', final_activations)
+        print(f'Train Accuracy:', train_model[get_acc()])
+        print(f'Train Loss: ', train_loss, '\n')
+
+        # Display final visualizations
+        display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, display_loss, y_train, interval)
+        return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+
+    init_rng, *generation_rngs = spawn_rngs(rng, gen + 1)
 
     if fit_start is False or pop_size > activation_potentiation_len:
-        weight_pop, act_pop = define_genomes(input_shape=len(x_train[0]), output_shape=len(y_train[0]), population_size=pop_size, dtype=dtype)
+        weight_pop, act_pop = define_genomes(input_shape=len(x_train[0]), output_shape=len(y_train[0]), population_size=pop_size, dtype=dtype, rng=init_rng,
+                                             lazy=fit_start) # with fit_start the first genomes are fit results, they are never drawn
 
     else:
         weight_pop = [0] * pop_size
@@ -187,8 +422,28 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
         weight_pop[0] = start_this_W
         act_pop[0] = start_this_act
 
+    start_gen = 0
+    population_buffer = None
+
+    if resume_from is not None:
+        checkpoint = load_checkpoint(resume_from, mmap_mode='c')
+
+        if len(checkpoint['weights']) != pop_size: raise ValueError(f"pop_size of the checkpoint is {len(checkpoint['weights'])}, not {pop_size}")
+
+        weight_pop = checkpoint['weights']
+        act_pop = checkpoint['activation_potentiations']
+        start_gen = checkpoint['generation']
+
+        best_acc_per_gen_list = checkpoint['history']['best_acc_per_gen']
+        loss_list = checkpoint['history']['loss']
+
+        state = checkpoint['state']
+        best_acc, best_loss, best_fitness = state['best_acc'], state['best_loss'], state['best_fitness']
+        best_weight, best_model, final_activations = state['best_weight'], state['best_model'], state['final_activations']
+
     # LEARNING STARTED
-    for i in range(gen):
+    for i in range(start_gen, gen):
+        start_generation(i)
         postfix_dict["Gen"] = str(i+1) + '/' + str(gen)
         progress.set_postfix(postfix_dict)
 
@@ -196,35 +451,67 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
         progress.last_print_n = 0
         progress.update(0)
 
-        for j in range(pop_size):
+        race_rng, evolver_rng, *batch_rngs = spawn_rngs(generation_rngs[i], pop_size + 2)
+        optimizer_kwargs = {} if rng is None else {'rng': evolver_rng}
+
+        def fit_genome(j, x_train_batch, y_train_batch):
 
-            x_train_batch, y_train_batch = batcher(x_train, y_train, batch_size=batch_size)
-            
             if fit_start is True and i == 0 and j < activation_potentiation_len:
                 if start_this_act is not None and j == 0:
                     pass
                 else:
-                    act_pop[j] = activation_potentiation[j]
+                    act_pop[j] = [activation_potentiation[j]]
                     W = fit(x_train_batch, y_train_batch, activation_potentiation=act_pop[j], auto_normalization=auto_normalization, dtype=dtype)
                     weight_pop[j] = W
             
             if weight_evolve is False:
                 weight_pop[j] = fit(x_train_batch, y_train_batch, activation_potentiation=act_pop[j], auto_normalization=auto_normalization, dtype=dtype)
-                
-            model = evaluate(x_train_batch, y_train_batch, W=weight_pop[j], activation_potentiation=act_pop[j], auto_normalization=auto_normalization)
-            acc = model[get_acc()]
-            
-            if loss == 'categorical_crossentropy':
-                train_loss = categorical_crossentropy(y_true_batch=y_train_batch, 
-                                                           y_pred_batch=model[get_preds_softmax()])
+
+        if racing:
+            with stage('batch'):
+                x_train_batch, y_train_batch = batcher(x_train, y_train, batch_size=batch_size, rng=batch_rngs[0]) # one batch for the whole race
+
+            with stage('fit'):
+                for j in range(pop_size): fit_genome(j, x_train_batch, y_train_batch)
+
+            with stage('race'), approximate:
+                x_race = normalization(x_train_batch, dtype=x_train_batch.dtype) if auto_normalization else x_train_batch
+                race_fitness, race_accs, race_losses, race_models = race_population(x_race, y_train_batch, weight_pop, act_pop, acc_impact, loss_impact,
+                                                                                     loss=loss, confidence=racing_confidence, rng=race_rng)
+            count('evaluations', pop_size)
+            count('racing_dropped', sum(model is None for model in race_models))
+
+        for j in range(pop_size):
+
+            if racing:
+                model, acc, train_loss, fitness = race_models[j], race_accs[j], race_losses[j], race_fitness[j]
+
             else:
-                train_loss = binary_crossentropy(y_true_batch=y_train_batch, 
-                                            y_pred_batch=model[get_preds_softmax()])
+                with stage('batch'):
+                    x_train_batch, y_train_batch = batcher(x_train, y_train, batch_size=batch_size, rng=batch_rngs[j])
+
+                with stage('fit'):
+                    fit_genome(j, x_train_batch, y_train_batch)
+                    
+                with stage('evaluate'), approximate:
+                    model = evaluate(x_train_batch, y_train_batch, W=weight_pop[j], activation_potentiation=act_pop[j], auto_normalization=auto_normalization)
+                    acc = model[get_acc()]
+                count('evaluations')
+                
+                with stage('loss'):
+                    if loss == 'categorical_crossentropy':
+                        train_loss = categorical_crossentropy(y_true_batch=y_train_batch, 
+                                                                   y_pred_batch=model[get_preds_softmax()])
+                    else:
+                        train_loss = binary_crossentropy(y_true_batch=y_train_batch, 
+                                                    y_pred_batch=model[get_preds_softmax()])
+
+                with stage('fitness'):
+                    fitness  = wals(acc, train_loss, acc_impact, loss_impact)
 
-            fitness  = wals(acc, train_loss, acc_impact, loss_impact)
             target_pop.append(fitness)
 
-            if fitness >= best_fitness:
+            if fitness >= best_fitness and model is not None: # genomes dropped by racing have no full evaluation
 
                 best_fitness = fitness
                 best_acc = acc
@@ -232,10 +519,15 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                 best_weight = np.copy(weight_pop[j])
                 best_model = model
 
+                if approximate_activations: # genomes are ranked approximately, the kept model is exact
+                    with stage('evaluate'):
+                        best_model = evaluate(x_train_batch, y_train_batch, W=weight_pop[j], activation_potentiation=act_pop[j], auto_normalization=auto_normalization)
+                        best_acc = best_model[get_acc()]
+
                 final_activations = act_pop[j].copy() if isinstance(act_pop[j], list) else act_pop[j]
                 final_activations = [final_activations[0]] if len(set(final_activations)) == 1 else final_activations # removing if all same
 
-                if batch_size == 1:
+                if batch_size == 1 and not headless:
                     postfix_dict[f"{data} Accuracy"] = np.round(best_acc, 4)
                     postfix_dict[f"{data} Loss"] = np.round(train_loss, 4)
                     progress.set_postfix(postfix_dict)
@@ -259,10 +551,7 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                     )
 
                 if neural_web_history:
-                    art5_1, art5_2, art5_3 = draw_neural_web(W=best_weight, ax=viz_objects['web']['ax'],
-                                                            G=viz_objects['web']['G'], return_objs=True)
-                    art5_list = [art5_1] + [art5_2] + list(art5_3.values())
-                    viz_objects['web']['artists'].append(art5_list)
+                    update_neural_web_for_learner(viz_objects, best_weight)
 
                 # Check target accuracy
                 if target_acc is not None and best_acc >= target_acc:
@@ -276,13 +565,7 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                         train_loss = binary_crossentropy(y_true_batch=y_train, 
                                                        y_pred_batch=train_model[get_preds_softmax()])
 
-                    print('\nActivations: ', final_activations)
-                    print(f'Train Accuracy:', train_model[get_acc()])
-                    print(f'Train Loss: ', train_loss, '\n')
-                    
-                    display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, 
-                                              best_loss, y_train, interval)
-                    return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+                    return finish(train_model, train_loss, best_loss, 'target_acc')
             
                 # Check target loss
                 if target_loss is not None and best_loss <= target_loss:
@@ -297,14 +580,7 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                         train_loss = binary_crossentropy(y_true_batch=y_train, 
                                                        y_pred_batch=train_model[get_preds_softmax()])
 
-                    print('\nActivations: ', final_activations)
-                    print(f'Train Accuracy :', train_model[get_acc()])
-                    print(f'Train Loss : ', train_loss, '\n')
-
-                    # Display final visualizations
-                    display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, 
-                                              train_loss, y_train, interval)
-                    return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+                    return finish(train_model, train_loss, train_loss, 'target_loss')
 
             
             progress.update(1)
@@ -330,8 +606,27 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
             best_acc_per_gen_list.append(best_acc)
             loss_list.append(best_loss)
 
-        weight_pop, act_pop = optimizer(np.array(weight_pop, copy=False, dtype=dtype), act_pop, i, np.array(target_pop, dtype=dtype, copy=False), weight_evolve=weight_evolve, bar_status=False)
+        with stage('evolver'):
+            weight_pop = np.array(weight_pop, copy=False, dtype=dtype)
+
+            if double_buffer:
+                if population_buffer is None: population_buffer = np.empty(weight_pop.shape, dtype=dtype)
+                optimizer_kwargs['out'] = population_buffer
+
+            new_weight_pop, act_pop = optimizer(weight_pop, act_pop, i, np.array(target_pop, dtype=dtype, copy=False), weight_evolve=weight_evolve, bar_status=False, **optimizer_kwargs)
+
+            if double_buffer: population_buffer = weight_pop # the old population is the output of the next generation
+            weight_pop = new_weight_pop
+
+        if checkpoint_path is not None and ((i + 1) % checkpoint_interval == 0 or i + 1 == gen):
+            with stage('checkpoint'):
+                save_checkpoint(checkpoint_path, weight_pop, act_pop, generation=i + 1, fitness=target_pop,
+                                history={'best_acc_per_gen': best_acc_per_gen_list, 'loss': loss_list},
+                                state={'best_acc': best_acc, 'best_loss': best_loss, 'best_fitness': best_fitness,
+                                       'best_weight': best_weight, 'best_model': best_model, 'final_activations': final_activations})
+
         target_pop = []
+        end_generation()
 
         # Early stopping check
         if early_stop == True and i > 0:
@@ -340,21 +635,14 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                 train_model = evaluate(x_train, y_train, W=best_weight, 
                                     activation_potentiation=final_activations, auto_normalization=auto_normalization)
                 
-            if loss == 'categorical_crossentropy':
-                train_loss = categorical_crossentropy(y_true_batch=y_train, 
+                if loss == 'categorical_crossentropy':
+                    train_loss = categorical_crossentropy(y_true_batch=y_train, 
+                                                        y_pred_batch=train_model[get_preds_softmax()])
+                else:
+                    train_loss = binary_crossentropy(y_true_batch=y_train, 
                                                     y_pred_batch=train_model[get_preds_softmax()])
-            else:
-                train_loss = binary_crossentropy(y_true_batch=y_train, 
-                                                y_pred_batch=train_model[get_preds_softmax()])
-
-            print('\nActivations: ', final_activations)
-            print(f'Train Accuracy:', train_model[get_acc()])
-            print(f'Train Loss: ', train_loss, '\n')
 
-            # Display final visualizations
-            display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, 
-                                        train_loss, y_train, interval)
-            return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+                return finish(train_model, train_loss, train_loss, 'early_stop')
 
     # Final evaluation
     progress.close()
@@ -368,27 +656,23 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
         train_loss = binary_crossentropy(y_true_batch=y_train, 
                                         y_pred_batch=train_model[get_preds_softmax()])
         
-    print('\nActivations: ', final_activations)
-    print(f'Train Accuracy:', train_model[get_acc()])
-    print(f'Train Loss: ', train_loss, '\n')
-
-    # Display final visualizations
-    display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, train_loss, y_train, interval)
-    return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+    return finish(train_model, train_loss, train_loss, None)
 
 
+@track_stage('evaluate')
 def evaluate(
     x_test,
-    y_test,
-    W,
+    y_test=None,
+    W=None,
     activation_potentiation=['linear'],
     auto_normalization=False
 ) -> tuple:
     """
-    Evaluates the neural network model using the given test data.
+    Evaluates the neural network model using the given test data. numpy input larger than memory_operations.budget allows is processed in row chunks.
 
     Args:
-        x_test (np.ndarray): Test data.
+        x_test (np.ndarray): Test data. (numpy or cupy arrays, computation runs on the backend of x_test)
+            Or an iterable of (x, y) chunks, for example memory_operations.iter_to_device(x_test, y_test). Then y_test is None and auto_normalization must be False.
 
         y_test (np.ndarray): Test labels (one-hot encoded).
 
@@ -402,15 +686,45 @@ def evaluate(
         tuple: Model (list).
     """
 
-    if auto_normalization: x_test = normalization(x_test, dtype=x_test.dtype)
+    if y_test is None: chunks = _stream_chunks(x_test, auto_normalization, 'x_test', 'y_test')
+    else: chunks = _budget_chunks(x_test, y_test, activation_potentiation)
 
-    x_test = apply_activation(x_test, activation_potentiation)
-    
-    result = x_test @ W.T
-    
-    max_vals = np.max(result, axis=1, keepdims=True)
-    
-    softmax_preds = np.exp(result - max_vals) / np.sum(np.exp(result - max_vals), axis=1, keepdims=True)
-    accuracy = (np.argmax(softmax_preds, axis=1) == np.argmax(y_test, axis=1)).mean()
+    scale = None
+
+    if auto_normalization and y_test is not None and len(chunks) > 1:
+        scale = max(np.max(np.abs(x_chunk)) for x_chunk, _ in chunks) # Max abs of the whole x_test
+
+    results = []
+    softmax_chunks = []
+    correct = 0
+    total = 0
+
+    for x_chunk, y_chunk in chunks:
+
+        xp = get_array_module(x_chunk)
+
+        if scale is not None: x_chunk = x_chunk / scale
+        elif auto_normalization: x_chunk = normalization(x_chunk, dtype=x_chunk.dtype)
+
+        with stage('activation'):
+            x_chunk = apply_activation(x_chunk, activation_potentiation)
+        
+        with stage('matmul'):
+            result = x_chunk @ W.T
+        
+        with stage('softmax'):
+            max_vals = xp.max(result, axis=1, keepdims=True)
+            
+            softmax_preds = xp.exp(result - max_vals) / xp.sum(xp.exp(result - max_vals), axis=1, keepdims=True)
+        correct += (xp.argmax(softmax_preds, axis=1) == xp.argmax(y_chunk, axis=1)).sum()
+        total += len(x_chunk)
+
+        results.append(result)
+        softmax_chunks.append(softmax_preds)
+
+    if len(results) == 1: result, softmax_preds = results[0], softmax_chunks[0]
+    else: result, softmax_preds = xp.concatenate(results), xp.concatenate(softmax_chunks)
+
+    accuracy = correct / total
     
     return W, result, accuracy, None, None, softmax_preds
\ No newline at end of file
@@ -19,14 +19,14 @@ import cupy as cp
 
 ### LIBRARY IMPORTS ###
 from .ui import loading_bars, initialize_loading_bar
-from .data_operations_cuda import normalization
-from .activation_functions_cuda import apply_activation, all_activations
+from .plan import fit, evaluate # shared with plan, they run on the backend of their inputs
+from .activation_functions_cuda import all_activations
 from .model_operations_cuda import get_acc, get_preds_softmax
 from .memory_operations import transfer_to_gpu, transfer_to_cpu, optimize_labels
 from .loss_functions_cuda import categorical_crossentropy, binary_crossentropy
 from .fitness_functions import wals
 from .visualizations_cuda import (
-    draw_neural_web,
+    update_neural_web_for_learner,
     display_visualizations_for_learner,
     update_history_plots_for_learner,
     initialize_visualization_for_learner,
@@ -39,48 +39,11 @@ bar_format_learner = loading_bars()[1]
 
 # BUILD -----
 
-def fit(
-    x_train,
-    y_train,
-    activation_potentiation=['linear'],
-    W=None,
-    auto_normalization=False,
-    dtype=cp.float32
-):
-    """
-    Creates a model to fitting data.,
-    
-    fit Args:
-        :param (aray-like[cupy]) x_train: (aray-like[cupy]): List or cupy array of input data.
-        :param (aray-like[cupy]) y_train: List or cupy array of target labels. (one hot encoded)
-        :param (list) activation_potentiation: For deeper PLAN networks, activation function parameters. For more information please run this code: plan.activations_list() default: [None] (optional)
-        W (cupy.ndarray, optional): If you want to re-continue or update model
-        auto_normalization (bool, optional): Normalization may solves overflow problem. Default: False
-        dtype (cupy.dtype, optional): Data type for the arrays. cp.float32 by default. Example: cp.float64 or cp.float16.
-
-    Returns:
-        cupyarray: (Weight matrix).
-    """
-    # Pre-check
-    
-    if len(x_train) != len(y_train): raise ValueError("x_train and y_train must have the same length.")
-
-    weight = cp.zeros((len(y_train[0]), len(x_train[0].ravel()))).astype(dtype, copy=False) if W is None else W
-
-    if auto_normalization is True: x_train = normalization(apply_activation(x_train, activation_potentiation))
-    elif auto_normalization is False: x_train = apply_activation(x_train, activation_potentiation)
-    else: raise ValueError('normalization parameter only be True or False')
-    
-    weight += y_train.T @ x_train
-
-    return normalization(weight, dtype=dtype)
-
-
 def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1, pop_size=None,
            weight_evolve=True, neural_web_history=False, show_current_activations=False, auto_normalization=False, target_acc=None,
            neurons_history=False, early_stop=False, show_history=False, loss='categorical_crossentropy',
            interval=33.33, target_loss=None, loss_impact=0.1, acc_impact=0.9,
-           start_this_act=None, start_this_W=None, dtype=cp.float32, memory='gpu'):
+           start_this_act=None, start_this_W=None, dtype=cp.float32, memory='gpu', checkpoint_path=None, checkpoint_interval=1, resume_from=None):
     """
     Optimizes the activation functions for a neural network by leveraging train data to find 
     the most accurate combination of activation potentiation for the given dataset.
@@ -130,12 +93,16 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
     :param start_this_W: (cupy.array, optional): To resume a previously canceled or interrupted training from where it left off, or to continue from that point with a different strategy, provide the weight matrix of this genome. Default is None
     :param dtype: (cupy.dtype): Data type for the arrays. np.float32 by default. Example: cp.float64 or cp.float16.
     :param memory: (str): The memory parameter determines whether the dataset to be processed on the GPU will be stored in the CPU's RAM or the GPU's RAM. Options:  'gpu', 'cpu'. Default: 'gpu'.
+    :param checkpoint_path: (str, optional): Directory to save the full evolutionary state to (weight population, activations, fitness, RNG states, best genome and history). Files are written atomically, so an interrupted save leaves the previous checkpoint intact. cupy.random state is not saved. Default is None (no checkpoints)
+    :param checkpoint_interval: (int, optional): Saves a checkpoint every checkpoint_interval generations (and after the last one). Default is 1
+    :param resume_from: (str, optional): Checkpoint directory to resume from. The run continues with the saved population, generation counter, history and RNG states; gen is the total generation count including the already completed ones. Default is None
 
     Returns:
         tuple: A list for model parameters: [Weight matrix, Preds, Accuracy, [Activations functions]]. You can acces this parameters in model_operations module. For example: model_operations.get_weights() for Weight matrix.
     """
 
     from .planeat_cuda import define_genomes
+    from .model_operations import save_checkpoint, load_checkpoint
 
     data = 'Train'
 
@@ -193,8 +160,26 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
         weight_pop[0] = start_this_W
         act_pop[0] = start_this_act
 
+    start_gen = 0
+
+    if resume_from is not None:
+        checkpoint = load_checkpoint(resume_from, mmap_mode='c')
+
+        if len(checkpoint['weights']) != pop_size: raise ValueError(f"pop_size of the checkpoint is {len(checkpoint['weights'])}, not {pop_size}")
+
+        weight_pop = cp.asarray(checkpoint['weights'])
+        act_pop = checkpoint['activation_potentiations']
+        start_gen = checkpoint['generation']
+
+        best_acc_per_gen_list = checkpoint['history']['best_acc_per_gen']
+        loss_list = checkpoint['history']['loss']
+
+        state = checkpoint['state']
+        best_acc, best_loss, best_fitness = state['best_acc'], state['best_loss'], state['best_fitness']
+        best_weight, best_model, final_activations = cp.asarray(state['best_weight']), state['best_model'], state['final_activations']
+
     # LEARNING STARTED
-    for i in range(gen):
+    for i in range(start_gen, gen):
         postfix_dict["Gen"] = str(i+1) + '/' + str(gen)
         progress.set_postfix(postfix_dict)
 
@@ -213,7 +198,7 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                 if start_this_act is not None and j == 0:
                     pass
                 else:
-                    act_pop[j] = activation_potentiation[j]
+                    act_pop[j] = [activation_potentiation[j]]
                     W = fit(x_train_batch, y_train_batch, activation_potentiation=act_pop[j], auto_normalization=auto_normalization, dtype=dtype)
                     weight_pop[j] = W
                     
@@ -269,10 +254,7 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                     )
 
                 if neural_web_history:
-                    art5_1, art5_2, art5_3 = draw_neural_web(W=best_weight, ax=viz_objects['web']['ax'],
-                                                            G=viz_objects['web']['G'], return_objs=True)
-                    art5_list = [art5_1] + [art5_2] + list(art5_3.values())
-                    viz_objects['web']['artists'].append(art5_list)
+                    update_neural_web_for_learner(viz_objects, best_weight)
 
                 # Check target accuracy
                 if target_acc is not None and best_acc >= target_acc:
@@ -341,6 +323,13 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
             loss_list.append(best_loss)
 
         weight_pop, act_pop = optimizer(cp.array(weight_pop, copy=False, dtype=dtype), act_pop, i, cp.array(target_pop, dtype=dtype, copy=False), weight_evolve=weight_evolve, bar_status=False)
+
+        if checkpoint_path is not None and ((i + 1) % checkpoint_interval == 0 or i + 1 == gen):
+            save_checkpoint(checkpoint_path, weight_pop, act_pop, generation=i + 1, fitness=target_pop,
+                            history={'best_acc_per_gen': best_acc_per_gen_list, 'loss': loss_list},
+                            state={'best_acc': best_acc, 'best_loss': best_loss, 'best_fitness': best_fitness,
+                                   'best_weight': cp.asnumpy(best_weight), 'best_model': best_model, 'final_activations': final_activations})
+
         target_pop = []
 
         # Early stopping check
@@ -350,21 +339,21 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
                 train_model = evaluate(x_train, y_train, W=best_weight, 
                                     activation_potentiation=final_activations, auto_normalization=auto_normalization)
                 
-            if loss == 'categorical_crossentropy':
-                train_loss = categorical_crossentropy(y_true_batch=y_train, 
+                if loss == 'categorical_crossentropy':
+                    train_loss = categorical_crossentropy(y_true_batch=y_train, 
+                                                        y_pred_batch=train_model[get_preds_softmax()])
+                else:
+                    train_loss = binary_crossentropy(y_true_batch=y_train, 
                                                     y_pred_batch=train_model[get_preds_softmax()])
-            else:
-                train_loss = binary_crossentropy(y_true_batch=y_train, 
-                                                y_pred_batch=train_model[get_preds_softmax()])
 
-            print('\nActivations: ', final_activations)
-            print(f'Train Accuracy:', train_model[get_acc()])
-            print(f'Train Loss: ', train_loss, '\n')
+                print('\nActivations: ', final_activations)
+                print(f'Train Accuracy:', train_model[get_acc()])
+                print(f'Train Loss: ', train_loss, '\n')
 
-            # Display final visualizations
-            display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, 
-                                        train_loss, y_train, interval)
-            return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
+                # Display final visualizations
+                display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, 
+                                            train_loss, y_train, interval)
+                return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
 
     # Final evaluation
     progress.close()
@@ -385,41 +374,3 @@ def learner(x_train, y_train, optimizer, fit_start=True, gen=None, batch_size=1,
     # Display final visualizations
     display_visualizations_for_learner(viz_objects, best_weight, data, best_acc, train_loss, y_train, interval)
     return best_weight, best_model[get_preds_softmax()], best_acc, final_activations
-
-def evaluate(
-    x_test,
-    y_test,
-    W,
-    activation_potentiation=['linear'],
-    auto_normalization=False
-) -> tuple:
-    """
-    Evaluates the neural network model using the given test data.
-
-    Args:
-        x_test (cp.ndarray): Test data.
-        
-        y_test (cp.ndarray): Test labels (one-hot encoded).
-        
-        W (cp.ndarray): Neural net weight matrix.
-        
-        activation_potentiation (list): Activation list. Default = ['linear'].
-
-        auto_normalization (bool, optional): Normalization for x_test ? Default = False.
-        
-    Returns:
-        tuple: Model (list).
-    """
-
-    if auto_normalization: x_test = normalization(x_test, dtype=x_test.dtype)
-
-    x_test = apply_activation(x_test, activation_potentiation)
-    
-    result = x_test @ W.T
-
-    max_vals = cp.max(result, axis=1, keepdims=True)
-
-    softmax_preds = cp.exp(result - max_vals) / cp.sum(cp.exp(result - max_vals), axis=1, keepdims=True)
-    accuracy = (cp.argmax(softmax_preds, axis=1) == cp.argmax(y_test, axis=1)).mean()
-
-    return W, result, accuracy, None, None, softmax_preds
\ No newline at end of file
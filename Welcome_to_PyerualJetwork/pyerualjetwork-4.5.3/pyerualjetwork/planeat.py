@@ -17,11 +17,132 @@ import random
 import math
 
 ### LIBRARY IMPORTS ###
-from .data_operations import normalization, non_neg_normalization
+from .backend import get_array_module
+from .data_operations import non_neg_normalization
 from .ui import loading_bars, initialize_loading_bar
-from .activation_functions import apply_activation, all_activations
+from .activation_functions import apply_activation, all_activations, is_row_wise
+from .instrumentation import stage
+from .memory_operations import budget
 
-def define_genomes(input_shape, output_shape, population_size, dtype=np.float32):
+def spawn_rngs(rng, n):
+   """
+   Independent child streams of a numpy.random.Generator, one per genome or worker. Children depend only on the parent's
+   seed and on how many children were spawned before, not on which worker draws from them, so runs are reproducible
+   for any worker count. Returns [None] * n for rng=None (global random state).
+   """
+   if rng is None: return [None] * n
+   if hasattr(rng, 'spawn'): return rng.spawn(n)
+
+   return [np.random.default_rng(seed) for seed in rng.bit_generator._seed_seq.spawn(n)] # numpy < 1.25
+
+def _uniform(rng, low, high):
+   return random.uniform(low, high) if rng is None else rng.uniform(low, high)
+
+class _SortedRows:
+   """
+   Rows of a population in a given order without gathering them into a new array. Indexing returns views,
+   so in place changes (mutation) go to the population itself.
+   """
+
+   def __init__(self, weights, order):
+      self.weights = weights
+      self.order = order
+
+   def __len__(self):
+      return len(self.order)
+
+   def __getitem__(self, i):
+      return self.weights[self.order[i]]
+
+
+def _activate_genomes(weights, activations, indices, dtype=np.float32):
+   """
+   Applies the activation of each genome in indices to its weight rows and max abs normalizes every row, in place.
+   Genomes sharing an activation are processed as one (rows, input) block.
+   """
+   xp = get_array_module(weights)
+
+   groups = {}
+   for i in indices: groups.setdefault(activations[i], []).append(i)
+
+   for activation, group in groups.items():
+
+      block = weights[group]
+      rows = block.reshape(-1, block.shape[-1])
+
+      if is_row_wise([activation]): rows = apply_activation(rows, [activation])
+      else: rows = xp.stack([apply_activation(row, [activation]) for row in rows])
+
+      rows = rows.astype(dtype, copy=False)
+      weights[group] = (rows / xp.max(xp.abs(rows), axis=-1, keepdims=True)).reshape(block.shape)
+
+
+class LazyPopulation:
+   """
+   Population of define_genomes(lazy=True). A genome is drawn and activated when it is first read, genomes that are
+   assigned before (plan.learner replaces its first genomes with fit results) are never drawn. Every genome has its own
+   random stream, so its weights don't depend on the access order.
+
+   Indexing with an int returns the genome, any other index or np.asarray materializes the whole population.
+   """
+
+   def __init__(self, shape, activations, rngs, dtype=np.float32, xp=np):
+      self.shape = tuple(shape)
+      self.dtype = np.dtype(dtype)
+      self.ndim = len(self.shape)
+      self._xp = xp
+      self._rngs = rngs
+      self._activations = list(activations)
+      self._weights = xp.empty(self.shape, dtype=dtype)
+      self._ready = [False] * self.shape[0]
+
+   def __len__(self):
+      return self.shape[0]
+
+   def _materialize(self, indices):
+
+      for i in indices: self._weights[i] = self._xp.asarray(self._rngs[i].uniform(-1, 1, self.shape[1:]))
+      _activate_genomes(self._weights, self._activations, indices, dtype=self.dtype)
+
+      for i in indices:
+         self._ready[i] = True
+         self._rngs[i] = None
+
+   def materialize(self):
+      """
+      Draws every pending genome and returns the population array (of the xp namespace).
+      """
+      pending = [i for i, ready in enumerate(self._ready) if not ready]
+      if pending: self._materialize(pending)
+
+      return self._weights
+
+   def __getitem__(self, key):
+
+      if isinstance(key, (int, np.integer)):
+         i = range(len(self))[key]
+         if not self._ready[i]: self._materialize([i])
+
+         return self._weights[i]
+
+      return self.materialize()[key]
+
+   def __setitem__(self, key, value):
+
+      i = range(len(self))[key]
+      self._weights[i] = value
+      self._ready[i] = True
+      self._rngs[i] = None
+
+   def __array__(self, dtype=None):
+
+      weights = self.materialize()
+      if not isinstance(weights, np.ndarray): weights = weights.get()
+
+      return np.asarray(weights, dtype=dtype)
+
+
+def define_genomes(input_shape, output_shape, population_size, dtype=np.float32, xp=np, rng=None, lazy=False):
    """
    Initializes a population of genomes, where each genome is represented by a set of weights 
    and an associated activation function. Each genome is created with random weights and activation 
@@ -37,6 +158,13 @@ def define_genomes(input_shape, output_shape, population_size, dtype=np.float32)
 
       dtype (numpy.dtype): Data type for the arrays. np.float32 by default. Example: np.float64 or np.float16.
 
+      xp (module): Array namespace of the population. numpy by default. Example: cupy or backend.emulated.
+
+      rng (numpy.random.Generator, optional): Random stream of the population. Default: None (python random and the global numpy/cupy random state)
+
+      lazy (bool, optional): Returns a LazyPopulation: genomes are drawn on first use, each from its own child stream of rng
+         (of a Generator seeded from the global numpy random state if rng is None), so the weights differ from lazy=False. Default: False
+
    Returns:
       tuple: A tuple containing:
          - population_weights (numpy.ndarray): A 2D numpy array of shape (population_size, output_shape, input_shape) representing the 
@@ -48,26 +176,35 @@ def define_genomes(input_shape, output_shape, population_size, dtype=np.float32)
       Activation functions are selected randomly from a predefined list `all_activations()`.
       The weights for each genome are then modified by applying the corresponding activation function 
       and normalized using the `normalization()` function. (Max abs normalization.)
+      The weights are drawn in chunks of genomes sized by memory_operations.budget and genomes sharing an activation are activated together.
    """
-   population_weights = [0] * population_size
-   population_activations = [0] * population_size
-
    except_this = ['spiral', 'circular']
    activations = [item for item in all_activations() if item not in except_this] # SPIRAL AND CIRCULAR ACTIVATION DISCARDED
 
-   for i in range(len(population_weights)):
+   population_activations = [activations[int(_uniform(rng, 0, len(activations)-1))] for _ in range(population_size)]
+
+   shape = (population_size, output_shape, input_shape)
+
+   if lazy:
+      if rng is None: rng = np.random.default_rng(np.random.randint(0, 2**31 - 1))
+
+      return LazyPopulation(shape, population_activations, spawn_rngs(rng, population_size), dtype=dtype, xp=xp), population_activations
 
-      population_weights[i] = np.random.uniform(-1, 1, (output_shape, input_shape)).astype(dtype)
-      population_activations[i] = activations[int(random.uniform(0, len(activations)-1))]
+   population_weights = xp.empty(shape, dtype=dtype)
+   chunk = budget.chunk_rows(output_shape * input_shape * 8, n_rows=population_size) # float64 draws and their cast
 
-      # ACTIVATIONS APPLYING IN WEIGHTS SPECIFIC OUTPUT CONNECTIONS (MORE PLAN LIKE FEATURES(FOR NON-LINEARITY)):
+   for start in range(0, population_size, chunk):
 
-      for j in range(population_weights[i].shape[0]):
+      draw_shape = (min(chunk, population_size - start), output_shape, input_shape)
 
-         population_weights[i][j,:] = apply_activation(population_weights[i][j,:], population_activations[i])
-         population_weights[i][j,:] = normalization(population_weights[i][j,:], dtype=dtype)
+      if rng is None: population_weights[start:start + chunk] = xp.random.uniform(-1, 1, draw_shape)
+      else: population_weights[start:start + chunk] = xp.asarray(rng.uniform(-1, 1, draw_shape))
 
-   return np.array(population_weights, dtype=dtype), population_activations
+   # ACTIVATIONS APPLYING IN WEIGHTS SPECIFIC OUTPUT CONNECTIONS (MORE PLAN LIKE FEATURES(FOR NON-LINEARITY)):
+
+   _activate_genomes(population_weights, population_activations, range(population_size), dtype=dtype)
+
+   return population_weights, population_activations
 
 
 def evolver(weights, 
@@ -93,7 +230,9 @@ def evolver(weights,
             activation_mutate_threshold=20,
             weight_mutate_threshold=16,
             weight_mutate_prob=1,
-            dtype=np.float32):
+            dtype=np.float32,
+            rng=None,
+            out=None):
    """
    Applies the evolving process of a population of genomes using selection, crossover, mutation, and activation function potentiation.
    The function modifies the population's weights and activation functions based on a specified policy, mutation probabilities, and strategy.
@@ -102,7 +241,7 @@ def evolver(weights,
    'mutate' args effects mutation.
 
    Args:
-      weights (numpy.ndarray): Array of weights for each genome. 
+      weights (numpy.ndarray): Array of weights for each genome. (numpy or cupy, evolving runs on the backend of weights)
          (first returned value of define_genomes function)
       
       activation_potentiations (list): A list of activation functions for each genome. 
@@ -182,6 +321,12 @@ def evolver(weights,
       dtype (numpy.dtype, optional): Data type for the arrays. Default: np.float32. 
          Example: np.float64 or np.float16 [fp32 for balanced devices, fp64 for strong devices, fp16 for weak devices: not recommended!].
 
+      rng (numpy.random.Generator, optional): Random stream of the generation. Every offspring draws from its own child stream (spawn_rngs), so the result is bit-reproducible for a given seed. Default: None (python random and the global numpy/cupy random state)
+
+      out (array-like, optional): Preallocated array of the population's shape and dtype (not sharing memory with weights) the new population is written to and returned as.
+         With out, weights is used as scratch: parents are read through the fitness order in place and mutated rows are changed in weights, so no sorted copy of the population is made.
+         plan.learner(double_buffer=True) swaps two such arrays every generation. The result is the same as without out. Default: None (a new array)
+
    Raises:
       ValueError: 
          - If `policy` is not one of the specified values ('aggressive', 'explorer').
@@ -264,22 +409,35 @@ def evolver(weights,
    else:
       raise ValueError("genome population size must be even number. for example: not 99, make 100 or 98.")
 
-   if weight_evolve is False: origin_weights = np.copy(weights)
+   xp = get_array_module(weights)
+
+   if out is not None and (out.shape != weights.shape or xp.may_share_memory(out, weights)):
+      raise ValueError("out must be a separate array with the shape of weights")
+
+   if weight_evolve is False and out is None: origin_weights = xp.copy(weights)
 
 ### FITNESS IS SORTED IN ASCENDING ORDER, AND THE WEIGHT AND ACTIVATIONS OF EACH GENOME ARE SORTED ACCORDING TO THIS ORDER:
 
-   sort_indices = np.argsort(fitness)
+   sort_indices = xp.argsort(fitness)
 
    fitness = fitness[sort_indices]
-   weights = weights[sort_indices]
+   order = sort_indices.tolist()
+
+   if out is None: weights = weights[sort_indices]
 
-   activation_potentiations = [activation_potentiations[i] for i in sort_indices]
+   activation_potentiations = [activation_potentiations[i] for i in order]
 
 ### GENOMES ARE DIVIDED INTO TWO GROUPS: GOOD GENOMES AND BAD GENOMES:
 
-   good_weights = weights[slice_center:]
-   bad_weights = weights[:slice_center]
-   best_weight = np.copy(good_weights[-1])
+   if out is None:
+      good_weights = weights[slice_center:]
+      bad_weights = weights[:slice_center]
+
+   else:
+      good_weights = _SortedRows(weights, order[slice_center:])
+      bad_weights = _SortedRows(weights, order[:slice_center])
+
+   best_weight = xp.copy(good_weights[-1])
 
    good_activations = list(activation_potentiations[slice_center:])
    bad_activations = list(activation_potentiations[:slice_center])
@@ -296,14 +454,19 @@ def evolver(weights,
    best_fitness = normalized_fitness[-1]
    epsilon = np.finfo(float).eps
 
-   child_W = np.copy(bad_weights)
+   new_weights = xp.empty(weights.shape, dtype=weights.dtype) if out is None else out
+
+   child_W = new_weights[:slice_center]
    child_act = bad_activations.copy()
 
-   mutated_W = np.copy(bad_weights)
+   mutated_W = new_weights[slice_center:]
    mutated_act = bad_activations.copy()
 
+   genome_rngs = spawn_rngs(rng, len(bad_weights))
 
    for i in range(len(bad_weights)):
+
+      genome_rng = genome_rngs[i]
       
       if policy == 'aggressive':
          first_parent_W = best_weight
@@ -315,25 +478,27 @@ def evolver(weights,
 
       else: raise ValueError("policy parameter must be: 'aggressive' or 'explorer'")
          
-      second_parent_W, second_parent_act, s_i = second_parent_selection(good_weights, bad_weights, good_activations, bad_activations, bad_genomes_selection_prob)
-
-      child_W[i], child_act[i] = cross_over(first_parent_W,
-                                             second_parent_W,
-                                             first_parent_act,
-                                             second_parent_act,
-                                             cross_over_mode=cross_over_mode,
-                                             activation_selection_add_prob=activation_selection_add_prob,
-                                             activation_selection_change_prob=activation_selection_change_prob,
-                                             activation_selection_threshold=activation_selection_threshold,
-                                             bad_genomes_selection_prob=bad_genomes_selection_prob,
-                                             first_parent_fitness=best_fitness,
-                                             fitness_bias=fitness_bias,
-                                             second_parent_fitness=normalized_fitness[s_i],
-                                             weight_evolve=weight_evolve,
-                                             epsilon=epsilon
-                                             )
-
-      mutation_prob = random.uniform(0, 1)
+      second_parent_W, second_parent_act, s_i = second_parent_selection(good_weights, bad_weights, good_activations, bad_activations, bad_genomes_selection_prob, rng=genome_rng)
+
+      with stage('crossover'):
+         child_W[i], child_act[i] = cross_over(first_parent_W,
+                                                second_parent_W,
+                                                first_parent_act,
+                                                second_parent_act,
+                                                cross_over_mode=cross_over_mode,
+                                                activation_selection_add_prob=activation_selection_add_prob,
+                                                activation_selection_change_prob=activation_selection_change_prob,
+                                                activation_selection_threshold=activation_selection_threshold,
+                                                bad_genomes_selection_prob=bad_genomes_selection_prob,
+                                                first_parent_fitness=best_fitness,
+                                                fitness_bias=fitness_bias,
+                                                second_parent_fitness=normalized_fitness[s_i],
+                                                weight_evolve=weight_evolve,
+                                                epsilon=epsilon,
+                                                rng=genome_rng
+                                                )
+
+      mutation_prob = _uniform(genome_rng, 0, 1)
 
       if mutation_prob > bad_genomes_mutation_prob:
             genome_W = good_weights[i]
@@ -347,26 +512,30 @@ def evolver(weights,
 
             fitness_index = i
 
-      mutated_W[i], mutated_act[i] = mutation(genome_W, 
-                                             genome_act,
-                                             activation_mutate_prob=activation_mutate_prob,
-                                             activation_add_prob=activation_mutate_add_prob,
-                                             activation_delete_prob=activation_mutate_delete_prob, 
-                                             activation_change_prob=activation_mutate_change_prob, 
-                                             weight_mutate_prob=weight_mutate_prob, 
-                                             weight_mutate_threshold=weight_mutate_threshold,
-                                             genome_fitness=normalized_fitness[fitness_index],
-                                             activation_mutate_threshold=activation_mutate_threshold,
-                                             weight_evolve=weight_evolve,
-                                             epsilon=epsilon
-                                             )
+      with stage('mutation'):
+         mutated_W[i], mutated_act[i] = mutation(genome_W, 
+                                                genome_act,
+                                                activation_mutate_prob=activation_mutate_prob,
+                                                activation_add_prob=activation_mutate_add_prob,
+                                                activation_delete_prob=activation_mutate_delete_prob, 
+                                                activation_change_prob=activation_mutate_change_prob, 
+                                                weight_mutate_prob=weight_mutate_prob, 
+                                                weight_mutate_threshold=weight_mutate_threshold,
+                                                genome_fitness=normalized_fitness[fitness_index],
+                                                activation_mutate_threshold=activation_mutate_threshold,
+                                                weight_evolve=weight_evolve,
+                                                epsilon=epsilon,
+                                                rng=genome_rng
+                                                )
 
       if bar_status: progress.update(1)
 
    child_W[0] = best_weight
    child_act[0] = best_activations
 
-   weights = np.vstack((child_W, mutated_W))
+   if weight_evolve is False and out is not None: out[...] = weights
+
+   weights = new_weights
    activation_potentiations = child_act + mutated_act
 
    ### INFO PRINTING CONSOLE
@@ -395,19 +564,273 @@ def evolver(weights,
 
 
       print("*** Performance ***")
-      print("  MAX FITNESS: ", str(round(max(fitness), 2)))
-      print("  MEAN FITNESS: ", str(round(np.mean(fitness), 2)))
-      print("  MIN FITNESS: ", str(round(min(fitness), 2)) + '\n')
+      print("  MAX FITNESS: ", str(round(float(xp.max(fitness)), 2)))
+      print("  MEAN FITNESS: ", str(round(float(xp.mean(fitness)), 2)))
+      print("  MIN FITNESS: ", str(round(float(xp.min(fitness)), 2)) + '\n')
 
       print("  BEST GENOME ACTIVATION LENGTH: ", str(len(best_activations)))
       print("  BEST GENOME INDEX: ", str(0))
       print("  NOTE: The returned genome at the first index is the best of the previous generation." + '\n')
       
-   if weight_evolve is False: weights = origin_weights
+   if weight_evolve is False and out is None: weights = origin_weights
 
    return weights, activation_potentiations
 
 
+def steady_state_evolver(weights,
+                         activation_potentiations,
+                         fitness_function,
+                         evaluations,
+                         workers=None,
+                         executor=None,
+                         weight_evolve=True,
+                         show_info=False,
+                         policy='aggressive',
+                         bad_genomes_selection_prob=None,
+                         bar_status=True,
+                         strategy='normal_selective',
+                         bad_genomes_mutation_prob=None,
+                         fitness_bias=1,
+                         cross_over_mode='tpm',
+                         activation_mutate_add_prob=0.5,
+                         activation_mutate_delete_prob=0.5,
+                         activation_mutate_change_prob=0.5,
+                         activation_selection_add_prob=0.5,
+                         activation_selection_change_prob=0.5,
+                         activation_selection_threshold=20,
+                         activation_mutate_prob=1,
+                         activation_mutate_threshold=20,
+                         weight_mutate_threshold=16,
+                         weight_mutate_prob=1,
+                         rng=None,
+                         dtype=np.float32):
+   """
+   Asynchronous steady-state form of evolver. Workers take genomes from a queue and return their fitness; as soon as a
+   result arrives, the worst genome of the population is replaced (if the new one is not worse) and a new offspring is
+   queued. No genome waits for the slowest evaluation of a generation, which keeps every worker busy when evaluation
+   times vary (e.g. RL episodes of different lengths).
+
+   Offspring are made with the same operators as evolver: parents are chosen from the good (upper) and bad (lower)
+   halves of the current population by policy and second_parent_selection, and offspring alternate between cross_over
+   children and mutation of a selected genome, like the two halves of an evolver generation.
+
+   Args:
+      weights (numpy.ndarray): Initial population weights. (numpy or cupy, evolving runs on the backend of weights)
+
+      activation_potentiations (list): Activations of each genome.
+
+      fitness_function (callable): fitness_function(weight, activations) -> float. Runs in the workers.
+
+      evaluations (int): Total number of fitness evaluations, initial population included.
+
+      workers (int, optional): Number of parallel evaluations. Default: None (os.cpu_count())
+
+      executor (concurrent.futures.Executor, optional): Executor running fitness_function. Use a ProcessPoolExecutor for
+         CPU bound pure Python fitness functions (fitness_function must be picklable then). Default: None (ThreadPoolExecutor with `workers` threads)
+
+      rng (numpy.random.Generator, optional): Random stream of the run. Every offspring draws from its own child stream (spawn_rngs).
+         Offspring depend on which results have arrived, so a seeded run is bit-reproducible with workers=1 or when evaluations finish in a fixed order.
+         Default: None (python random and the global numpy/cupy random state)
+
+      Other args: Same as evolver.
+
+   Returns:
+      tuple: A tuple containing:
+         - weights (numpy.ndarray): Final population, sorted by fitness in descending order (best genome first).
+         - activation_potentiations (list): Activations of the final population, same order.
+         - fitness (numpy.ndarray): Fitness of the final population, same order.
+
+   Example:
+      ```python
+      def fitness_function(weight, activations):
+         return episode_reward(weight, activations) # e.g. one gym episode
+
+      weights, activations = planeat.define_genomes(8, 4, 100)
+      weights, activations, fitness = planeat.steady_state_evolver(weights, activations, fitness_function, evaluations=5000, workers=8)
+      ```
+   """
+   import os
+   from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+   if strategy == 'normal_selective':
+      if bad_genomes_mutation_prob is None: bad_genomes_mutation_prob = 0.7
+      if bad_genomes_selection_prob is None: bad_genomes_selection_prob = 0.25
+
+   elif strategy == 'more_selective':
+      if bad_genomes_mutation_prob is None: bad_genomes_mutation_prob = 0.85
+      if bad_genomes_selection_prob is None: bad_genomes_selection_prob = 0.1
+
+   elif strategy == 'less_selective':
+      if bad_genomes_mutation_prob is None: bad_genomes_mutation_prob = 0.6
+      if bad_genomes_selection_prob is None: bad_genomes_selection_prob = 0.5
+
+   else:
+      raise ValueError("strategy parameter must be: 'normal_selective' or 'more_selective' or 'less_selective'")
+
+   if policy not in ('aggressive', 'explorer'): raise ValueError("policy parameter must be: 'aggressive' or 'explorer'")
+
+   if len(weights) < 2: raise ValueError("population must have at least 2 genomes.")
+
+   if evaluations < len(weights): raise ValueError("evaluations must be at least the population size.")
+
+   xp = get_array_module(weights)
+   epsilon = np.finfo(float).eps
+
+   population_W = xp.copy(weights)
+   population_act = [act.copy() if isinstance(act, list) else act for act in activation_potentiations]
+   population_fitness = np.zeros(len(weights))
+   evaluated = np.zeros(len(weights), dtype=bool) # initial genomes finish in any order
+
+   def make_offspring(k):
+
+      genome_rng = spawn_rngs(rng, 1)[0]
+
+      indices = np.flatnonzero(evaluated)
+      order = indices[np.argsort(population_fitness[indices])]
+      slice_center = len(order) // 2
+
+      good_weights = population_W[order[slice_center:]]
+      bad_weights = population_W[order[:slice_center]]
+      good_activations = [population_act[i] for i in order[slice_center:]]
+      bad_activations = [population_act[i] for i in order[:slice_center]]
+
+      normalized_fitness = non_neg_normalization(population_fitness[order].astype(dtype), dtype=dtype)
+
+      if k % 2 == 0: # cross over child
+
+         if policy == 'aggressive': parent_index = -1
+         else: parent_index = int(_uniform(genome_rng, 0, len(good_weights) - 1))
+
+         second_parent_W, second_parent_act, s_i = second_parent_selection(good_weights, bad_weights, good_activations, bad_activations, bad_genomes_selection_prob, rng=genome_rng)
+
+         return cross_over(good_weights[parent_index],
+                           second_parent_W,
+                           good_activations[parent_index],
+                           second_parent_act,
+                           cross_over_mode=cross_over_mode,
+                           activation_selection_add_prob=activation_selection_add_prob,
+                           activation_selection_change_prob=activation_selection_change_prob,
+                           activation_selection_threshold=activation_selection_threshold,
+                           bad_genomes_selection_prob=bad_genomes_selection_prob,
+                           first_parent_fitness=normalized_fitness[parent_index],
+                           fitness_bias=fitness_bias,
+                           second_parent_fitness=normalized_fitness[s_i],
+                           weight_evolve=weight_evolve,
+                           epsilon=epsilon,
+                           rng=genome_rng
+                           )
+
+      # mutated genome
+
+      if _uniform(genome_rng, 0, 1) > bad_genomes_mutation_prob or len(bad_weights) == 0:
+         i = int(_uniform(genome_rng, 0, len(good_weights) - 1))
+         genome_W, genome_act, fitness_index = good_weights[i], good_activations[i], slice_center + i
+      else:
+         i = int(_uniform(genome_rng, 0, len(bad_weights) - 1))
+         genome_W, genome_act, fitness_index = bad_weights[i], bad_activations[i], i
+
+      return mutation(xp.copy(genome_W),
+                      genome_act.copy() if isinstance(genome_act, list) else genome_act,
+                      activation_mutate_prob=activation_mutate_prob,
+                      activation_add_prob=activation_mutate_add_prob,
+                      activation_delete_prob=activation_mutate_delete_prob,
+                      activation_change_prob=activation_mutate_change_prob,
+                      weight_mutate_prob=weight_mutate_prob,
+                      weight_mutate_threshold=weight_mutate_threshold,
+                      genome_fitness=normalized_fitness[fitness_index],
+                      activation_mutate_threshold=activation_mutate_threshold,
+                      weight_evolve=weight_evolve,
+                      epsilon=epsilon,
+                      rng=genome_rng
+                      )
+
+   workers = workers or os.cpu_count() or 1
+   own_executor = executor is None
+   if own_executor: executor = ThreadPoolExecutor(max_workers=workers)
+
+   if bar_status: progress = initialize_loading_bar(evaluations, desc="STEADY STATE EVOLUTION", bar_format=loading_bars()[0], ncols=65)
+
+   pending = {}   # future -> (index in population or None for offspring, weight, activations)
+   submitted = 0
+   offspring_count = 0
+   replaced = 0
+
+   def submit():
+
+      nonlocal submitted, offspring_count
+
+      if submitted < len(weights):
+         genome = (submitted, population_W[submitted], population_act[submitted])
+      else:
+         child_W, child_act = make_offspring(offspring_count)
+         offspring_count += 1
+         genome = (None, child_W, child_act)
+
+      pending[executor.submit(fitness_function, genome[1], genome[2])] = genome
+      submitted += 1
+
+   try:
+
+      while submitted < min(workers, evaluations): submit()
+
+      while pending:
+
+         done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+         for future in done:
+
+            index, genome_W, genome_act = pending.pop(future)
+            genome_fitness = float(future.result())
+
+            if index is not None: # initial population
+               population_fitness[index] = genome_fitness
+               evaluated[index] = True
+
+            else:
+               indices = np.flatnonzero(evaluated)
+               worst = int(indices[np.argmin(population_fitness[indices])])
+
+               if genome_fitness >= population_fitness[worst]:
+                  population_W[worst] = genome_W
+                  population_act[worst] = genome_act
+                  population_fitness[worst] = genome_fitness
+                  replaced += 1
+
+            if bar_status: progress.update(1)
+
+            # offspring need an evaluated population, so the initial genomes are queued first
+            if submitted < evaluations and (submitted < len(weights) or np.count_nonzero(evaluated) >= 2): submit()
+
+         while not pending and submitted < evaluations: submit()
+
+   finally:
+      if own_executor: executor.shutdown(wait=True)
+
+   order = np.argsort(population_fitness)[::-1]
+
+   population_fitness = population_fitness.astype(dtype)[order]
+   population_W = population_W[order.copy()]
+   population_act = [population_act[i] for i in order]
+
+   if show_info == True:
+      print("\nSTEADY STATE EVOLUTION FINISHED \n")
+      print("*** Configuration Settings ***")
+      print("  POPULATION SIZE: ", str(len(population_W)))
+      print("  EVALUATIONS: ", str(evaluations))
+      print("  WORKERS: ", str(workers))
+      print("  STRATEGY: ", strategy)
+      print("  CROSS OVER MODE: ", cross_over_mode)
+      print("  POLICY: ", policy)
+      print("  REPLACEMENTS: ", str(replaced) + '\n')
+
+      print("*** Performance ***")
+      print("  MAX FITNESS: ", str(round(float(np.max(population_fitness)), 2)))
+      print("  MEAN FITNESS: ", str(round(float(np.mean(population_fitness)), 2)))
+      print("  MIN FITNESS: ", str(round(float(np.min(population_fitness)), 2)) + '\n')
+
+   return population_W, population_act, population_fitness
+
+
 def evaluate(Input, weights, activation_potentiations):
    """
     Evaluates the performance of a population of genomes, applying different activation functions 
@@ -437,8 +860,8 @@ def evaluate(Input, weights, activation_potentiations):
 
    if isinstance(activation_potentiations, str):
     activation_potentiations = [activation_potentiations]
-   else:
-    activation_potentiations = [item if isinstance(item, list) else [item] for item in activation_potentiations]
+   else: # one activation list of the genome, nested lists are flattened into it
+    activation_potentiations = [act for item in activation_potentiations for act in (item if isinstance(item, list) else [item])]
 
    Input = apply_activation(Input, activation_potentiations)
    result = Input @ weights.T
@@ -446,6 +869,53 @@ def evaluate(Input, weights, activation_potentiations):
    return result
 
 
+def evaluate_population(Input, weights, activation_potentiations):
+   """
+    Evaluates a whole population at once: genome i maps Input[i] with weights[i]. Genomes with the same activation
+    functions are grouped, so each group needs one activation call and one stacked-weight matmul (einsum).
+
+    Args:
+        Input (numpy.ndarray): 2D array of shape (population_size, input_shape). One input (e.g. environment state) per genome.
+
+        weights (numpy.ndarray): 3D array of shape (population_size, output_shape, input_shape). (numpy or cupy, computation runs on the backend of weights)
+
+        activation_potentiations (list): Activation function (str) or activation list of each genome.
+
+    Returns:
+        numpy.ndarray: 2D array of shape (population_size, output_shape). Row i is the output of genome i.
+
+    Example:
+        ```python
+        outputs = planeat.evaluate_population(states, genome_weights, genome_activations)
+        actions = np.argmax(outputs, axis=1)
+        ```
+   """
+   xp = get_array_module(weights)
+
+   Input = xp.asarray(Input)
+   Input = Input.reshape(len(Input), -1)
+
+   outputs = xp.empty((len(weights), weights.shape[1]), dtype=xp.result_type(Input, weights))
+
+   groups = {}
+   for i, activations in enumerate(activation_potentiations):
+      activations = [activations] if isinstance(activations, str) else list(activations)
+      groups.setdefault(tuple(activations), []).append(i)
+
+   for activations, indices in groups.items():
+
+      activations = list(activations)
+
+      if is_row_wise(activations):
+         group_input = apply_activation(Input[indices], activations)
+      else:
+         group_input = xp.stack([apply_activation(Input[i], activations) for i in indices])
+
+      outputs[indices] = xp.einsum('gij,gj->gi', weights[indices], group_input)
+
+   return outputs
+
+
 def cross_over(first_parent_W,
                second_parent_W,
                first_parent_act,
@@ -459,7 +929,8 @@ def cross_over(first_parent_W,
                second_parent_fitness,
                fitness_bias,
                weight_evolve,
-               epsilon):
+               epsilon,
+               rng=None):
    """
     Performs a crossover operation on two sets of weights and activation functions.
     This function combines two individuals (represented by their weights and activation functions) 
@@ -497,6 +968,8 @@ def cross_over(first_parent_W,
 
         epsilon (float): Small epsilon constant
 
+        rng (numpy.random.Generator, optional): Random stream. Default: None (python random)
+
     Returns:
         tuple: A tuple containing:
             - child_W (numpy.ndarray): The weight matrix of the new individual created by crossover.
@@ -538,21 +1011,23 @@ def cross_over(first_parent_W,
    total_gene = row_end * col_end
    half_of_gene = int(total_gene / 2)
 
-   decision = dominant_parent_selection(bad_genomes_selection_prob)
+   xp = get_array_module(first_parent_W)
+
+   decision = dominant_parent_selection(bad_genomes_selection_prob, rng=rng)
 
    if decision == 'first_parent':
-      dominant_parent_W = np.copy(first_parent_W)
+      dominant_parent_W = xp.copy(first_parent_W)
       dominant_parent_act = first_parent_act
 
-      undominant_parent_W = np.copy(second_parent_W)
+      undominant_parent_W = xp.copy(second_parent_W)
       undominant_parent_act = second_parent_act
       succes = second_parent_fitness + epsilon
 
    elif decision == 'second_parent':
-      dominant_parent_W = np.copy(second_parent_W)
+      dominant_parent_W = xp.copy(second_parent_W)
       dominant_parent_act = second_parent_act
 
-      undominant_parent_W = np.copy(first_parent_W)
+      undominant_parent_W = xp.copy(first_parent_W)
       undominant_parent_act = first_parent_act
       succes = first_parent_fitness + epsilon
 
@@ -560,18 +1035,18 @@ def cross_over(first_parent_W,
 
       while True:
 
-         row_cut_start = int(random.uniform(start, row_end))
-         col_cut_start = int(random.uniform(start, col_end))
+         row_cut_start = int(_uniform(rng, start, row_end))
+         col_cut_start = int(_uniform(rng, start, col_end))
 
-         row_cut_end = int(random.uniform(start, row_end))
-         col_cut_end = int(random.uniform(start, col_end))
+         row_cut_end = int(_uniform(rng, start, row_end))
+         col_cut_end = int(_uniform(rng, start, col_end))
 
          if ((row_cut_end > row_cut_start) and
             (col_cut_end > col_cut_start) and
             (((row_cut_end + 1) - (row_cut_start + 1) * 2) + ((col_cut_end + 1) - (col_cut_start + 1) * 2) <= half_of_gene)):
             break
          
-         selection_bias = random.uniform(0, 1)
+         selection_bias = _uniform(rng, 0, 1)
 
          if fitness_bias > selection_bias:
             row_cut_start = math.floor(row_cut_start * succes)
@@ -593,7 +1068,7 @@ def cross_over(first_parent_W,
    child_act = list(np.copy(dominant_parent_act))
 
    activation_selection_add_prob = 1 - activation_selection_add_prob # if prob 0.8 (%80) then 1 - 0.8. Because 0-1 random number probably greater than 0.2
-   potential_activation_selection_add = random.uniform(0, 1)
+   potential_activation_selection_add = _uniform(rng, 0, 1)
 
    if potential_activation_selection_add > activation_selection_add_prob:
       
@@ -602,7 +1077,7 @@ def cross_over(first_parent_W,
       
       while True:
          
-         random_index = int(random.uniform(0, len(undominant_parent_act)-1))
+         random_index = int(_uniform(rng, 0, len(undominant_parent_act)-1))
          random_undominant_activation = undominant_parent_act[random_index]
 
          child_act.append(random_undominant_activation)
@@ -615,7 +1090,7 @@ def cross_over(first_parent_W,
             break
 
    activation_selection_change_prob = 1 - activation_selection_change_prob
-   potential_activation_selection_change_prob = random.uniform(0, 1)
+   potential_activation_selection_change_prob = _uniform(rng, 0, 1)
 
    if potential_activation_selection_change_prob > activation_selection_change_prob:
       
@@ -624,8 +1099,8 @@ def cross_over(first_parent_W,
       
       while True:
          
-         random_index_undominant = int(random.uniform(0, len(undominant_parent_act)-1))
-         random_index_dominant = int(random.uniform(0, len(dominant_parent_act)-1))
+         random_index_undominant = int(_uniform(rng, 0, len(undominant_parent_act)-1))
+         random_index_dominant = int(_uniform(rng, 0, len(dominant_parent_act)-1))
          random_undominant_activation = undominant_parent_act[random_index_undominant]
 
          child_act[random_index_dominant] = random_undominant_activation
@@ -650,7 +1125,8 @@ def mutation(weight,
              genome_fitness,
              activation_mutate_threshold,
              weight_evolve,
-             epsilon):
+             epsilon,
+             rng=None):
    """
     Performs mutation on the given weight matrix and activation functions.
     - The weight matrix is mutated by randomly changing its values based on the mutation probability.
@@ -681,6 +1157,8 @@ def mutation(weight,
         
         epsilon (float): Small epsilon constant
 
+        rng (numpy.random.Generator, optional): Random stream. Default: None (python random and the global numpy/cupy random state)
+
     Returns:
         tuple: A tuple containing:
             - mutated_weight (numpy.ndarray): The weight matrix after mutation.
@@ -703,7 +1181,7 @@ def mutation(weight,
    if weight_evolve is True:
 
       weight_mutate_prob = 1 - weight_mutate_prob # if prob 0.8 (%80) then 1 - 0.8. Because 0-1 random number probably greater than 0.2
-      potential_weight_mutation = random.uniform(0, 1)
+      potential_weight_mutation = _uniform(rng, 0, 1)
 
       if potential_weight_mutation > weight_mutate_prob:
 
@@ -713,15 +1191,24 @@ def mutation(weight,
    
             n_mutations = min(int(threshold), max_threshold)
                      
-            row_indices = np.random.randint(0, row_end, size=n_mutations)
-            col_indices = np.random.randint(0, col_end, size=n_mutations)
-            
-            new_values = np.random.uniform(-1, 1, size=n_mutations)
+            xp = get_array_module(weight)
+
+            if rng is None:
+               row_indices = xp.random.randint(0, row_end, size=n_mutations)
+               col_indices = xp.random.randint(0, col_end, size=n_mutations)
+               
+               new_values = xp.random.uniform(-1, 1, size=n_mutations)
+
+            else:
+               row_indices = xp.asarray(rng.integers(0, row_end, size=n_mutations))
+               col_indices = xp.asarray(rng.integers(0, col_end, size=n_mutations))
+
+               new_values = xp.asarray(rng.uniform(-1, 1, size=n_mutations))
             
             weight[row_indices, col_indices] = new_values
 
    activation_mutate_prob = 1 - activation_mutate_prob
-   potential_activation_mutation = random.uniform(0, 1)
+   potential_activation_mutation = _uniform(rng, 0, 1)
 
    if potential_activation_mutation > activation_mutate_prob:
          
@@ -740,14 +1227,14 @@ def mutation(weight,
 
       for _ in range(max_threshold):
 
-         potential_activation_add_prob = random.uniform(0, 1)
-         potential_activation_delete_prob = random.uniform(0, 1)
-         potential_activation_change_prob = random.uniform(0, 1)
+         potential_activation_add_prob = _uniform(rng, 0, 1)
+         potential_activation_delete_prob = _uniform(rng, 0, 1)
+         potential_activation_change_prob = _uniform(rng, 0, 1)
 
 
          if potential_activation_delete_prob > activation_delete_prob and len(activations) > 1:
             
-            random_index = random.randint(0, len(activations) - 1)
+            random_index = random.randint(0, len(activations) - 1) if rng is None else int(rng.integers(0, len(activations)))
             activations.pop(random_index)
 
 
@@ -755,7 +1242,7 @@ def mutation(weight,
 
             try:
                
-               random_index_all_act = int(random.uniform(0, len(all_acts)-1))
+               random_index_all_act = int(_uniform(rng, 0, len(all_acts)-1))
                activations.append(all_acts[random_index_all_act])
 
             except:
@@ -764,13 +1251,13 @@ def mutation(weight,
                activations = []
 
                activations.append(activation)
-               activations.append(all_acts[int(random.uniform(0, len(all_acts)-1))])
+               activations.append(all_acts[int(_uniform(rng, 0, len(all_acts)-1))])
             
             
          if potential_activation_change_prob > activation_change_prob:
             
-            random_index_all_act = int(random.uniform(0, len(all_acts)-1))
-            random_index_genom_act = int(random.uniform(0, len(activations)-1))
+            random_index_all_act = int(_uniform(rng, 0, len(all_acts)-1))
+            random_index_genom_act = int(_uniform(rng, 0, len(activations)-1))
 
             activations[random_index_genom_act] = all_acts[random_index_all_act]
 
@@ -781,10 +1268,10 @@ def mutation(weight,
 
    return weight, activations
 
-def second_parent_selection(good_weights, bad_weights, good_activations, bad_activations, bad_genomes_selection_prob):
+def second_parent_selection(good_weights, bad_weights, good_activations, bad_activations, bad_genomes_selection_prob, rng=None):
    
-   selection_prob = random.uniform(0, 1)
-   random_index = int(random.uniform(0, len(good_weights) - 1))
+   selection_prob = _uniform(rng, 0, 1)
+   random_index = int(_uniform(rng, 0, len(good_weights) - 1))
 
    if selection_prob > bad_genomes_selection_prob:
       second_selected_W = good_weights[random_index]
@@ -796,11 +1283,470 @@ def second_parent_selection(good_weights, bad_weights, good_activations, bad_act
 
    return second_selected_W, second_selected_act, random_index
       
-def dominant_parent_selection(bad_genomes_selection_prob):
+def dominant_parent_selection(bad_genomes_selection_prob, rng=None):
 
-   selection_prob = random.uniform(0, 1)
+   selection_prob = _uniform(rng, 0, 1)
 
    if selection_prob > bad_genomes_selection_prob: decision = 'first_parent'
    else: decision = 'second_parent'
 
-   return decision
\ No newline at end of file
+   return decision
+
+# RL ROLLOUT -----
+
+def rollout(env, weights, activation_potentiations, max_steps=1000, action_fn=None, seed=None):
+   """
+   Runs one episode for every genome at once on a vectorized environment. env holds one sub-environment per genome;
+   at every step all genomes' actions come from a single evaluate_population call.
+
+   Args:
+      env: Vectorized environment with one sub-environment per genome:
+         - reset(seed=None) -> observations (population_size, input_shape), or (observations, info)
+         - step(actions) -> observations, rewards, terminated, truncated, info (rewards, terminated, truncated: shape (population_size,))
+         gymnasium.vector environments and ToyVectorEnv follow this interface.
+
+      weights (numpy.ndarray): Population weights. Shape: (population_size, output_shape, input_shape)
+
+      activation_potentiations (list): Activations of each genome.
+
+      max_steps (int, optional): Episode step limit. Default: 1000
+
+      action_fn (callable, optional): Maps outputs (population_size, output_shape) to the actions passed to env.step.
+         Default: None (argmax, discrete actions). Example for continuous actions: lambda outputs: outputs / np.max(np.abs(outputs), axis=1, keepdims=True)
+
+      seed (int, optional): Passed to env.reset. Default: None
+
+   Returns:
+      numpy.ndarray: Cumulative reward of each genome's first episode, shape (population_size,). Ready as evolver fitness.
+         Rewards after a sub-environment finishes (and auto resets) are not counted.
+
+   Example:
+      ```python
+      env = gymnasium.vector.SyncVectorEnv([lambda: gymnasium.make('LunarLander-v2') for _ in range(300)])
+      genome_weights, genome_activations = planeat.define_genomes(8, 4, 300)
+
+      for generation in range(1, 21):
+         rewards = planeat.rollout(env, genome_weights, genome_activations, seed=75)
+         genome_weights, genome_activations = planeat.evolver(genome_weights, genome_activations, generation, rewards)
+      ```
+   """
+   xp = get_array_module(weights)
+
+   if len(activation_potentiations) != len(weights): raise ValueError("weights and activation_potentiations must have the same length.")
+
+   observations = env.reset(seed=seed)
+   if isinstance(observations, tuple): observations = observations[0]
+
+   rewards = np.zeros(len(weights), dtype=np.float32)
+   done = np.zeros(len(weights), dtype=bool)
+
+   for _ in range(max_steps):
+
+      outputs = evaluate_population(observations, weights, activation_potentiations)
+      if xp is not np: outputs = outputs.get()
+
+      actions = np.argmax(outputs, axis=1) if action_fn is None else action_fn(outputs)
+
+      observations, step_rewards, terminated, truncated, _ = env.step(actions)
+
+      rewards += np.where(done, 0, np.asarray(step_rewards, dtype=np.float32))
+      done |= np.asarray(terminated, dtype=bool) | np.asarray(truncated, dtype=bool)
+
+      if done.all(): break
+
+   return rewards
+
+
+class ToyVectorEnv:
+   """
+   Small pure-NumPy vectorized environment for trying and testing rollout without gym.
+   Every step each sub-environment shows a random state; the reward is 1 when the action equals the index of the
+   largest of the first n_actions state values, else 0. Episodes end after a random length in [min_steps, max_steps],
+   so sub-environments finish at different steps, and finished ones reset automatically (like gymnasium vector envs).
+
+   Args:
+      num_envs (int): Number of sub-environments (population size).
+
+      observation_size (int, optional): State size. Default: 8
+
+      n_actions (int, optional): Number of discrete actions. Must not be larger than observation_size. Default: 4
+
+      min_steps (int, optional): Shortest episode. Default: 20
+
+      max_steps (int, optional): Longest episode. Default: 50
+
+   Example:
+      ```python
+      env = planeat.ToyVectorEnv(num_envs=100)
+      rewards = planeat.rollout(env, genome_weights, genome_activations, seed=0)
+      ```
+   """
+
+   def __init__(self, num_envs, observation_size=8, n_actions=4, min_steps=20, max_steps=50):
+
+      if n_actions > observation_size: raise ValueError("n_actions must not be larger than observation_size.")
+
+      self.num_envs = num_envs
+      self.observation_size = observation_size
+      self.n_actions = n_actions
+      self.min_steps = min_steps
+      self.max_steps = max_steps
+      self.rng = np.random.default_rng()
+
+   def reset(self, seed=None):
+
+      if seed is not None: self.rng = np.random.default_rng(seed)
+
+      self.steps = np.zeros(self.num_envs, dtype=np.int64)
+      self.lengths = self.rng.integers(self.min_steps, self.max_steps + 1, self.num_envs)
+      self.states = self.rng.uniform(-1, 1, (self.num_envs, self.observation_size)).astype(np.float32)
+
+      return self.states.copy(), {}
+
+   def step(self, actions):
+
+      actions = np.asarray(actions)
+
+      rewards = (actions == np.argmax(self.states[:, :self.n_actions], axis=1)).astype(np.float32)
+
+      self.steps += 1
+      terminated = self.steps >= self.lengths
+      truncated = np.zeros(self.num_envs, dtype=bool)
+
+      self.states = self.rng.uniform(-1, 1, (self.num_envs, self.observation_size)).astype(np.float32)
+
+      if terminated.any(): # auto reset
+         self.steps[terminated] = 0
+         self.lengths[terminated] = self.rng.integers(self.min_steps, self.max_steps + 1, int(terminated.sum()))
+
+      return self.states.copy(), rewards, terminated, truncated, {}
+
+
+# ISLAND MODEL -----
+
+def island_neighbours(island_id, n_islands, topology='ring'):
+   """
+   Islands that island_id sends its migrants to.
+
+   Args:
+      island_id (int): Index of the island.
+
+      n_islands (int): Count of islands.
+
+      topology (str or dict): 'ring' (next island), 'bidirectional_ring' (previous and next island), 'fully_connected' (all other islands),
+         'random' (one random other island per migration) or a dict {island_id: [neighbour ids]}. Default: 'ring'
+
+   Returns:
+      list: Neighbour island ids.
+   """
+
+   others = [i for i in range(n_islands) if i != island_id]
+
+   if isinstance(topology, dict): return list(topology.get(island_id, []))
+
+   if not others: return []
+
+   if topology == 'ring': return [(island_id + 1) % n_islands]
+
+   if topology == 'bidirectional_ring': return sorted({(island_id - 1) % n_islands, (island_id + 1) % n_islands})
+
+   if topology == 'fully_connected': return others
+
+   if topology == 'random': return [random.choice(others)]
+
+   raise ValueError("topology parameter must be: 'ring', 'bidirectional_ring', 'fully_connected', 'random' or a dict")
+
+
+def run_island(island_id,
+               addresses,
+               fitness_function,
+               input_shape,
+               output_shape,
+               population_size,
+               generations,
+               migration_interval=5,
+               migration_size=2,
+               topology='ring',
+               authkey=b'planeat',
+               seed=None,
+               dtype=np.float32,
+               **evolver_kwargs):
+   """
+   Runs one island of an island model PLANEAT search. The island evolves its own population with evolver and, every
+   migration_interval generations, sends copies of its best migration_size genomes to its neighbour islands and replaces
+   its worst genomes with the migrants it has received. Islands talk to each other directly over sockets
+   (multiprocessing.connection), there is no central server; islands can run in different processes or on different nodes.
+
+   Migration is asynchronous: an island never waits for the others. Migrants that arrive between migrations are kept
+   until the next one, migrants sent to an island that is not listening (not started yet or already finished) are dropped.
+   Connections that fail authentication and messages that can't be unpickled are logged and dropped.
+
+   Args:
+      island_id (int): Index of this island in addresses.
+
+      addresses (list): (host, port) of every island. Each island listens on its own address.
+
+      fitness_function (callable): fitness_function(weight, activations) -> float, higher is better.
+
+      input_shape (int): Input size of genomes.
+
+      output_shape (int): Output size of genomes.
+
+      population_size (int): Population size of this island.
+
+      generations (int): Generation count.
+
+      migration_interval (int, optional): Generations between migrations. Default: 5
+
+      migration_size (int, optional): Count of genomes sent to each neighbour per migration. Default: 2
+
+      topology (str or dict, optional): Migration topology. See island_neighbours. Default: 'ring'
+
+      authkey (bytes, optional): Shared authentication key of the islands. Default: b'planeat'
+
+      seed (int, optional): Seed of python random and numpy.random in this island. Default: None (fresh entropy)
+
+      dtype (numpy.dtype): Data type for the weight matrices. np.float32 by default.
+
+      **evolver_kwargs: Hyperparameters for evolver. (policy, strategy, cross_over_mode ...)
+
+   Returns:
+      tuple: A tuple containing:
+         - weights (numpy.ndarray): Final population, sorted by fitness in descending order.
+         - activation_potentiations (list): Activations of the final population, same order.
+         - fitness (numpy.ndarray): Fitness of the final population, same order.
+   """
+
+   import queue
+   import logging
+   import threading
+   from multiprocessing import AuthenticationError
+   from multiprocessing.connection import Listener, Client
+
+   if migration_size >= population_size: raise ValueError("migration_size must be smaller than population_size.")
+
+   # Forked islands inherit the RNG states of their parent, so every island reseeds
+   random.seed(seed)
+   np.random.seed(seed)
+
+   inbox = queue.Queue()
+   listener = Listener(tuple(addresses[island_id]), authkey=authkey)
+
+   def receive():
+      while True:
+         try:
+            conn = listener.accept()
+         except (OSError, EOFError, AuthenticationError) as e:
+            if listener_closed.is_set(): return
+            logging.warning(f"island {island_id}: rejected a connection: {e!r}")
+            continue
+
+         with conn:
+            try:
+               inbox.put(conn.recv())
+            except Exception as e: # a peer that disconnects early or sends something that isn't a migrant tuple
+               logging.warning(f"island {island_id}: dropped a message: {e!r}")
+
+   def start_receiver():
+      receiver = threading.Thread(target=receive, daemon=True)
+      receiver.start()
+      return receiver
+
+   listener_closed = threading.Event()
+   receiver = start_receiver()
+
+   evolver_kwargs.setdefault('bar_status', False)
+
+   weights, activation_potentiations = define_genomes(input_shape, output_shape, population_size, dtype=dtype)
+
+   try:
+
+      for generation in range(generations):
+
+         fitness = np.array([fitness_function(weights[j], activation_potentiations[j]) for j in range(population_size)], dtype=dtype)
+
+         if (generation + 1) % migration_interval == 0:
+
+            if not receiver.is_alive():
+               logging.warning(f"island {island_id}: listener thread stopped, restarting it")
+               receiver = start_receiver()
+
+            order = np.argsort(fitness)[::-1]
+            best = order[:migration_size]
+
+            migrants = (np.array(weights[best]), [activation_potentiations[j] for j in best], fitness[best])
+
+            for neighbour in island_neighbours(island_id, len(addresses), topology):
+               try:
+                  with Client(tuple(addresses[neighbour]), authkey=authkey) as conn:
+                     conn.send(migrants)
+               except OSError:
+                  pass # neighbour is not listening
+
+            worst = list(order[::-1])
+
+            while worst and not inbox.empty():
+               migrant_W, migrant_act, migrant_fitness = inbox.get()
+
+               for k in range(len(migrant_W)):
+                  if not worst: break
+
+                  j = worst.pop(0)
+                  weights[j], activation_potentiations[j], fitness[j] = migrant_W[k], migrant_act[k], migrant_fitness[k]
+
+         weights, activation_potentiations = evolver(weights, activation_potentiations, generation, fitness, dtype=dtype, **evolver_kwargs)
+
+      fitness = np.array([fitness_function(weights[j], activation_potentiations[j]) for j in range(population_size)], dtype=dtype)
+
+   finally:
+      listener_closed.set()
+      listener.close()
+
+   order = np.argsort(fitness)[::-1]
+
+   return weights[order.copy()], [activation_potentiations[j] for j in order], fitness[order]
+
+
+def _island_process(result_queue, island_id, *args, **kwargs):
+
+   try:
+      result_queue.put((island_id, run_island(island_id, *args, **kwargs), None))
+   except Exception as e:
+      result_queue.put((island_id, None, repr(e)))
+
+
+def island_evolver(fitness_function,
+                   input_shape,
+                   output_shape,
+                   population_size,
+                   generations,
+                   islands=4,
+                   migration_interval=5,
+                   migration_size=2,
+                   topology='ring',
+                   host='localhost',
+                   ports=None,
+                   seed=None,
+                   dtype=np.float32,
+                   **evolver_kwargs):
+   """
+   Island model PLANEAT on one machine: runs `islands` independent populations in separate processes with run_island,
+   migrating the best genomes between them over localhost sockets. To spread islands over several nodes, call
+   run_island on every node with the same addresses list instead.
+
+   Args:
+      fitness_function (callable): fitness_function(weight, activations) -> float, higher is better. Must be picklable when processes are spawned (not forked).
+
+      input_shape (int): Input size of genomes.
+
+      output_shape (int): Output size of genomes.
+
+      population_size (int): Population size of each island.
+
+      generations (int): Generation count.
+
+      islands (int, optional): Count of islands (processes). Default: 4
+
+      migration_interval (int, optional): Generations between migrations. Default: 5
+
+      migration_size (int, optional): Count of genomes sent to each neighbour per migration. Default: 2
+
+      topology (str or dict, optional): Migration topology. See island_neighbours. Default: 'ring'
+
+      host (str, optional): Host the islands listen on. Default: 'localhost'
+
+      ports (list, optional): Port of each island. Default: None (free ports are picked)
+
+      seed (int, optional): Island i is seeded with seed + i. Default: None
+
+      dtype (numpy.dtype): Data type for the weight matrices. np.float32 by default.
+
+      **evolver_kwargs: Hyperparameters for evolver. (policy, strategy, cross_over_mode ...)
+
+   Returns:
+      tuple: A tuple containing:
+         - weights (numpy.ndarray): Final populations of all islands, sorted by fitness in descending order.
+         - activation_potentiations (list): Activations, same order.
+         - fitness (numpy.ndarray): Fitness, same order.
+
+   Example:
+      ```python
+      def fitness_function(weight, activations):
+         preds = planeat.evaluate(x_train, weight, activations)
+         return np.mean(np.argmax(preds, axis=1) == np.argmax(y_train, axis=1))
+
+      if __name__ == '__main__':
+         weights, activations, fitness = planeat.island_evolver(fitness_function, x_train.shape[1], y_train.shape[1],
+                                                                population_size=50, generations=100, islands=4)
+
+      # On a cluster, every node runs its own islands with the same address list:
+      addresses = [('10.0.0.1', 6000), ('10.0.0.1', 6001), ('10.0.0.2', 6000), ('10.0.0.2', 6001)]
+      planeat.run_island(2, addresses, fitness_function, 784, 10, population_size=50, generations=100, authkey=b'secret')
+      ```
+   """
+
+   import os
+   import queue
+   import socket
+   import multiprocessing
+
+   if ports is None:
+      ports = []
+      for _ in range(islands):
+         with socket.socket() as s:
+            s.bind((host, 0))
+            ports.append(s.getsockname()[1])
+
+   if len(ports) != islands: raise ValueError("ports must have one port per island.")
+
+   addresses = [(host, port) for port in ports]
+   authkey = os.urandom(16)
+
+   result_queue = multiprocessing.Queue()
+
+   processes = [multiprocessing.Process(target=_island_process,
+                                        args=(result_queue, i, addresses, fitness_function, input_shape, output_shape, population_size, generations),
+                                        kwargs=dict(migration_interval=migration_interval, migration_size=migration_size, topology=topology,
+                                                    authkey=authkey, seed=None if seed is None else seed + i, dtype=dtype, **evolver_kwargs))
+                for i in range(islands)]
+
+   for process in processes: process.start()
+
+   results = {}
+   errors = []
+   pending = set(range(islands))
+
+   try:
+      while pending:
+         try:
+            island_id, result, error = result_queue.get(timeout=1.0)
+         except queue.Empty:
+            # An island killed before it could report (segfault, os._exit, OOM killer) never puts its result
+            dead = [i for i in pending if not processes[i].is_alive()]
+
+            if dead:
+               try:
+                  island_id, result, error = result_queue.get(timeout=1.0) # reported just before exiting
+               except queue.Empty:
+                  for i in dead: errors.append(f"island {i}: process exited with code {processes[i].exitcode} without a result")
+                  pending.difference_update(dead)
+                  continue
+            else: continue
+
+         pending.discard(island_id)
+
+         if error is not None: errors.append(f"island {island_id}: {error}")
+         else: results[island_id] = result
+
+   finally:
+      for process in processes: process.join()
+
+   if errors: raise RuntimeError("Island failed: " + "; ".join(errors))
+
+   weights = np.concatenate([results[i][0] for i in range(islands)])
+   activation_potentiations = [act for i in range(islands) for act in results[i][1]]
+   fitness = np.concatenate([results[i][2] for i in range(islands)])
+
+   order = np.argsort(fitness)[::-1]
+
+   return weights[order.copy()], [activation_potentiations[j] for j in order], fitness[order]
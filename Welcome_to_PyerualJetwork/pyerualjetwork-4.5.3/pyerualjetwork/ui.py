@@ -1,5 +1,3 @@
-from tqdm import tqdm
-
 GREY = "\033[90m"
 GREEN = "\033[92m"
 RESET = "\033[0m"
@@ -12,7 +10,30 @@ def loading_bars():
 def get_loading_bar_style():
     return (f"{GREY}━{RESET}", f"{GREEN}━{RESET}")
 
-def initialize_loading_bar(total, desc, ncols, bar_format, loading_bar_style=get_loading_bar_style(), leave=True):
+class NullLoadingBar:
+    """
+    Stand-in for the tqdm bar of headless runs. Every method is a no-op and tqdm is never imported.
+    """
+
+    n = 0
+    last_print_n = 0
+
+    def update(self, n=1):
+        pass
+
+    def set_postfix(self, *args, **kwargs):
+        pass
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+def initialize_loading_bar(total, desc, ncols, bar_format, loading_bar_style=get_loading_bar_style(), leave=True, disable=False):
+    if disable: return NullLoadingBar()
+
+    from tqdm import tqdm
     return tqdm(
         total=total,
         leave=leave,
@@ -1,9 +1,4 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.spatial import ConvexHull
-import seaborn as sns
-from matplotlib.animation import ArtistAnimation
 
 def draw_neural_web(W, ax, G, return_objs=False):
     """
@@ -32,10 +27,11 @@ def draw_neural_web(W, ax, G, return_objs=False):
         plt.show()
     """
 
-    for i in range(W.shape[0]):
-        for j in range(W.shape[1]):
-            if W[i, j] != 0:
-                G.add_edge(f'Output{i}', f'Input{j}', ltpw=W[i, j])
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    rows, cols = np.nonzero(W)
+    G.add_edges_from((f'Output{i}', f'Input{j}', {'ltpw': W[i, j]}) for i, j in zip(rows, cols))
 
     edges = G.edges(data=True)
     weights = [edata['ltpw'] for _, _, edata in edges]
@@ -68,6 +64,111 @@ def draw_neural_web(W, ax, G, return_objs=False):
         return art1, art2, art3
 
 
+def init_neural_web(W, ax, G=None, max_edges=2000):
+    """
+    Builds the neural web of a weight matrix once, for repeated drawing with update_neural_web. Graph, layout, nodes and
+    labels are made here; later frames only recolor edges, so drawing does not grow with the history length.
+
+    Args:
+        W : numpy.ndarray or cupy.ndarray
+            Weight matrix. Only its shape is used.
+        ax : matplotlib.axes.Axes
+            The matplotlib axes where the graph will be drawn.
+        G : networkx.Graph, optional
+            Graph to build into. Default is None (a new graph).
+        max_edges : int, optional
+            Most edges drawn per frame. Wider webs (for example 784 inputs) draw their largest weights only. Default is 2000.
+
+    Returns:
+        dict: Neural web state for update_neural_web.
+    """
+
+    import networkx as nx
+
+    num_motor_neurons, num_sensory_neurons = W.shape
+
+    if G is None: G = nx.Graph()
+
+    rows, cols = np.divmod(np.arange(num_motor_neurons * num_sensory_neurons), num_sensory_neurons) # W.ravel() order
+    G.add_edges_from(zip([f'Output{i}' for i in rows], [f'Input{j}' for j in cols]))
+
+    pos = {}
+    input_y = np.arange(num_sensory_neurons, dtype=float)
+    output_y = (num_sensory_neurons - num_motor_neurons) / 2 + np.arange(num_motor_neurons)
+
+    for j in range(num_sensory_neurons):
+        pos[f'Input{j}'] = (0, input_y[j])
+
+    for i in range(num_motor_neurons):
+        pos[f'Output{i}'] = (1, output_y[i])
+
+    segments = np.empty((len(rows), 2, 2))
+    segments[:, 0, 0], segments[:, 0, 1] = 1, output_y[rows]
+    segments[:, 1, 0], segments[:, 1, 1] = 0, input_y[cols]
+
+    nodes = nx.draw_networkx_nodes(G, pos, ax=ax, node_size=1000, node_color='lightblue')
+    labels = nx.draw_networkx_labels(G, pos, ax=ax, font_size=10, font_weight='bold')
+
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_visible(False)
+    ax.spines['bottom'].set_visible(False)
+    ax.get_xaxis().set_visible(False)
+    ax.get_yaxis().set_visible(False)
+    ax.set_title('Neural Web')
+
+    return {'G': G, 'pos': pos, 'segments': segments, 'nodes': nodes, 'labels': labels, 'max_edges': max_edges}
+
+
+def update_neural_web(W, ax, web):
+    """
+    Draws one neural web frame for a new weight matrix on a web built by init_neural_web. Only an edge collection is made:
+    edge colors come from W in one vectorized step, nodes and labels are reused.
+
+    Args:
+        W : numpy.ndarray or cupy.ndarray
+            Weight matrix with the shape given to init_neural_web.
+        ax : matplotlib.axes.Axes
+            The matplotlib axes of the web.
+        web : dict
+            State returned by init_neural_web.
+
+    Returns:
+        art1, art2, art3: Node collection, edge collection and label dict, like draw_neural_web(return_objs=True).
+    """
+
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    if not isinstance(W, np.ndarray): W = W.get() # cupy to host
+
+    weights = W.ravel()
+    selected = np.flatnonzero(weights)
+
+    if len(selected) > web['max_edges']:
+        selected = selected[np.argpartition(np.abs(weights[selected]), -web['max_edges'])[-web['max_edges']:]]
+
+    edges = LineCollection(web['segments'][selected], cmap=plt.cm.Blues, linewidths=2, zorder=1)
+    edges.set_array(weights[selected])
+    ax.add_collection(edges)
+
+    return web['nodes'], edges, web['labels']
+
+
+def update_neural_web_for_learner(viz_objects, W):
+
+    if 'web' not in viz_objects:
+        return
+
+    web = viz_objects['web']
+
+    if 'state' not in web:
+        web['state'] = init_neural_web(W, web['ax'], G=web['G'])
+
+    art5_1, art5_2, art5_3 = update_neural_web(W, web['ax'], web['state'])
+    web['artists'].append([art5_1] + [art5_2] + list(art5_3.values()))
+
+
 def draw_model_architecture(model_name, model_path=''):
     """
     The `draw_model_architecture` function visualizes the architecture of a neural network model with
@@ -86,6 +187,7 @@ def draw_model_architecture(model_name, model_path=''):
     Visualizes the architecture of a neural network model with multiple inputs based on activation functions.
     """
     
+    import matplotlib.pyplot as plt
     from .model_operations import load_model, get_scaler, get_act_pot, get_weights
     
     model = load_model(model_name=model_name, model_path=model_path)
@@ -327,12 +429,10 @@ def draw_activations(x_train, activation):
 
 def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation):
     
+    import matplotlib.pyplot as plt
+    import seaborn as sns
     from .metrics import metrics, confusion_matrix, roc_curve
-    from .ui import loading_bars, initialize_loading_bar
     from .data_operations import decode_one_hot
-    from .model_operations import predict_model_ram
-    
-    bar_format_normal = loading_bars()[0]
     
     acc = acc_list[len(acc_list) - 1]
     y_true = decode_one_hot(y_test)
@@ -413,33 +513,9 @@ def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation)
     
     feature_indices=[0, 1]
 
-    h = .02
-    x_min, x_max = x_test[:, feature_indices[0]].min() - 1, x_test[:, feature_indices[0]].max() + 1
-    y_min, y_max = x_test[:, feature_indices[1]].min() - 1, x_test[:, feature_indices[1]].max() + 1
-    xx, yy = np.meshgrid(np.arange(x_min, x_max, h),
-                         np.arange(y_min, y_max, h))
-    
-    grid = np.c_[xx.ravel(), yy.ravel()]
-
     try:
 
-        grid_full = np.zeros((grid.shape[0], x_test.shape[1]))
-        grid_full[:, feature_indices] = grid
-        
-        Z = [None] * len(grid_full)
-
-        predict_progress = initialize_loading_bar(total=len(grid_full),leave=False,
-            bar_format=bar_format_normal ,desc="Predicts For Decision Boundary",ncols= 65)
-
-        for i in range(len(grid_full)):
-
-            Z[i] = np.argmax(predict_model_ram(grid_full[i], W=W, activation_potentiation=activation_potentiation))
-            predict_progress.update(1)
-
-        predict_progress.close()
-
-        Z = np.array(Z)
-        Z = Z.reshape(xx.shape)
+        xx, yy, Z = decision_surface(x_test, W, activation_potentiation, feature_indices=feature_indices)
 
         axs[1,1].contourf(xx, yy, Z, alpha=0.8)
         axs[1,1].scatter(x_test[:, feature_indices[0]], x_test[:, feature_indices[1]], c=decode_one_hot(y_test), edgecolors='k', marker='o', s=20, alpha=0.9)
@@ -453,30 +529,98 @@ def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation)
     plt.show()
 
 
-def plot_decision_boundary(x, y, activation_potentiation, W, artist=None, ax=None):
+_decision_grid_cache = {}
+_decision_point_cost = {}
+
+
+def decision_surface(x, W, activation_potentiation, h=.02, time_budget=None, feature_indices=[0, 1]):
+    """
+    Predicted class over a 2D grid of two features (the other features are 0), for decision boundary plots.
+    The whole grid is predicted in batched matrix products instead of one predict call per grid point. Grids are cached
+    between calls with the same bounds and resolution, so live training visualization only pays for the prediction.
+
+    Args:
+        x (array-like): Input data. Grid bounds are the feature ranges + 1 on each side. (numpy or cupy)
+
+        W (array-like): Weight matrix.
+
+        activation_potentiation (list): Activations of the model.
+
+        h (float, optional): Grid step. Default: 0.02
+
+        time_budget (float, optional): Seconds the prediction may take. The step is doubled until the estimated time
+            (from the measured cost per grid point of earlier calls) fits the budget, it is never finer than h. Default: None (always h)
+
+        feature_indices (list, optional): The two plotted features. Default: [0, 1]
+
+    Returns:
+        tuple: xx, yy (meshgrid) and Z (predicted class of each grid point, shape of xx).
+    """
+
+    import time
+    from .backend import get_array_module
+    from .activation_functions import apply_activation, is_row_wise
+    from .memory_operations import PIPELINE_CHUNK_BYTES
+    from .instrumentation import count
+
+    xp = get_array_module(x)
+
+    x_min, x_max = float(x[:, feature_indices[0]].min()) - 1, float(x[:, feature_indices[0]].max()) + 1
+    y_min, y_max = float(x[:, feature_indices[1]].min()) - 1, float(x[:, feature_indices[1]].max()) + 1
+
+    if not isinstance(activation_potentiation, list): activation_potentiation = [activation_potentiation]
+
+    cost_key = (x.shape[1], W.shape[0], tuple(activation_potentiation), xp.__name__)
+
+    if time_budget is not None and cost_key in _decision_point_cost:
+        max_points = max(time_budget / _decision_point_cost[cost_key], 1)
+        while ((x_max - x_min) / h) * ((y_max - y_min) / h) > max_points: h *= 2
+
+    grid_key = (x_min, x_max, y_min, y_max, h, tuple(feature_indices), xp.__name__)
+
+    count('cache_hits' if grid_key in _decision_grid_cache else 'cache_misses')
+
+    if grid_key not in _decision_grid_cache:
+        if len(_decision_grid_cache) >= 8: _decision_grid_cache.clear()
+
+        xx, yy = xp.meshgrid(xp.arange(x_min, x_max, h), xp.arange(y_min, y_max, h))
+        _decision_grid_cache[grid_key] = (xx, yy, xp.stack((xx.ravel(), yy.ravel()), axis=1).astype(np.float32))
+
+    xx, yy, grid = _decision_grid_cache[grid_key]
+
+    start = time.perf_counter()
+
+    Z = xp.empty(len(grid), dtype=np.int32)
+
+    if is_row_wise(activation_potentiation):
+        rows = max(PIPELINE_CHUNK_BYTES // (x.shape[1] * 4), 1)
+
+        for a in range(0, len(grid), rows):
+            grid_full = xp.zeros((min(rows, len(grid) - a), x.shape[1]), dtype=np.float32)
+            grid_full[:, feature_indices] = grid[a:a + rows]
+
+            Z[a:a + rows] = xp.argmax(apply_activation(grid_full, activation_potentiation) @ W.T, axis=1)
+
+    else: # activations over the whole input vector, every grid point is its own input
+        grid_full = xp.zeros(x.shape[1], dtype=np.float32)
+
+        for i in range(len(grid)):
+            grid_full[feature_indices] = grid[i]
+            Z[i] = xp.argmax(apply_activation(grid_full, activation_potentiation) @ W.T)
+
+    _decision_point_cost[cost_key] = (time.perf_counter() - start) / len(grid)
+
+    return xx, yy, Z.reshape(xx.shape)
+
+
+def plot_decision_boundary(x, y, activation_potentiation, W, artist=None, ax=None, h=.02, time_budget=None):
     
-    from .model_operations import predict_model_ram
+    import matplotlib.pyplot as plt
     from .data_operations import decode_one_hot
     
     feature_indices = [0, 1]
 
-    h = .02
-    x_min, x_max = x[:, feature_indices[0]].min() - 1, x[:, feature_indices[0]].max() + 1
-    y_min, y_max = x[:, feature_indices[1]].min() - 1, x[:, feature_indices[1]].max() + 1
-    xx, yy = np.meshgrid(np.arange(x_min, x_max, h),
-                         np.arange(y_min, y_max, h))
-    
-    grid = np.c_[xx.ravel(), yy.ravel()]
-    grid_full = np.zeros((grid.shape[0], x.shape[1]), dtype=np.float32)
-    grid_full[:, feature_indices] = grid
-    
-    Z = [None] * len(grid_full)
-
-    for i in range(len(grid_full)):
-        Z[i] = np.argmax(predict_model_ram(grid_full[i], W=W, activation_potentiation=activation_potentiation))
-
-    Z = np.array(Z, dtype=np.int32)
-    Z = Z.reshape(xx.shape)
+    xx, yy, Z = decision_surface(x, W, activation_potentiation, h=h, time_budget=time_budget, feature_indices=feature_indices)
 
     if ax is None:
 
@@ -513,6 +657,8 @@ def plot_decision_boundary(x, y, activation_potentiation, W, artist=None, ax=Non
         
 def plot_decision_space(x, y, y_preds=None, s=100, color='tab20'):
     
+    import matplotlib.pyplot as plt
+    from scipy.spatial import ConvexHull
     from .metrics import pca
     from .data_operations import decode_one_hot
     
@@ -702,6 +848,7 @@ def display_visualization_for_fit(fig, artist_list, interval):
 """
     
 def show():
+    import matplotlib.pyplot as plt
     plt.tight_layout()
     plt.show()
 
@@ -711,6 +858,7 @@ def initialize_visualization_for_learner(show_history, neurons_history, neural_w
     viz_objects = {}
     
     if show_history:
+        import matplotlib.pyplot as plt
         fig, ax = plt.subplots(3, 1, figsize=(6, 8))
         fig.suptitle('Learner History')
         viz_objects['history'] = {
@@ -722,6 +870,7 @@ def initialize_visualization_for_learner(show_history, neurons_history, neural_w
         }
     
     if neurons_history:
+        import matplotlib.pyplot as plt
         row, col = find_closest_factors(len(x_train[0]))
         if row != 0:
             fig1, ax1 = plt.subplots(1, len(y_train[0]), figsize=(18, 14))
@@ -736,6 +885,8 @@ def initialize_visualization_for_learner(show_history, neurons_history, neural_w
         }
     
     if neural_web_history:
+        import networkx as nx
+        import matplotlib.pyplot as plt
         G = nx.Graph()
         fig2, ax2 = plt.subplots(figsize=(18, 4))
         viz_objects['web'] = {
@@ -776,6 +927,12 @@ def update_history_plots_for_learner(viz_objects, depth_list, loss_list, best_ac
 
 def display_visualizations_for_learner(viz_objects, best_weights, data, best_acc, test_loss, y_train, interval):
 
+    if not viz_objects:
+        return
+
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import ArtistAnimation
+
     if 'history' in viz_objects:
         hist = viz_objects['history']
         for _ in range(30):
@@ -811,15 +968,9 @@ def display_visualizations_for_learner(viz_objects, best_weights, data, best_acc
     
     if 'web' in viz_objects:
         web = viz_objects['web']
-        for _ in range(30):
-            art5_1, art5_2, art5_3 = draw_neural_web(
-                W=best_weights,
-                ax=web['ax'],
-                G=web['G'],
-                return_objs=True
-            )
-            art5_list = [art5_1] + [art5_2] + list(art5_3.values())
-            web['artists'].append(art5_list)
+        update_neural_web_for_learner(viz_objects, best_weights)
+        for _ in range(29):
+            web['artists'].append(web['artists'][-1])
         
         ani5 = ArtistAnimation(web['fig'], web['artists'], interval=interval, blit=True)
         plt.tight_layout()
@@ -1,9 +1,11 @@
 import networkx as nx
 import matplotlib.pyplot as plt
 import cupy as cp
+import numpy as np
 from scipy.spatial import ConvexHull
 import seaborn as sns
 from matplotlib.animation import ArtistAnimation
+from .visualizations import init_neural_web, update_neural_web, update_neural_web_for_learner
 
 def draw_neural_web(W, ax, G, return_objs=False):
     """
@@ -32,10 +34,8 @@ def draw_neural_web(W, ax, G, return_objs=False):
         plt.show()
     """
     W = W.get()
-    for i in range(W.shape[0]):
-        for j in range(W.shape[1]):
-            if W[i, j] != 0:
-                G.add_edge(f'Output{i}', f'Input{j}', ltpw=W[i, j])
+    rows, cols = np.nonzero(W)
+    G.add_edges_from((f'Output{i}', f'Input{j}', {'ltpw': W[i, j]}) for i, j in zip(rows, cols))
 
     edges = G.edges(data=True)
     weights = [edata['ltpw'] for _, _, edata in edges]
@@ -329,11 +329,8 @@ def draw_activations(x_train, activation):
 def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation):
     
     from .metrics_cuda import metrics, confusion_matrix, roc_curve
-    from .ui import loading_bars, initialize_loading_bar
     from .data_operations_cuda import decode_one_hot
-    from .model_operations_cuda import predict_model_ram
-    
-    bar_format_normal = loading_bars()[0]
+    from .visualizations import decision_surface
     
     acc = acc_list[len(acc_list) - 1]
     y_true = decode_one_hot(y_test)
@@ -414,31 +411,7 @@ def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation)
     
     feature_indices=[0, 1]
 
-    h = .02
-    x_min, x_max = x_test[:, feature_indices[0]].min() - 1, x_test[:, feature_indices[0]].max() + 1
-    y_min, y_max = x_test[:, feature_indices[1]].min() - 1, x_test[:, feature_indices[1]].max() + 1
-    xx, yy = cp.meshgrid(cp.arange(x_min, x_max, h),
-                         cp.arange(y_min, y_max, h))
-    
-    grid = cp.c_[xx.ravel(), yy.ravel()]
-
-    grid_full = cp.zeros((grid.shape[0], x_test.shape[1]), dtype=cp.float32)
-    grid_full[:, feature_indices] = grid
-    
-    Z = [None] * len(grid_full)
-
-    predict_progress = initialize_loading_bar(total=len(grid_full),leave=False,
-        bar_format=bar_format_normal ,desc="Predicts For Decision Boundary",ncols= 65)
-
-    for i in range(len(grid_full)):
-
-        Z[i] = cp.argmax(predict_model_ram(grid_full[i], W=W, activation_potentiation=activation_potentiation))
-        predict_progress.update(1)
-
-    predict_progress.close()
-
-    Z = cp.array(Z)
-    Z = Z.reshape(xx.shape)
+    xx, yy, Z = decision_surface(x_test, W, activation_potentiation, feature_indices=feature_indices)
 
     axs[1,1].contourf(xx.get(), yy.get(), Z.get(), alpha=0.8)
     axs[1,1].scatter(x_test[:, feature_indices[0]].get(), x_test[:, feature_indices[1]].get(), c=decode_one_hot(y_test).get(), edgecolors='k', marker='o', s=20, alpha=0.9)
@@ -449,30 +422,14 @@ def plot_evaluate(x_test, y_test, y_preds, acc_list, W, activation_potentiation)
     plt.show()
 
     
-def plot_decision_boundary(x, y, activation_potentiation, W, artist=None, ax=None):
+def plot_decision_boundary(x, y, activation_potentiation, W, artist=None, ax=None, h=.02, time_budget=None):
     
-    from .model_operations_cuda import predict_model_ram
+    from .visualizations import decision_surface
     from .data_operations_cuda import decode_one_hot
     
     feature_indices = [0, 1]
 
-    h = .02
-    x_min, x_max = x[:, feature_indices[0]].min() - 1, x[:, feature_indices[0]].max() + 1
-    y_min, y_max = x[:, feature_indices[1]].min() - 1, x[:, feature_indices[1]].max() + 1
-    xx, yy = cp.meshgrid(cp.arange(x_min, x_max, h),
-                         cp.arange(y_min, y_max, h))
-    
-    grid = cp.c_[xx.ravel(), yy.ravel()]
-    grid_full = cp.zeros((grid.shape[0], x.shape[1]))
-    grid_full[:, feature_indices] = grid
-    
-    Z = [None] * len(grid_full)
-
-    for i in range(len(grid_full)):
-        Z[i] = cp.argmax(predict_model_ram(grid_full[i], W=W, activation_potentiation=activation_potentiation))
-
-    Z = cp.array(Z, dtype=cp.int32)
-    Z = Z.reshape(xx.shape)
+    xx, yy, Z = decision_surface(x, W, activation_potentiation, h=h, time_budget=time_budget, feature_indices=feature_indices)
 
     if ax is None:
 
@@ -809,15 +766,9 @@ def display_visualizations_for_learner(viz_objects, best_weights, data, best_acc
     
     if 'web' in viz_objects:
         web = viz_objects['web']
-        for _ in range(30):
-            art5_1, art5_2, art5_3 = draw_neural_web(
-                W=best_weights,
-                ax=web['ax'],
-                G=web['G'],
-                return_objs=True
-            )
-            art5_list = [art5_1] + [art5_2] + list(art5_3.values())
-            web['artists'].append(art5_list)
+        update_neural_web_for_learner(viz_objects, best_weights)
+        for _ in range(29):
+            web['artists'].append(web['artists'][-1])
         
         ani5 = ArtistAnimation(web['fig'], web['artists'], interval=interval, blit=True)
         plt.tight_layout()
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pyerualjetwork import backend
+from pyerualjetwork.activation_functions import ACTIVATION_FUNCTIONS, all_activations, apply_activation, approximation
+
+
+def test_every_searched_activation_is_registered():
+    assert set(all_activations()) <= set(ACTIVATION_FUNCTIONS)
+
+
+def test_unknown_activation_raises():
+    with pytest.raises(ValueError):
+        apply_activation(np.ones(4), ['linear', 'no_such_activation'])
+
+
+def test_single_name_is_one_activation():
+    x = np.linspace(-2, 2, 5)
+    assert np.array_equal(apply_activation(x, 'tanh'), apply_activation(x, ['tanh']))
+
+
+def test_exp_cubic_stays_finite():
+    x = np.array([-3.0, 0.0, 1.0, 10.0], dtype=np.float32)
+    y = apply_activation(x, ['exp_cubic'])
+    assert y.dtype == np.float32
+    assert np.all(np.isfinite(y))
+    assert np.isclose(y[2], 1.0 + np.e)
+
+
+@pytest.mark.parametrize('activation', ['spiral', 'circular'])
+def test_whole_input_activations_keep_the_backend(activation):
+    x = np.linspace(-1, 1, 6)
+    y = apply_activation(backend.emulated.asarray(x), [activation])
+    assert backend.get_array_module(y) is backend.emulated
+    assert np.allclose(np.asarray(y), apply_activation(x, [activation]))
+
+
+@pytest.mark.parametrize('activations', [['gelu'], ['cubic', 'tanh'], ['sigmoid', 'swish', 'elu', 'softsign']])
+def test_approximation_stays_within_max_error(activations):
+    x = np.linspace(-10, 10, 20001).astype(np.float32) # partly outside the table range
+    exact = apply_activation(x.astype(np.float64), activations)
+    exact_float32 = apply_activation(x, activations)
+
+    with approximation(max_error=1e-3) as mode:
+        assert mode.error(activations) <= 1e-3
+        approximate = apply_activation(x, activations)
+
+    assert approximate.dtype == np.float32
+    assert np.max(np.abs(approximate - exact) / np.maximum(1, np.abs(exact))) <= 1e-3 + 1e-6
+    assert not np.array_equal(approximate, exact_float32)
+    assert np.array_equal(apply_activation(x, activations), exact_float32) # exact again after the block
+
+
+def test_approximation_falls_back_to_exact():
+    x = np.linspace(-2, 2, 101).astype(np.float32)
+    lists = (['tanh'], ['sglu'], ['mod_circular', 'gelu'], ['exp_cubic', 'gelu'])
+    exact = [apply_activation(x, activations) for activations in lists]
+
+    with approximation() as mode:
+        for activations, expected in zip(lists, exact):
+            assert mode.table(activations) is None
+            assert np.array_equal(apply_activation(x, activations), expected)
+
+        y = apply_activation(backend.emulated.asarray(x), ['gelu'])
+        assert backend.get_array_module(y) is backend.emulated
+
+
+def test_nested_approximations_restore_the_outer_one():
+    x = np.linspace(-1, 1, 10001)
+    exact = apply_activation(x, ['gelu'])
+    outer, inner = approximation(max_error=1e-2), approximation(max_error=1e-6)
+
+    with outer:
+        with inner:
+            fine = apply_activation(x, ['gelu'])
+        coarse = apply_activation(x, ['gelu'])
+
+    assert inner.table(['gelu'], x.dtype)['size'] > outer.table(['gelu'], x.dtype)['size']
+    assert np.max(np.abs(fine - exact)) <= 1e-6
+    assert 1e-6 < np.max(np.abs(coarse - exact)) <= 1e-2
+    assert np.array_equal(apply_activation(x, ['gelu']), exact)
+
+    with pytest.raises(ValueError):
+        approximation(max_error=0)
@@ -0,0 +1,25 @@
+import pytest
+
+from pyerualjetwork import benchmark
+
+
+def test_invalid_pop_size_is_rejected_before_running():
+    with pytest.raises(SystemExit):
+        benchmark.main(['--only', 'learner_generation', '--pop-size', '10'])
+
+    with pytest.raises(ValueError, match='evolver'):
+        benchmark.run_benchmarks(['define_genomes', 'evolver'], {'pop_size': [7]}, repeat=1, memory=False)
+
+
+def test_valid_pop_size_runs():
+    results = benchmark.run_benchmarks(['define_genomes', 'evolver'], {'pop_size': [8], 'features': [4]}, repeat=1, memory=False)
+    assert [result['benchmark'] for result in results['results']] == ['define_genomes', 'evolver']
+
+
+def test_cpu_modules_import_without_heavy_dependencies():
+    results = benchmark.import_time(repeat=1)
+
+    assert set(results) == set(benchmark.IMPORT_TARGETS)
+    for result in results.values():
+        assert result['loaded'] == []
+        assert result['seconds'] > 0
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from pyerualjetwork.data_operations import auto_balancer, batcher, pca_reduction, random_projection, split
+
+
+@pytest.mark.parametrize('method', ['sparse', 'hashing'])
+def test_random_projection_reapplies_the_same_matrix(method):
+    rng = np.random.default_rng(0)
+    x_train = rng.normal(size=(50, 40)).astype(np.float32)
+    x_test = rng.normal(size=(10, 40)).astype(np.float32)
+
+    projection_params, train_projected, test_projected = random_projection(x_train, x_test, n_components=12, method=method)
+
+    assert train_projected.shape == (50, 12)
+    assert test_projected.shape == (10, 12)
+    assert np.allclose(random_projection(x_test=x_test, projection_params=projection_params), test_projected)
+
+
+def test_random_projection_of_sparse_input_matches_dense():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(30, 25)) * (rng.random((30, 25)) < 0.2)
+
+    projection_params, dense_projected = random_projection(x.astype(np.float32), n_components=6)
+    sparse_projected = random_projection(x_test=sp.csr_matrix(x), projection_params=projection_params)
+
+    assert np.allclose(np.asarray(sparse_projected.todense() if sp.issparse(sparse_projected) else sparse_projected), dense_projected, atol=1e-5)
+
+
+def test_hashing_keeps_every_feature_in_one_column():
+    x = np.eye(16, dtype=np.float32)
+    _, projected = random_projection(x, n_components=4, method='hashing')
+
+    assert np.array_equal(np.count_nonzero(projected, axis=1), np.ones(16))
+    assert np.array_equal(np.abs(projected).sum(axis=1), np.ones(16))
+
+
+def test_pca_reduction_reapplies_the_training_axes():
+    rng = np.random.default_rng(3)
+    x_train = rng.normal(size=(80, 20)) @ rng.normal(size=(20, 20))
+    x_test = rng.normal(size=(15, 20)) @ rng.normal(size=(20, 20))
+
+    pca_params, x_train_reduced, x_test_reduced = pca_reduction(x_train, x_test, n_components=5)
+
+    assert x_train_reduced.shape == (80, 5) and x_test_reduced.shape == (15, 5)
+    assert x_train_reduced.dtype == np.float32
+    assert np.allclose(pca_reduction(x_test=x_test, pca_params=pca_params), x_test_reduced)
+    assert np.allclose(x_train_reduced.mean(axis=0), 0, atol=1e-4)
+
+    variances = x_train_reduced.var(axis=0)
+    assert np.all(np.diff(variances) <= 1e-6)
+
+
+def test_pca_reduction_needs_n_components_to_fit():
+    with pytest.raises(ValueError, match='n_components'):
+        pca_reduction(np.ones((4, 3)))
+
+
+def test_seeded_rng_makes_data_operations_reproducible():
+    rng = np.random.default_rng(4)
+    x = rng.normal(size=(60, 3)).astype(np.float32)
+    y = np.eye(2)[(np.arange(60) % 5 == 0).astype(int)]
+
+    def run(global_seed):
+        np.random.seed(global_seed)
+        return (split(x, y, 0.25, rng=np.random.default_rng(1)),
+                batcher(x, y, batch_size=0.5, rng=np.random.default_rng(2)),
+                auto_balancer(x, y, rng=np.random.default_rng(3)))
+
+    for first, second in zip(run(0), run(1)):
+        for a, b in zip(first, second):
+            assert np.array_equal(a, b)
@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+
+from pyerualjetwork import instrumentation, plan, planeat
+
+
+def _traced_learner(tracer, gen=2, pop_size=42):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(60, 5)).astype(np.float32)
+    y = np.eye(3)[rng.integers(0, 3, 60)]
+
+    return plan.learner(x, y, planeat.evolver, gen=gen, pop_size=pop_size, headless=True, tracer=tracer,
+                        rng=np.random.default_rng(0))
+
+
+def test_learner_records_stages_generations_and_counters():
+    events = []
+    tracer = instrumentation.Tracer(callbacks=[events.append])
+
+    _traced_learner(tracer)
+    summary = tracer.summary()
+
+    assert {'batch', 'fit', 'evaluate', 'activation', 'matmul', 'loss', 'fitness', 'crossover', 'mutation'} <= set(summary['stages'])
+    assert summary['counters']['evaluations'] == 2 * 42
+    assert [event['generation'] for event in summary['generations']] == [0, 1]
+    assert all(event['counters']['evaluations'] == 42 for event in summary['generations'])
+
+    for name, stage in summary['stages'].items():
+        assert stage['count'] == sum(event['type'] == 'stage' and event['name'] == name for event in events)
+        assert 0 <= stage['max'] <= stage['total']
+
+    assert instrumentation.get_tracer() is None
+
+
+def test_tracer_exports(tmp_path):
+    tracer = instrumentation.Tracer()
+    _traced_learner(tracer, gen=1)
+
+    tracer.to_jsonl(tmp_path / 'run.jsonl')
+    lines = [json.loads(line) for line in (tmp_path / 'run.jsonl').read_text().splitlines()]
+    assert len(lines) == len(tracer.events) + len(tracer.generations)
+    assert [line['start'] for line in lines] == sorted(line['start'] for line in lines)
+
+    tracer.to_chrome_trace(tmp_path / 'run.trace.json')
+    trace = json.loads((tmp_path / 'run.trace.json').read_text())['traceEvents']
+    assert {event['ph'] for event in trace} == {'X', 'C'}
+
+
+def test_stages_are_free_without_an_active_tracer():
+    outer, inner = instrumentation.Tracer(), instrumentation.Tracer()
+
+    assert instrumentation.stage('matmul') is instrumentation.stage('softmax')
+
+    with instrumentation.tracing(outer):
+        with instrumentation.tracing(inner):
+            instrumentation.count('cache_hits')
+        instrumentation.count('cache_misses')
+
+    assert inner.counters == {'cache_hits': 1}
+    assert outer.counters == {'cache_misses': 1}
+    assert instrumentation.get_tracer() is None
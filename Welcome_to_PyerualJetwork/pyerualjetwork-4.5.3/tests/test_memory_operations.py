@@ -0,0 +1,37 @@
+import numpy as np
+
+from pyerualjetwork import backend, memory_operations
+
+
+def test_concurrent_transfers_keep_their_own_chunks():
+    a = np.arange(40, dtype=np.float32).reshape(20, 2)
+    b = -a
+
+    first = memory_operations.iter_to_host(backend.emulated.asarray(a), batch_size=3, xp=backend.emulated)
+    second = memory_operations.iter_to_host(backend.emulated.asarray(b), batch_size=3, xp=backend.emulated)
+
+    for (start, chunk_a), (_, chunk_b) in zip(first, second):
+        assert np.array_equal(chunk_a, a[start:start + 3])
+        assert np.array_equal(chunk_b, b[start:start + 3])
+
+
+def test_pinned_buffers_are_reused_after_a_transfer_closes():
+    memory_operations.release_pinned_buffers()
+    a = np.ones((20, 2), dtype=np.float32)
+
+    for _ in memory_operations.iter_to_device(a, batch_size=4, xp=backend.emulated): pass
+    held = len(memory_operations._pinned_buffers['emulated'])
+
+    chunks = memory_operations.iter_to_device(a, batch_size=4, xp=backend.emulated)
+    next(chunks)
+    assert len(memory_operations._pinned_buffers['emulated']) == 0
+
+    chunks.close()
+    assert len(memory_operations._pinned_buffers['emulated']) == held == 2
+
+
+def test_transfer_to_cpu_returns_numpy_input_without_cupy():
+    a = np.arange(6, dtype=np.float32)
+
+    assert memory_operations.transfer_to_cpu(a) is a
+    assert memory_operations.transfer_to_cpu(a, dtype=np.float64).dtype == np.float64
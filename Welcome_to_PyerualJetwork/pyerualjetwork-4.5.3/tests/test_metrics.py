@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from pyerualjetwork import metrics
+
+
+def _pairwise_auc(y_true, y_score):
+    # Probability that a positive scores above a negative, ties count half
+    pos, neg = y_score[y_true == 1], y_score[y_true != 1]
+    return np.mean((pos[:, None] > neg[None, :]) + 0.5 * (pos[:, None] == neg[None, :]))
+
+
+def test_roc_auc_matches_pairwise_comparison():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 200)
+    y_score = np.round(rng.random(200) + 0.3 * y_true, 1) # rounded so there are ties
+
+    fpr, tpr, thresholds = metrics.roc_curve(y_true, y_score)
+
+    assert fpr[0] == tpr[0] == 0 and fpr[-1] == tpr[-1] == 1
+    assert np.all(np.diff(fpr) >= 0) and np.all(np.diff(tpr) >= 0)
+    assert len(fpr) == len(np.unique(y_score)) + 1
+    assert np.isclose(metrics.roc_auc(y_true, y_score), _pairwise_auc(y_true, y_score))
+
+
+def test_max_thresholds_keeps_points_of_the_full_curve():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 1000)
+    y_score = rng.random(1000)
+
+    fpr, tpr, _ = metrics.roc_curve(y_true, y_score)
+    fpr_coarse, tpr_coarse, _ = metrics.roc_curve(y_true, y_score, max_thresholds=50)
+
+    assert len(fpr_coarse) <= 51
+    assert set(zip(fpr_coarse, tpr_coarse)) <= set(zip(fpr, tpr))
+
+
+def test_one_vs_rest_matches_binary_curves():
+    rng = np.random.default_rng(2)
+    labels = rng.integers(0, 3, 150)
+    y_true = np.eye(3)[labels]
+    y_score = rng.random((150, 3)) + 0.5 * y_true
+
+    curves = metrics.roc_curve_ovr(y_true, y_score)
+    aucs = metrics.roc_auc(labels, y_score, average=None)
+
+    for c in range(3):
+        for ovr, binary in zip(curves[c], metrics.roc_curve(y_true[:, c], y_score[:, c])):
+            assert np.allclose(ovr, binary)
+        assert np.isclose(aucs[c], _pairwise_auc(y_true[:, c], y_score[:, c]))
+
+    assert np.isclose(metrics.roc_auc(y_true, y_score), np.mean(aucs))
+    assert np.isclose(metrics.roc_auc(y_true, y_score, average='weighted'), np.average(aucs, weights=y_true.sum(axis=0)))
+
+
+def test_class_without_samples_is_skipped():
+    y_true = np.eye(3)[[0, 1, 0, 1, 0, 1]]
+    y_score = np.random.default_rng(3).random((6, 3))
+
+    assert metrics.roc_curve_ovr(y_true, y_score)[2] is None
+    assert np.isnan(metrics.roc_auc(y_true, y_score, average=None)[2])
+    assert np.isfinite(metrics.roc_auc(y_true, y_score))
+
+    with pytest.raises(ValueError, match='binary'):
+        metrics.roc_curve(np.zeros(6), y_score[:, 0])
+
+
+def _low_rank(rows=300, features=60, rank=4, seed=4):
+    rng = np.random.default_rng(seed)
+    scales = np.array([10.0, 6.0, 3.0, 1.5])[:rank]
+    return (rng.normal(size=(rows, rank)) * scales) @ np.linalg.qr(rng.normal(size=(features, rank)))[0].T + 5
+
+
+def test_randomized_pca_finds_the_full_pca_axes():
+    X = _low_rank()
+
+    mean_full, components_full = metrics.pca_fit(X, 4, method='full')
+    mean_randomized, components_randomized = metrics.pca_fit(X, 4, method='randomized', chunk_rows=32)
+
+    assert np.allclose(mean_full, mean_randomized)
+    assert np.allclose(np.abs(components_full.T @ components_randomized), np.eye(4), atol=1e-6)
+
+
+def test_pca_transform_in_chunks_matches_one_pass():
+    X = _low_rank()
+    pca_params = metrics.pca_fit(X, 3, method='full')
+
+    expected = (X - pca_params[0]) @ pca_params[1]
+
+    assert np.allclose(metrics.pca_transform(X, pca_params, chunk_rows=7), expected)
+    assert np.allclose(metrics.pca(X, 3, method='full', chunk_rows=7), expected)
+
+
+def test_sparse_pca_matches_dense():
+    X = _low_rank()
+    X[np.abs(X - 5) < 3] = 0
+
+    dense = metrics.pca(X, 3, method='randomized', chunk_rows=50)
+    sparse = metrics.pca(sp.csr_matrix(X), 3, method='auto', chunk_rows=50)
+
+    assert np.allclose(sparse, dense)
+
+
+def test_pca_rejects_unknown_method():
+    with pytest.raises(ValueError, match='method'):
+        metrics.pca_fit(_low_rank(), 2, method='incremental')
@@ -0,0 +1,61 @@
+import numpy as np
+
+from pyerualjetwork import model_operations
+from pyerualjetwork.activation_functions import apply_activation
+from pyerualjetwork.data_operations import random_projection
+
+
+def test_projection_is_saved_beside_the_model(tmp_path):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(20, 30)).astype(np.float32)
+    projection_params, x_projected = random_projection(x, n_components=8)
+    W = rng.normal(size=(3, 8)).astype(np.float32)
+
+    model_operations.save_model('projected', W, model_path=str(tmp_path) + '/', activation_potentiation=['tanh'],
+                                projection_params=projection_params, show_info=False)
+
+    model = model_operations.load_model('projected', str(tmp_path) + '/')
+    assert len(model) == 5
+    assert np.array_equal(model[model_operations.get_weights()], W)
+    assert model_operations.load_projection('projected', str(tmp_path) + '/') == projection_params
+
+    output = model_operations.predict_model_ssd(x[0], 'projected', str(tmp_path) + '/')
+    assert np.allclose(output, apply_activation(x_projected[0], ['tanh']) @ W.T, atol=1e-5)
+
+
+def test_model_without_projection(tmp_path):
+    W = np.ones((2, 4), dtype=np.float32)
+    model_operations.save_model('plain', W, model_path=str(tmp_path) + '/', show_info=False)
+
+    assert len(model_operations.load_model('plain', str(tmp_path) + '/')) == 5
+    assert model_operations.load_projection('plain', str(tmp_path) + '/') is None
+
+
+def test_int8_and_f16_weights_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    W = rng.uniform(-1, 1, size=(4, 16)).astype(np.float32)
+
+    for weights_format, atol in (('int8', 1 / 127), ('f16', 1e-3)):
+        model_operations.save_model(weights_format, W, model_path=str(tmp_path) + '/',
+                                    weights_format=weights_format, show_info=False)
+
+        W_loaded = model_operations.load_model(weights_format, str(tmp_path) + '/')[model_operations.get_weights()]
+        assert W_loaded.dtype == np.float32
+        assert np.allclose(W_loaded, W, atol=atol)
+
+
+def test_predict_model_quantized_matches_float_prediction():
+    rng = np.random.default_rng(2)
+    W = rng.uniform(-1, 1, size=(3, 32)).astype(np.float32)
+    x = rng.normal(size=(10, 32)).astype(np.float32)
+    W_q, W_scale = model_operations.quantize_weights(W)
+
+    expected = apply_activation(x, ['linear']) @ W.T
+
+    first = model_operations.predict_model_quantized(x, W_q, W_scale)
+    again = model_operations.predict_model_quantized(x, W_q, W_scale)
+    assert np.array_equal(first, again)
+    assert np.allclose(first, expected, atol=0.02 * np.abs(expected).max())
+
+    W_q2, W_scale2 = model_operations.quantize_weights(-W)
+    assert np.allclose(model_operations.predict_model_quantized(x, W_q2, W_scale2), -first, atol=1e-4)
@@ -0,0 +1,176 @@
+import random
+
+import numpy as np
+import pytest
+
+from pyerualjetwork import plan, planeat
+from pyerualjetwork.fitness_functions import wals
+from pyerualjetwork.loss_functions import categorical_crossentropy
+from pyerualjetwork.model_operations import get_acc, get_preds_softmax
+from pyerualjetwork.memory_operations import iter_chunks
+
+
+def _data(rows=60, features=5, classes=3, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(rows, features)).astype(np.float32)
+    y = np.eye(classes)[rng.integers(0, classes, rows)]
+    return x, y
+
+
+def test_fit_on_chunks_matches_one_array():
+    x, y = _data()
+    assert np.allclose(plan.fit(iter_chunks(x, y, batch_size=7)), plan.fit(x, y))
+
+
+def test_array_without_labels_raises():
+    x, y = _data()
+    W = plan.fit(x, y)
+
+    with pytest.raises(ValueError, match='y_train'):
+        plan.fit(x)
+
+    with pytest.raises(ValueError, match='y_test'):
+        plan.evaluate(x, W=W)
+
+
+def test_chunks_with_auto_normalization_raise():
+    x, y = _data()
+    W = plan.fit(x, y)
+
+    with pytest.raises(ValueError, match='auto_normalization'):
+        plan.fit(iter_chunks(x, y, batch_size=7), auto_normalization=True)
+
+    with pytest.raises(ValueError, match='auto_normalization'):
+        plan.evaluate(iter_chunks(x, y, batch_size=7), W=W, auto_normalization=True)
+
+
+def _scripted_learner(gen, correct_rows):
+    # x is the identity, so column j of a genome decides row j: correct_rows(i) rows are right after generation i
+    rows = 40
+    x = np.eye(rows, dtype=np.float32)
+    y = np.eye(2)[np.arange(rows) % 2]
+
+    def optimizer(weights, activations, i, fitness, **kwargs):
+        W = 1 - y.T.astype(np.float32)
+        W[:, :correct_rows(i)] = y.T[:, :correct_rows(i)]
+        return np.stack([W] * len(weights)), activations
+
+    return plan.learner(x, y, optimizer, fit_start=False, gen=gen, pop_size=42,
+                        early_stop=True, headless=True, rng=np.random.default_rng(0))
+
+
+def test_early_stop_does_not_end_an_improving_run():
+    result = _scripted_learner(gen=4, correct_rows=lambda i: 37 + i)
+
+    assert result['stopped_by'] is None
+    assert result['generations'] == 4
+    assert np.all(np.diff(result['history']['best_acc_per_gen']) > 0)
+
+
+def test_early_stop_ends_a_run_without_improvement():
+    result = _scripted_learner(gen=4, correct_rows=lambda i: 40)
+
+    assert result['stopped_by'] == 'early_stop'
+    assert result['generations'] == 3 # the random first generation, then twice all rows right
+
+
+def test_learner_runs_with_default_arguments():
+    x, y = _data(rows=120)
+
+    W, _, accuracy, activations = plan.learner(x, y, planeat.evolver, gen=2)
+
+    assert np.all(np.isfinite(W))
+    assert 0 <= accuracy <= 1
+    assert isinstance(activations, list)
+
+
+def test_resumed_run_matches_an_uninterrupted_one(tmp_path):
+    x, y = _data()
+
+    def run(gen, **kwargs):
+        return plan.learner(x, y, planeat.evolver, gen=gen, pop_size=42, headless=True,
+                            rng=np.random.default_rng(1), **kwargs)
+
+    uninterrupted = run(4)
+    run(2, checkpoint_path=str(tmp_path))
+    resumed = run(4, resume_from=str(tmp_path))
+
+    assert resumed['generations'] == uninterrupted['generations'] == 4
+    assert np.array_equal(resumed['weights'], uninterrupted['weights'])
+    assert resumed['activations'] == uninterrupted['activations']
+    assert resumed['history']['best_acc_per_gen'] == uninterrupted['history']['best_acc_per_gen']
+
+
+def test_racing_drops_only_the_bad_half_and_scores_survivors_exactly():
+    rng = np.random.default_rng(0)
+    rows = 2000
+    labels = rng.integers(0, 3, rows)
+    x = 0.3 * rng.normal(size=(rows, 6)).astype(np.float32)
+    x[np.arange(rows), labels] += 1
+    y = np.eye(3)[labels]
+
+    good = np.eye(3, 6, dtype=np.float32)
+    noise = 0.05 * rng.normal(size=(10, 3, 6)).astype(np.float32)
+    weight_pop = np.concatenate([good + noise[:5], -good + noise[5:]])
+    act_pop = [['linear'] for _ in range(10)]
+
+    fitness, _, _, models = plan.race_population(x, y, weight_pop, act_pop, rng=np.random.default_rng(1))
+
+    assert [model is None for model in models] == [False] * 5 + [True] * 5
+    assert np.max(fitness[5:]) < np.min(fitness[:5])
+
+    for j in range(5):
+        model = plan.evaluate(x, y, W=weight_pop[j], activation_potentiation=act_pop[j])
+        assert fitness[j] == wals(model[get_acc()], categorical_crossentropy(y, model[get_preds_softmax()]), 0.9, 0.1)
+        assert np.array_equal(models[j][get_preds_softmax()], model[get_preds_softmax()])
+
+
+def test_learner_with_racing():
+    x, y = _data(rows=400)
+
+    result = plan.learner(x, y, planeat.evolver, gen=3, pop_size=42, racing=True, headless=True, rng=np.random.default_rng(0))
+
+    assert result['generations'] == 3
+    assert 0 <= result['accuracy'] <= 1
+
+
+def test_seeded_learner_ignores_the_global_random_state():
+    x, y = _data()
+
+    def run(global_seed):
+        random.seed(global_seed)
+        np.random.seed(global_seed)
+        return plan.learner(x, y, planeat.evolver, gen=3, pop_size=42, batch_size=0.5, headless=True,
+                            rng=np.random.default_rng(5))
+
+    first, second = run(0), run(1)
+
+    assert np.array_equal(first['weights'], second['weights'])
+    assert first['activations'] == second['activations']
+    assert first['history'] == second['history']
+
+
+def test_double_buffered_learner_matches_the_default_one():
+    x, y = _data()
+
+    def run(double_buffer):
+        return plan.learner(x, y, planeat.evolver, gen=3, pop_size=42, headless=True, double_buffer=double_buffer,
+                            rng=np.random.default_rng(6))
+
+    default, buffered = run(False), run(True)
+
+    assert np.array_equal(buffered['weights'], default['weights'])
+    assert buffered['activations'] == default['activations']
+    assert buffered['history'] == default['history']
+
+
+@pytest.mark.parametrize('racing', [False, True])
+def test_approximate_learner_returns_an_exact_model(racing):
+    x, y = _data()
+
+    result = plan.learner(x, y, planeat.evolver, gen=3, pop_size=42, headless=True, approximate_activations=True,
+                          racing=racing, rng=np.random.default_rng(0))
+    model = plan.evaluate(x, y, W=result['weights'], activation_potentiation=result['activations'])
+
+    assert np.array_equal(result['predictions'], model[get_preds_softmax()])
+    assert result['accuracy'] == model[get_acc()]
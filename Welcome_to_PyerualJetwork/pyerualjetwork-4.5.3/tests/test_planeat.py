@@ -0,0 +1,272 @@
+import os
+import random
+import socket
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+import numpy as np
+import pytest
+
+from pyerualjetwork import planeat
+from pyerualjetwork.activation_functions import all_activations, apply_activation
+
+
+def _population(size):
+    weights = np.stack([np.full((2, 3), i, dtype=np.float32) for i in range(size)])
+    activations = [['linear'] for _ in range(size)]
+    return weights, activations
+
+
+def _reversed_order_fitness(size):
+    # Later genomes finish first, so evaluations complete in the reverse of index order
+    def fitness_function(weight, activations):
+        score = float(weight[0, 0])
+        time.sleep(0.02 * max(size - score, 0))
+        return score
+
+    return fitness_function
+
+
+def test_steady_state_fitness_matches_genomes_when_evaluations_finish_out_of_order():
+    size = 6
+    weights, activations = _population(size)
+
+    W, _, fitness = planeat.steady_state_evolver(weights, activations, _reversed_order_fitness(size),
+                                                 evaluations=size, workers=size, bar_status=False)
+
+    assert np.array_equal(fitness, W[:, 0, 0])
+    assert np.array_equal(fitness, np.arange(size, dtype=np.float32)[::-1])
+
+
+def test_steady_state_offspring_keep_their_own_fitness():
+    size = 6
+    weights, activations = _population(size)
+
+    W, _, fitness = planeat.steady_state_evolver(weights, activations, _reversed_order_fitness(size),
+                                                 evaluations=3 * size, workers=size, bar_status=False)
+
+    assert np.array_equal(fitness, W[:, 0, 0].astype(np.float32))
+    assert np.all(np.diff(fitness) <= 0)
+
+
+def test_define_genomes_matches_activating_each_row():
+    weights, activations = planeat.define_genomes(6, 3, 20, rng=np.random.default_rng(11))
+
+    # Same draws as define_genomes: activation choices first, then the raw weights
+    rng = np.random.default_rng(11)
+    choices = [act for act in all_activations() if act not in ('spiral', 'circular')]
+    assert activations == [choices[int(rng.uniform(0, len(choices) - 1))] for _ in range(20)]
+    raw = rng.uniform(-1, 1, (20, 3, 6))
+
+    for genome, activation, expected_genome in zip(raw, activations, weights):
+        for row, expected in zip(genome, expected_genome):
+            row = apply_activation(row.astype(np.float32), [activation])
+            assert np.allclose(row / np.max(np.abs(row)), expected, atol=1e-6)
+
+
+def test_lazy_population_draws_genomes_on_first_read():
+    def population():
+        return planeat.define_genomes(6, 3, 10, rng=np.random.default_rng(12), lazy=True)
+
+    weights, activations = population()
+    forward = [np.copy(weights[i]) for i in range(10)]
+
+    weights, _ = population()
+    backward = [np.copy(weights[i]) for i in reversed(range(10))][::-1]
+
+    for a, b in zip(forward, backward):
+        assert np.array_equal(a, b)
+        assert np.allclose(np.max(np.abs(a), axis=1), 1)
+
+    weights, _ = population()
+    weights[0] = np.zeros((3, 6))
+    assert weights._rngs[0] is None and weights._rngs[1] is not None
+
+    materialized = np.asarray(weights)
+    assert materialized.shape == (10, 3, 6)
+    assert np.array_equal(materialized[0], np.zeros((3, 6)))
+    assert np.array_equal(materialized[1:], np.stack(forward[1:]))
+
+
+def test_evolver_is_reproducible_with_a_seeded_rng_whatever_the_global_state():
+    def run(global_seed):
+        random.seed(global_seed)
+        np.random.seed(global_seed)
+        weights, activations = planeat.define_genomes(5, 3, 12, rng=np.random.default_rng(7))
+        fitness = np.arange(12, dtype=np.float32)
+        for generation in range(3):
+            weights, activations = planeat.evolver(weights, activations, generation, fitness, bar_status=False,
+                                                   rng=np.random.default_rng([7, generation]))
+        return weights, activations
+
+    first, second = run(0), run(1)
+
+    assert np.array_equal(first[0], second[0])
+    assert first[1] == second[1]
+
+
+def test_evolver_into_a_buffer_matches_the_default_path():
+    weights, activations = planeat.define_genomes(5, 3, 12, rng=np.random.default_rng(8))
+    fitness = np.random.default_rng(9).random(12).astype(np.float32)
+
+    expected_W, expected_act = planeat.evolver(np.copy(weights), list(activations), 0, fitness, bar_status=False,
+                                               rng=np.random.default_rng(10))
+
+    out = np.empty_like(weights)
+    W, act = planeat.evolver(weights, list(activations), 0, fitness, bar_status=False, rng=np.random.default_rng(10), out=out)
+
+    assert W is out
+    assert np.array_equal(W, expected_W)
+    assert act == expected_act
+
+
+def test_steady_state_is_reproducible_with_a_seeded_rng():
+    def run(seed):
+        weights, activations = planeat.define_genomes(4, 3, 8, rng=np.random.default_rng(seed))
+        fitness_function = lambda weight, activations: float(np.sum(weight))
+        return planeat.steady_state_evolver(weights, activations, fitness_function, evaluations=40, workers=1,
+                                            bar_status=False, rng=np.random.default_rng(seed))
+
+    first, second, other = run(0), run(0), run(1)
+
+    assert np.array_equal(first[0], second[0])
+    assert first[1] == second[1]
+    assert np.array_equal(first[2], second[2])
+    assert not np.array_equal(first[0], other[0])
+
+
+def test_rollout_counts_the_first_episode_of_every_genome():
+    size, steps = 4, dict(min_steps=5, max_steps=15)
+    weights = np.stack([np.eye(4, 8), -np.eye(4, 8), np.eye(4, 8), np.zeros((4, 8))]).astype(np.float32)
+    activations = [['linear'] for _ in range(size)]
+
+    reference = planeat.ToyVectorEnv(size, **steps)
+    reference.reset(seed=0)
+
+    rewards = planeat.rollout(planeat.ToyVectorEnv(size, **steps), weights, activations, seed=0)
+
+    assert rewards[0] == reference.lengths[0] and rewards[2] == reference.lengths[2] # always the right action
+    assert rewards[1] == 0 # always the wrong action
+    assert 0 <= rewards[3] < reference.lengths[3]
+
+    with pytest.raises(ValueError, match='same length'):
+        planeat.rollout(planeat.ToyVectorEnv(size), weights, activations[:2])
+
+
+def test_rollout_rewards_evolve_a_population():
+    rng = np.random.default_rng(0)
+    env = planeat.ToyVectorEnv(20)
+    weights, activations = planeat.define_genomes(8, 4, 20, rng=rng)
+
+    for generation in range(3):
+        rewards = planeat.rollout(env, weights, activations, seed=generation)
+        assert rewards.shape == (20,) and np.all(rewards <= env.max_steps)
+        weights, activations = planeat.evolver(weights, activations, generation, rewards, bar_status=False, rng=rng)
+
+
+def _first_weight_fitness(weight, activations):
+    time.sleep(0.001)
+    return float(weight[0, 0])
+
+
+def _crashing_fitness(weight, activations):
+    os._exit(3)
+
+
+def _free_address():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return ('localhost', s.getsockname()[1])
+
+
+def _send_to(address, authkey, send):
+    for _ in range(200):
+        try:
+            with Client(address, authkey=authkey) as conn:
+                return send(conn)
+        except ConnectionRefusedError:
+            time.sleep(0.01)
+
+
+def test_island_keeps_listening_after_bad_peers():
+    address = _free_address()
+    migrant = (np.full((1, 2, 3), 100, dtype=np.float32), [['linear']], np.array([100], dtype=np.float32))
+
+    def peers():
+        with pytest.raises(AuthenticationError):
+            _send_to(address, b'wrong key', lambda conn: None)
+        _send_to(address, b'planeat', lambda conn: conn.send_bytes(b'not a pickle'))
+        _send_to(address, b'planeat', lambda conn: conn.send(migrant))
+
+    sender = threading.Thread(target=peers, daemon=True)
+    sender.start()
+
+    W, _, fitness = planeat.run_island(0, [address], _first_weight_fitness, 3, 2, population_size=10, generations=50,
+                                       migration_interval=1, migration_size=1, seed=0)
+
+    sender.join(timeout=5)
+    assert fitness[0] == 100
+
+
+def test_island_sends_its_best_genomes_to_its_neighbour():
+    own, neighbour = _free_address(), _free_address()
+    received = []
+
+    def neighbour_island(listener):
+        with listener.accept() as conn:
+            received.append(conn.recv())
+
+    with Listener(neighbour, authkey=b'planeat') as listener:
+        receiver = threading.Thread(target=neighbour_island, args=(listener,), daemon=True)
+        receiver.start()
+
+        planeat.run_island(0, [own, neighbour], _first_weight_fitness, 3, 2, population_size=10, generations=1,
+                           migration_interval=1, migration_size=3, seed=0)
+
+        receiver.join(timeout=5)
+
+    migrant_W, migrant_act, migrant_fitness = received[0]
+
+    assert len(migrant_W) == len(migrant_act) == len(migrant_fitness) == 3
+    assert np.all(np.diff(migrant_fitness) <= 0)
+    assert np.allclose(migrant_fitness, migrant_W[:, 0, 0])
+
+
+def test_island_neighbours():
+    assert planeat.island_neighbours(3, 4) == [0]
+    assert planeat.island_neighbours(0, 4, 'bidirectional_ring') == [1, 3]
+    assert planeat.island_neighbours(1, 3, 'fully_connected') == [0, 2]
+    assert planeat.island_neighbours(1, 3, {1: [2]}) == [2]
+    assert planeat.island_neighbours(0, 1) == []
+    assert planeat.island_neighbours(2, 4, 'random')[0] in (0, 1, 3)
+
+    with pytest.raises(ValueError, match='topology'):
+        planeat.island_neighbours(0, 2, 'star')
+
+
+def test_island_evolver_returns_every_island():
+    W, activations, fitness = planeat.island_evolver(_first_weight_fitness, 3, 2, population_size=6, generations=4,
+                                                     islands=2, migration_interval=2, seed=0)
+
+    assert W.shape == (12, 2, 3)
+    assert len(activations) == 12
+    assert np.all(np.diff(fitness) <= 0)
+
+
+def test_island_evolver_reports_a_killed_island():
+    with pytest.raises(RuntimeError, match='without a result'):
+        planeat.island_evolver(_crashing_fitness, 3, 2, population_size=4, generations=1, islands=2)
+
+
+def test_evaluate_runs_genomes_from_evolver():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(5, 4)).astype(np.float32)
+    weights, activations = planeat.define_genomes(4, 3, 10, rng=rng)
+
+    weights, activations = planeat.evolver(weights, activations, 0, np.arange(10, dtype=np.float32), bar_status=False, rng=rng)
+
+    for W, genome_activations in zip(weights, activations):
+        expected = apply_activation(x, genome_activations) @ W.T
+        assert np.allclose(planeat.evaluate(x, W, genome_activations), expected)
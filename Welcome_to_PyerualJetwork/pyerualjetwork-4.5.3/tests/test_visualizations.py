@@ -0,0 +1,62 @@
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use('Agg')
+
+from pyerualjetwork import visualizations
+from pyerualjetwork.activation_functions import apply_activation
+
+
+def _model(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(30, 4)).astype(np.float32), rng.uniform(-1, 1, size=(3, 4)).astype(np.float32)
+
+
+@pytest.mark.parametrize('activation_potentiation', [['tanh'], ['sglu', 'relu']])
+def test_decision_surface_matches_one_prediction_per_point(activation_potentiation):
+    x, W = _model()
+
+    xx, yy, Z = visualizations.decision_surface(x, W, activation_potentiation, h=0.25)
+
+    for i, j in zip(*np.unravel_index(np.arange(0, xx.size, 7), xx.shape)):
+        point = np.zeros(4, dtype=np.float32)
+        point[[0, 1]] = xx[i, j], yy[i, j]
+        assert Z[i, j] == np.argmax(apply_activation(point, activation_potentiation) @ W.T)
+
+
+def test_decision_surface_reuses_grids_and_coarsens_to_the_time_budget():
+    x, W = _model(1)
+
+    xx, _, Z = visualizations.decision_surface(x, W, ['linear'], h=0.05)
+    xx_again, _, _ = visualizations.decision_surface(x, W, ['linear'], h=0.05)
+    assert xx_again is xx
+
+    cost = next(value for key, value in visualizations._decision_point_cost.items() if key[:3] == (4, 3, ('linear',)))
+    xx_coarse, _, Z_coarse = visualizations.decision_surface(x, W, ['linear'], h=0.05, time_budget=cost * Z.size / 10)
+    assert Z_coarse.size <= Z.size / 10
+    assert xx_coarse[0, 1] - xx_coarse[0, 0] > 0.05
+
+
+def test_neural_web_frames_recolor_the_largest_edges():
+    import matplotlib.pyplot as plt
+
+    rng = np.random.default_rng(2)
+    _, ax = plt.subplots()
+    web = visualizations.init_neural_web(np.zeros((3, 5)), ax, max_edges=6)
+
+    W = rng.uniform(-1, 1, size=(3, 5))
+    W[0, 0] = 0
+    nodes, edges, labels = visualizations.update_neural_web(W, ax, web)
+
+    largest = np.sort(np.abs(W.ravel()))[-6:]
+    assert np.array_equal(np.sort(np.abs(edges.get_array())), largest)
+
+    for segment, weight in zip(edges.get_segments(), edges.get_array()):
+        row, col = np.argwhere(W == weight)[0]
+        assert np.allclose(segment, [web['pos'][f'Output{row}'], web['pos'][f'Input{col}']])
+
+    next_nodes, _, next_labels = visualizations.update_neural_web(-W, ax, web)
+    assert next_nodes is nodes and next_labels is labels
+    assert len(ax.collections) == 3 # one node collection and one edge collection per frame
+    plt.close('all')